@@ -16,6 +16,11 @@ from backend.geocode import router as geocode_router
 from backend.routes.astro import router as astro_router
 from backend.routes.ai_routes import router as ai_router
 from backend.routes.learning import router as learning_router
+from backend.routes.panchang import router as panchang_router
+from backend.routes.transits import router as transits_router
+from backend.routes.horoscope import router as horoscope_router
+from backend.routes.sky import router as sky_router
+from backend.routes.dasha import router as dasha_router
 
 def create_app() -> FastAPI:
     """
@@ -68,6 +73,11 @@ def create_app() -> FastAPI:
     app.include_router(astro_router)
     app.include_router(ai_router)
     app.include_router(learning_router)
+    app.include_router(panchang_router)
+    app.include_router(transits_router)
+    app.include_router(horoscope_router)
+    app.include_router(sky_router)
+    app.include_router(dasha_router)
     
     from backend.routes.family import router as family_router
     app.include_router(family_router)
@@ -78,6 +88,25 @@ def create_app() -> FastAPI:
     @app.on_event("startup")
     def create_tables():
         Base.metadata.create_all(bind=engine)
+
+    @app.on_event("startup")
+    def warm_daily_tables():
+        # Today's and tomorrow's shared Tarabala/Chandrabala tables
+        from datetime import date
+        from backend.tarabala import precompute_daily_tables
+        precompute_daily_tables(date.today(), 2, "Asia/Kolkata")
+
+    @app.on_event("startup")
+    def schedule_horoscopes():
+        # Builds the 12-sign horoscopes now and after every local midnight
+        from backend.horoscope import start_scheduler
+        start_scheduler()
+
+    @app.on_event("startup")
+    def refresh_sky():
+        # Shared "now" snapshot, rebuilt every minute
+        from backend.sky import start_sky_refresher
+        start_sky_refresher()
         
     return app
 
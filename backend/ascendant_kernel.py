@@ -0,0 +1,106 @@
+"""
+Ascendant Kernel Module
+Vectorized (NumPy) ascendant and MC for arrays of (jd, lat, lon):
+- Sidereal time, true obliquity and ayanamsha are taken from Swiss
+  Ephemeris at half-day nodes and interpolated linearly (< 0.01" error)
+- Ascendant and MC then follow in closed form from ARMC, obliquity and
+  latitude, with the same polar-circle convention as swe.houses
+
+One scalar swe.houses call costs a few microseconds; the kernel evaluates
+large grids (relocation maps, time x latitude tables) in one pass.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+import swisseph as swe
+
+from backend.calculations import get_ayanamsha
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+NODE_EPOCH = 2451545.0  # J2000
+NODE_DAYS = 0.5
+
+# Mean rotation of the sidereal time in degrees per UT day. What remains
+# (precession terms, equation of the equinoxes) varies slowly and is
+# interpolated between nodes.
+SIDEREAL_RATE = 360.0 * 1.00273781191135448
+
+
+# ---------------------------
+# TIME TERMS
+# ---------------------------
+@lru_cache(maxsize=65536)
+def _node_terms(node: int) -> Tuple[float, float, float]:
+    """(sidereal time residual, true obliquity, Lahiri ayanamsha) at a node."""
+    t = NODE_EPOCH + node * NODE_DAYS
+    st = swe.sidtime(t) * 15.0
+    residual = (st - SIDEREAL_RATE * (node * NODE_DAYS)) % 360.0
+    eps = swe.calc_ut(t, swe.ECL_NUT)[0][0]
+    return residual, eps, get_ayanamsha(t)
+
+
+def time_terms(jd) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Greenwich sidereal time (deg), true obliquity (deg) and Lahiri ayanamsha
+    (deg) for an array of UT Julian Days.
+    """
+    jd = np.asarray(jd, dtype=float)
+    x = (jd - NODE_EPOCH) / NODE_DAYS
+    k = np.floor(x).astype(np.int64)
+    frac = x - k
+
+    nodes, inverse = np.unique(np.concatenate([k.ravel(), k.ravel() + 1]), return_inverse=True)
+    table = np.array([_node_terms(int(n)) for n in nodes]).reshape(-1, 3)
+    lo = table[inverse[:k.size]].reshape(k.shape + (3,))
+    hi = table[inverse[k.size:]].reshape(k.shape + (3,))
+
+    d_res = (hi[..., 0] - lo[..., 0] + 180.0) % 360.0 - 180.0
+    gst = (lo[..., 0] + frac * d_res + SIDEREAL_RATE * (jd - NODE_EPOCH)) % 360.0
+    eps = lo[..., 1] + frac * (hi[..., 1] - lo[..., 1])
+    ay = lo[..., 2] + frac * (hi[..., 2] - lo[..., 2])
+    return gst, eps, ay
+
+
+# ---------------------------
+# MAIN KERNEL
+# ---------------------------
+def ascendant_mc_from_armc(armc, eps, lat) -> Tuple[np.ndarray, np.ndarray]:
+    """Tropical ascendant and MC (deg) from ARMC, obliquity and latitude (deg)."""
+    th = np.radians(armc)
+    e = np.radians(eps)
+    sin_th, cos_th = np.sin(th), np.cos(th)
+    sin_e, cos_e = np.sin(e), np.cos(e)
+
+    mc = np.degrees(np.arctan2(sin_th, cos_th * cos_e)) % 360.0
+    asc = np.degrees(np.arctan2(cos_th, -(sin_th * cos_e + np.tan(np.radians(lat)) * sin_e))) % 360.0
+
+    # Inside the polar circles swe.houses keeps the ascendant east of the MC
+    polar = np.abs(lat) >= 90.0 - eps
+    west = (asc - mc + 180.0) % 360.0 - 180.0 < 0.0
+    asc = np.where(polar & west, (asc + 180.0) % 360.0, asc)
+    return asc, mc
+
+
+def ascendant_mc(jd, lat, lon, sidereal: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ascendant and MC longitudes (deg) for broadcastable arrays of UT Julian
+    Day, latitude and longitude (east positive). Sidereal (Lahiri) by
+    default, matching lon_sidereal_manual / calculate_houses.
+    """
+    jd = np.asarray(jd, dtype=float)
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    if np.any(np.abs(lat) > 90.0):
+        raise ValueError("Latitude must be between -90 and 90")
+
+    # Time terms on the (usually much smaller) jd array, then broadcast
+    gst, eps, ay = time_terms(jd)
+    asc, mc = ascendant_mc_from_armc((gst + lon) % 360.0, eps, lat)
+    if sidereal:
+        asc = (asc - ay) % 360.0
+        mc = (mc - ay) % 360.0
+    return asc, mc
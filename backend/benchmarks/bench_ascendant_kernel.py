@@ -0,0 +1,60 @@
+# bench_ascendant_kernel.py - Vectorized ascendant/MC vs scalar swe.houses
+# Run from the repo root: python -m backend.benchmarks.bench_ascendant_kernel
+import time
+
+import numpy as np
+import swisseph as swe
+
+from backend.ascendant_kernel import ascendant_mc
+from backend.config import EPHE_PATH
+
+VALIDATION_POINTS = 50000
+GRID = 1000  # GRID x GRID = one million points
+
+swe.set_ephe_path(EPHE_PATH)
+rng = np.random.default_rng(42)
+
+
+def arcsec(a, b):
+    return np.abs((a - b + 180.0) % 360.0 - 180.0) * 3600.0
+
+
+# --- Validation: random (jd, lat, lon) over 1900-2100, all latitudes ---
+jd = rng.uniform(2415020.5, 2488069.5, VALIDATION_POINTS)
+lat = rng.uniform(-89.9, 89.9, VALIDATION_POINTS)
+lon = rng.uniform(-180.0, 180.0, VALIDATION_POINTS)
+
+t0 = time.perf_counter()
+ref = np.array([swe.houses(j, la, lo, b'E')[1][:2] for j, la, lo in zip(jd, lat, lon)])
+scalar_rate = VALIDATION_POINTS / (time.perf_counter() - t0)
+asc, mc = ascendant_mc(jd, lat, lon, sidereal=False)
+
+print(f"=== Validation vs swe.houses: {VALIDATION_POINTS} points, 1900-2100, |lat| < 90 ===")
+for name, mask in [("|lat| < 66", np.abs(lat) < 66.0), ("all", np.ones_like(lat, bool))]:
+    print(f" {name:10s} asc max err {arcsec(asc[mask], ref[mask, 0]).max():.4f}\"  "
+          f"mc max err {arcsec(mc[mask], ref[mask, 1]).max():.4f}\"")
+
+# --- Benchmarks: one million points ---
+print(f"\n=== Benchmarks ({GRID} x {GRID} = {GRID * GRID} points) ===")
+print(f" scalar swe.houses        {scalar_rate / 1e6:8.3f} M points/s")
+
+jd0 = swe.julday(2024, 1, 1, 0.0)
+lats = np.linspace(-60.0, 60.0, GRID)
+lons = np.linspace(-180.0, 180.0, GRID)
+
+t0 = time.perf_counter()
+asc, mc = ascendant_mc(jd0, lats[:, None], lons[None, :])
+elapsed = time.perf_counter() - t0
+print(f" lat x lon map, one jd    {elapsed:8.3f}s  ({GRID * GRID / elapsed / 1e6:.1f} M points/s)")
+
+times = jd0 + np.arange(GRID) / 1440.0  # one day at 1.44 minute steps
+t0 = time.perf_counter()
+asc, mc = ascendant_mc(times[:, None], lats[None, :], 78.48)
+elapsed = time.perf_counter() - t0
+print(f" time x lat table         {elapsed:8.3f}s  ({GRID * GRID / elapsed / 1e6:.1f} M points/s)")
+
+times = jd0 + rng.uniform(0.0, 100 * 365.25, GRID * GRID)
+t0 = time.perf_counter()
+asc, mc = ascendant_mc(times, 17.38, 78.48)
+elapsed = time.perf_counter() - t0
+print(f" 1M random times (100y)   {elapsed:8.3f}s  ({GRID * GRID / elapsed / 1e6:.1f} M points/s)")
@@ -0,0 +1,45 @@
+# bench_dasha.py - Lazy dasha engine, per system, vs the eager Vimshottari tree
+# Run from the repo root: python -m backend.benchmarks.bench_dasha
+import time
+
+import numpy as np
+import swisseph as swe
+
+from backend.calculations import compute_chart, compute_vimshottari_timeline
+from backend.config import EPHE_PATH
+from backend.dasha import DAYS_IN_YEAR, DASHA_SYSTEMS, chart_dasha_plan, period_at, periods_between
+
+POINT_QUERIES = 100000
+PLANS = 10000
+
+swe.set_ephe_path(EPHE_PATH)
+chart = compute_chart(1990, 5, 17, 10, 30, 0, "Asia/Kolkata", 17.38, 78.48)
+jd_birth = chart["jd_ut"]
+moon = chart["planets"]["Moon"]["lon_sidereal_manual"]
+rng = np.random.default_rng(42)
+query_jds = (jd_birth + rng.uniform(0.0, 100.0, POINT_QUERIES) * DAYS_IN_YEAR).tolist()
+
+print("=== Eager Vimshottari timeline (100 years, 3 levels) ===")
+t0 = time.perf_counter()
+for _ in range(20):
+    compute_vimshottari_timeline(jd_birth, moon)
+print(f" compute_vimshottari_timeline  {(time.perf_counter() - t0) / 20 * 1e3:8.3f} ms")
+
+for system in DASHA_SYSTEMS:
+    print(f"\n=== {system} ===")
+    t0 = time.perf_counter()
+    for _ in range(PLANS):
+        plan = chart_dasha_plan(system, chart)
+    print(f" plan                          {(time.perf_counter() - t0) / PLANS * 1e6:8.2f} us")
+
+    for depth in (3, 5):
+        t0 = time.perf_counter()
+        for jd in query_jds:
+            period_at(plan, jd, depth)
+        print(f" point query, depth {depth}         {(time.perf_counter() - t0) / POINT_QUERIES * 1e6:8.2f} us")
+
+    for depth, years in ((3, 100), (5, 1)):
+        t0 = time.perf_counter()
+        count = sum(1 for _ in periods_between(plan, jd_birth, jd_birth + years * DAYS_IN_YEAR, depth))
+        print(f" range {years:3d} years, depth {depth}   {(time.perf_counter() - t0) * 1e3:8.3f} ms  "
+              f"periods={count}")
@@ -0,0 +1,29 @@
+# bench_ingress.py - Ingress search over 100 years for every planet
+# Run from the repo root: python -m backend.benchmarks.bench_ingress
+import time
+
+import swisseph as swe
+
+from backend.config import EPHE_PATH
+from backend.ingress import PLANET_MOTION, find_ingresses
+
+YEARS = 100
+
+swe.set_ephe_path(EPHE_PATH)
+jd_start = swe.julday(1950, 1, 1, 0.0)
+jd_end = jd_start + YEARS * 365.2425
+
+print(f"=== Ingress search: {YEARS} years, sign + nakshatra + pada ===")
+total_events = 0
+t_all = time.perf_counter()
+for planet in PLANET_MOTION:
+    t0 = time.perf_counter()
+    events = find_ingresses(planet, jd_start, jd_end)
+    elapsed = time.perf_counter() - t0
+    signs = sum("sign" in e["kinds"] for e in events)
+    naks = sum("nakshatra" in e["kinds"] for e in events)
+    retro = sum(e["retrograde"] for e in events)
+    total_events += len(events)
+    print(f" {planet:8s} {elapsed:7.3f}s  events={len(events):7d}  sign={signs:6d}  "
+          f"nakshatra={naks:6d}  retrograde={retro:6d}")
+print(f" total    {time.perf_counter() - t_all:7.3f}s  events={total_events}")
@@ -0,0 +1,46 @@
+# bench_match.py - /match latency: full charts vs the Moon-only fast path
+# Run from the repo root: python -m backend.benchmarks.bench_match
+import random
+import time
+
+import swisseph as swe
+from fastapi.testclient import TestClient
+
+from backend.app import app
+from backend.calculations import compute_match_for_birth_data
+from backend.config import EPHE_PATH
+from backend.koota import birth_moon, koota_match
+
+PAIRS = 200
+
+swe.set_ephe_path(EPHE_PATH)
+random.seed(42)
+
+
+def random_birth():
+    return {"year": random.randint(1960, 2005), "month": random.randint(1, 12),
+            "day": random.randint(1, 28), "hour": random.randint(0, 23),
+            "minute": random.randint(0, 59), "second": 0, "tz": "Asia/Kolkata",
+            "lat": random.uniform(8.0, 32.0), "lon": random.uniform(68.0, 92.0)}
+
+
+pairs = [(random_birth(), random_birth()) for _ in range(PAIRS)]
+
+print(f"=== Ashta Koota for {PAIRS} pairs ===")
+t0 = time.perf_counter()
+full = [compute_match_for_birth_data(b, g)["ashta_koota"] for b, g in pairs]
+t_full = (time.perf_counter() - t0) / PAIRS
+t0 = time.perf_counter()
+fast = [koota_match(birth_moon(**b)["pada_index"], birth_moon(**g)["pada_index"]) for b, g in pairs]
+t_fast = (time.perf_counter() - t0) / PAIRS
+print(f" compute_match_for_birth_data  {t_full * 1e3:8.3f} ms/pair")
+print(f" birth_moon + koota_match      {t_fast * 1e3:8.3f} ms/pair  ({t_full / t_fast:.0f}x)")
+print(f" identical results             {sum(a == b for a, b in zip(full, fast))}/{PAIRS}")
+
+print(f"\n=== POST /match ({PAIRS} requests) ===")
+client = TestClient(app)
+for full_charts in (True, False):
+    t0 = time.perf_counter()
+    for b, g in pairs:
+        client.post("/match", json={"boy": b, "girl": g, "full_charts": full_charts})
+    print(f" full_charts={str(full_charts):5s}             {(time.perf_counter() - t0) / PAIRS * 1e3:8.3f} ms/request")
@@ -0,0 +1,60 @@
+# bench_ranking.py - Top-K Ashta Koota ranking over 100k candidates
+# Run from the repo root: python -m backend.benchmarks.bench_ranking
+import time
+
+import numpy as np
+
+from backend.koota import BHAKOOT_DOSHA, NADI_DOSHA, koota_match
+from backend.ranking import build_pool, rank_candidates
+
+CANDIDATES = 100000
+RUNS = 200
+
+rng = np.random.default_rng(42)
+padas = rng.integers(0, 108, CANDIDATES)
+ids = [f"profile-{i}" for i in range(CANDIDATES)]
+people = rng.integers(0, 108, RUNS).tolist()
+
+t0 = time.perf_counter()
+pool = build_pool(ids, padas)
+print(f"=== Pool of {CANDIDATES} candidates ===")
+print(f" build_pool                          {(time.perf_counter() - t0) * 1e3:8.3f} ms")
+
+
+def naive(pada, k, offset, min_score, no_nadi, no_bhakoot):
+    """Score every candidate through koota_match and sort."""
+    rows = []
+    for i, other in enumerate(padas.tolist()):
+        total = koota_match(pada, other)["total"]
+        if total < min_score or (no_nadi and NADI_DOSHA[pada, other]) \
+                or (no_bhakoot and BHAKOOT_DOSHA[pada, other]):
+            continue
+        rows.append((-total, i))
+    rows.sort()
+    return [ids[i] for _, i in rows[offset:offset + k]]
+
+
+cases = [
+    ("top 20", dict(k=20)),
+    ("top 20, page 50", dict(k=20, offset=1000)),
+    ("top 100, min 24, no doshas", dict(k=100, min_score=24, no_nadi_dosha=True, no_bhakoot_dosha=True)),
+    ("top 500, page 100", dict(k=500, offset=50000)),
+]
+print(f"\n=== rank_candidates, {RUNS} people (boy) ===")
+for name, kw in cases:
+    t0 = time.perf_counter()
+    for p in people:
+        out = rank_candidates(pool, p, "boy", **kw)
+    elapsed = (time.perf_counter() - t0) / RUNS
+    print(f" {name:34s} {elapsed * 1e3:8.3f} ms  matches={out['matches']}")
+
+print("\n=== Check against scoring every candidate ===")
+t0 = time.perf_counter()
+for p in people[:5]:
+    for _, kw in cases:
+        args = (kw.get("k", 20), kw.get("offset", 0), kw.get("min_score", 0.0),
+                kw.get("no_nadi_dosha", False), kw.get("no_bhakoot_dosha", False))
+        got = [r["id"] for r in rank_candidates(pool, p, "boy", **kw)["results"]]
+        assert got == naive(p, *args), (p, kw)
+print(f" naive full scan + sort              {(time.perf_counter() - t0) / (5 * len(cases)) * 1e3:8.3f} ms  "
+      f"(identical pages)")
@@ -0,0 +1,105 @@
+"""
+Bhava Module
+Cusp-based house systems alongside the default whole-sign houses:
+- placidus: Placidus cusps (Lahiri)
+- porphyry: Porphyry (quadrant trisection) cusps
+- sripati: Sripati bhavas (Porphyry cusps become bhava madhyas)
+- equal: 30 deg houses starting at the ascendant
+- kp: Placidus cusps with the Krishnamurti ayanamsha (KP bhavas)
+- bhava_chalit: 30 deg bhavas with the ascendant as madhya of the 1st
+
+All systems are derived from one ARMC/obliquity pair per chart via
+swe.houses_armc, and cusps are cached per (ARMC, latitude, obliquity,
+system). Nothing here runs unless a caller asks for house systems.
+"""
+
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
+
+import swisseph as swe
+
+from backend.calculations import get_ayanamsha, normalize_deg
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+# system -> (Swiss Ephemeris house code, ayanamsha mode, cusp shift in deg)
+HOUSE_SYSTEMS = {
+    "placidus": (b'P', "lahiri", 0.0),
+    "porphyry": (b'O', "lahiri", 0.0),
+    "sripati": (b'S', "lahiri", 0.0),
+    "equal": (b'E', "lahiri", 0.0),
+    "kp": (b'P', "krishnamurti", 0.0),
+    "bhava_chalit": (b'E', "lahiri", -15.0),
+}
+
+
+# ---------------------------
+# CACHED FRAME AND CUSPS
+# ---------------------------
+@lru_cache(maxsize=4096)
+def house_frame(jd_ut: float, lon: float) -> Tuple[float, float]:
+    """(ARMC, true obliquity) in degrees for a moment and geographic longitude."""
+    armc = normalize_deg(swe.sidtime(jd_ut) * 15.0 + lon)
+    eps = swe.calc_ut(jd_ut, swe.ECL_NUT)[0][0]
+    return armc, eps
+
+
+@lru_cache(maxsize=4096)
+def tropical_cusps(armc: float, lat: float, eps: float, hsys: bytes) -> Tuple[float, ...]:
+    """Twelve tropical house cusps (start of each house) from ARMC."""
+    cusps, _ = swe.houses_armc(armc, lat, eps, hsys)
+    return tuple(cusps[:12])
+
+
+def house_of(lon: float, cusps: List[float]) -> int:
+    """House number (1-12) whose [cusp, next cusp) arc contains lon."""
+    for i in range(12):
+        start = cusps[i]
+        span = (cusps[(i + 1) % 12] - start) % 360.0
+        if (lon - start) % 360.0 < span:
+            return i + 1
+    return 12
+
+
+# ---------------------------
+# MAIN FUNCTION
+# ---------------------------
+def compute_bhavas(jd_ut: float, lat: float, lon: float,
+                   res_planets: Dict[str, Any], systems: List[str]) -> Dict[str, Any]:
+    """
+    Sidereal cusps and planet placements for each requested house system.
+
+    Args:
+        res_planets: compute_chart "planets" (their lon_tropical is used)
+        systems: Names from HOUSE_SYSTEMS
+
+    Returns:
+        {system: {"ayanamsha", "cusps", "planets": {name: house}}}, or
+        {system: {"error"}} where the system is undefined (Placidus inside
+        the polar circles).
+    """
+    unknown = [s for s in systems if s not in HOUSE_SYSTEMS]
+    if unknown:
+        raise ValueError(f"Unknown house systems: {unknown}. Supported: {list(HOUSE_SYSTEMS)}")
+
+    armc, eps = house_frame(jd_ut, lon)
+    result = {}
+    for system in systems:
+        hsys, mode, shift = HOUSE_SYSTEMS[system]
+        try:
+            trop = tropical_cusps(armc, lat, eps, hsys)
+        except swe.Error as e:
+            result[system] = {"error": str(e)}
+            continue
+        ay = get_ayanamsha(jd_ut, mode)
+        cusps = [normalize_deg(c + shift - ay) for c in trop]
+        result[system] = {
+            "ayanamsha": mode,
+            "cusps": cusps,
+            "planets": {
+                name: house_of(normalize_deg(pdata["lon_tropical"] - ay), cusps)
+                for name, pdata in res_planets.items() if "lon_tropical" in pdata
+            },
+        }
+    return result
@@ -8,7 +8,7 @@ Handles all chart and dasha calculations including:
 - D10 (Dashamsha) chart calculations
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import swisseph as swe
 import math
 from datetime import datetime
@@ -71,6 +71,29 @@ PLANET_KEYS = {
     "Saturn": swe.SATURN, "Rahu": swe.TRUE_NODE
 }
 
+DEFAULT_PLANETS = [
+    "Sun", "Moon", "Mercury", "Venus", "Mars",
+    "Jupiter", "Saturn", "Rahu", "Ketu"
+]
+
+# calc_ut flags for tropical longitude + speed in one call
+TROPICAL_SPEED_FLAGS = getattr(swe, "SEFLG_SPEED", 256)
+
+# Mean precession rate (deg/day); converts tropical speeds to sidereal ones
+AYANAMSHA_RATE = 50.29 / 3600.0 / 365.25
+
+# Supported ayanamsha modes. pyswisseph keeps the sidereal mode per thread,
+# so get_ayanamsha selects the mode on every call.
+AYANAMSHA_MODES = {
+    "lahiri": swe.SIDM_LAHIRI,
+    "raman": swe.SIDM_RAMAN,
+    "krishnamurti": swe.SIDM_KRISHNAMURTI,
+    "true_citra": swe.SIDM_TRUE_CITRA,
+    "yukteshwar": swe.SIDM_YUKTESHWAR,
+    "fagan_bradley": swe.SIDM_FAGAN_BRADLEY,
+    "deluce": swe.SIDM_DELUCE,
+}
+
 COMBUST_LIMITS = {
     "Mercury": 13.0,  # 13 degrees
     "Venus": 9.0,     # 9 degrees
@@ -328,6 +351,33 @@ def compute_sunrise_sunset(jd_ut: float, lat: float, lon: float, tz_name: str) -
         return {"sunrise": "N/A", "sunset": "N/A"}
 
 
+def local_midnight_jd(year: int, month: int, day: int, tz_name: str) -> float:
+    """Julian Day (UT) of local midnight at the start of the given civil date."""
+    jd, _ = to_utc_julian_day(year, month, day, 0, 0, 0, tz_name)
+    return jd
+
+
+def find_sunrise_sunset_jd(jd_start: float, lat: float, lon: float) -> Dict[str, float]:
+    """
+    Find the first sunrise and sunset after jd_start.
+    Same rise_trans search as compute_sunrise_sunset, but returns raw JDs only.
+
+    Raises ValueError when the Sun does not rise or set (polar night or
+    midnight sun); rise_trans then reports -2 with a JD of 0.
+    """
+    flags = swe.FLG_SWIEPH
+    res_rise = swe.rise_trans(jd_start, swe.SUN, swe.CALC_RISE, (lon, lat, 0), 0, 0, flags)
+    res_set = swe.rise_trans(jd_start, swe.SUN, swe.CALC_SET, (lon, lat, 0), 0, 0, flags)
+    if res_rise[0] < 0 or res_set[0] < 0:
+        raise ValueError(f"No sunrise/sunset at latitude {lat} on this day (polar night or midnight sun)")
+    return {"sunrise_jd": res_rise[1][0], "sunset_jd": res_set[1][0]}
+
+
+def jd_to_local_datetime(jd: float, tz_name: str) -> datetime:
+    """Convert a UT Julian Day to a timezone-aware local datetime."""
+    return jd_to_datetime(jd).replace(tzinfo=pytz.utc).astimezone(pytz.timezone(tz_name))
+
+
 # ---------------------------
 # VIMSHOTTARI DASHA
 # ---------------------------
@@ -869,6 +919,8 @@ def calculate_planets(jd_ut: float, ay: float, planets: List[str], topo_lon: flo
     FLG_SIDEREAL = getattr(swe, "SEFLG_SIDEREAL", 65536)
     flags_tropical = FLG_SPEED
     flags_sidereal = FLG_SPEED | FLG_SIDEREAL
+    # The sidereal-flag positions use the calling thread's mode
+    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
     
     res_planets: Dict[str, Any] = {}
     
@@ -1009,6 +1061,34 @@ def calculate_planets(jd_ut: float, ay: float, planets: List[str], topo_lon: flo
     return res_planets
 
 
+def get_ayanamsha(jd_ut: float, mode: str = "lahiri") -> float:
+    """
+    Ayanamsha (deg) of a mode from AYANAMSHA_MODES. The mode is selected
+    explicitly on every call, Lahiri included, so the result never depends
+    on the sidereal mode the calling thread happened to have.
+    """
+    if mode not in AYANAMSHA_MODES:
+        raise ValueError(f"Unknown ayanamsha: {mode}. Supported: {list(AYANAMSHA_MODES)}")
+    swe.set_sid_mode(AYANAMSHA_MODES[mode], 0, 0)
+    return swe.get_ayanamsa_ut(jd_ut)
+
+
+def sidereal_position(jd_ut: float, planet: str) -> tuple:
+    """
+    Return (sidereal longitude, longitude speed) of a single planet.
+    Lightweight single-call variant of calculate_planets for search engines,
+    using the same convention as lon_sidereal_manual (tropical - ayanamsha) so
+    signs, nakshatras and tithis agree with compute_chart (Lahiri).
+    Ketu is derived from the true node (Rahu + 180).
+    """
+    ay = get_ayanamsha(jd_ut)
+    if planet == "Ketu":
+        out = swe.calc_ut(jd_ut, PLANET_KEYS["Rahu"], TROPICAL_SPEED_FLAGS)
+        return normalize_deg(out[0][0] + 180.0 - ay), float(out[0][3]) - AYANAMSHA_RATE
+    out = swe.calc_ut(jd_ut, PLANET_KEYS[planet], TROPICAL_SPEED_FLAGS)
+    return normalize_deg(out[0][0] - ay), float(out[0][3]) - AYANAMSHA_RATE
+
+
 def calculate_houses(jd_ut: float, lat: float, lon: float, ay: float) -> Dict[str, Any]:
     """Calculate houses and ascendant."""
     cusps, ascmc = swe.houses(jd_ut, lat, lon, b'P')
@@ -1041,66 +1121,42 @@ def calculate_houses(jd_ut: float, lat: float, lon: float, ay: float) -> Dict[st
 
 
 # ---------------------------
-# MAIN CHART CALCULATION FUNCTION
+# CHART SECTIONS
 # ---------------------------
-def compute_chart(year: int, month: int, day: int, hour: int, minute: int, second: int,
-                  tz: str, lat: float, lon: float, planets: Optional[List[str]] = None,
-                  topo_alt: float = 0.0) -> Dict[str, Any]:
-    """
-    Compute complete astrological chart including planets, houses, dasha, etc.
-    
-    Returns:
-        Dictionary containing all chart data including planets, houses, d9, dasha, etc.
-    """
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
-    
-    # Convert to UTC and get Julian Day
-    jd_ut, dt_utc = to_utc_julian_day(year, month, day, hour, minute, second, tz)
-    
-    # Get Ayanamsha
-    swe.set_topo(lon, lat, float(topo_alt))
-    ay = swe.get_ayanamsa_ut(jd_ut)
-    
-    # Default planets list
-    planets = planets or [
-        "Sun", "Moon", "Mercury", "Venus", "Mars",
-        "Jupiter", "Saturn", "Rahu", "Ketu"
-    ]
-    
-    # Calculate planets
-    res_planets = calculate_planets(jd_ut, ay, planets, lon, lat, topo_alt)
-    
-    # Calculate houses and ascendant
-    houses_data = calculate_houses(jd_ut, lat, lon, ay)
-    asc_sidereal = houses_data["asc_sidereal"]
-    asc_sign = houses_data["ascendant"]["sign"]
-    
-    # Calculate Nakshatra, Dasha, Karana
+# compute_chart is assembled from these pieces so that callers that only
+# change part of the input (see backend/incremental.py) can rebuild just the
+# sections that depend on it.
+def compute_panchang_sections(res_planets: Dict[str, Any]) -> Dict[str, Any]:
+    """Moon nakshatra, karana, tithi, nithya yoga and Moon sign from D1 planets."""
     moon_sid = res_planets.get("Moon", {}).get("lon_sidereal_manual")
     sun_sid = res_planets.get("Sun", {}).get("lon_sidereal_manual")
-    
+
     nakshatra = compute_nakshatra_pada(moon_sid) if moon_sid else None
-    dasha = compute_vimshottari_timeline(jd_ut, moon_sid) if moon_sid else None
-    
-    # Calculate Karana, Tithi, Nithya Yoga
+
     karana_data = None
     tithi_data = None
     yoga_data = None
-    
+
     if moon_sid is not None and sun_sid is not None:
         karana_data = compute_karana(moon_sid, sun_sid)
         tithi_data = compute_tithi(moon_sid, sun_sid)
         yoga_data = compute_nithya_yoga(moon_sid, sun_sid)
-        
-    # Calculate Sunrise/Sunset
-    sun_data = compute_sunrise_sunset(jd_ut, lat, lon, tz)
 
-    # Get Moon sign
     moon_sign = None
     if moon_sid is not None:
         moon_sign, moon_deg = deg_to_sign_and_degree(moon_sid)
 
-    # D9 chart calculation
+    return {
+        "nakshatra_of_moon": nakshatra,
+        "karana": karana_data,
+        "tithi": tithi_data,
+        "nithya_yoga": yoga_data,
+        "moon_sign": moon_sign,
+    }
+
+
+def compute_varga_sections(asc_sidereal: float, res_planets: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """D9 and D10 charts in the compute_chart API format."""
     d1_planets_list = []
     for name, pdata in res_planets.items():
         lon_sid_used = pdata.get("lon_sidereal_flag") or pdata.get("lon_sidereal_manual")
@@ -1112,10 +1168,10 @@ def compute_chart(year: int, month: int, day: int, hour: int, minute: int, secon
                 "retrograde": pdata.get("retrograde", False),
                 "combust": pdata.get("combust", False)
             })
-    
+
     # Build complete D9 chart structure
     d9_chart = build_chart_d9(asc_sidereal, d1_planets_list)
-    
+
     # Transform to current API format for backward compatibility
     d9 = {}
     for p in d9_chart["planets"]:
@@ -1129,15 +1185,15 @@ def compute_chart(year: int, month: int, day: int, hour: int, minute: int, secon
             "debilitated": p.get("debilitated", False),
             "exalted": p.get("exalted", False)
         }
-    
+
     # Add D9 ascendant and houses (new fields for future frontend use)
     d9["_ascendant"] = d9_chart["ascendant"]
     d9["_houses"] = d9_chart["houses"]
     d9["_houses_signs"] = d9_chart["houses_signs"]
-    
+
     # D10 chart calculation
     d10_chart = build_chart_d10(asc_sidereal, d1_planets_list)
-    
+
     # Transform to current API format for backward compatibility
     d10 = {}
     for p in d10_chart["planets"]:
@@ -1151,46 +1207,56 @@ def compute_chart(year: int, month: int, day: int, hour: int, minute: int, secon
             "debilitated": p.get("debilitated", False),
             "exalted": p.get("exalted", False)
         }
-    
+
     # Add D10 ascendant and houses (new fields for future frontend use)
     d10["_ascendant"] = d10_chart["ascendant"]
     d10["_houses"] = d10_chart["houses"]
     d10["_houses_signs"] = d10_chart["houses_signs"]
-    
-    # Add nakshatra, sign lord, and d9 info for each planet
+
+    return d9, d10
+
+
+def annotate_planets(res_planets: Dict[str, Any], d9: Dict[str, Any], d10: Dict[str, Any]) -> None:
+    """Add nakshatra, sign lord and D9/D10 sign info to each planet (in place)."""
     for planet_name, planet_data in res_planets.items():
         if planet_data.get("lon_sidereal_manual"):
             lon_sid = planet_data["lon_sidereal_manual"]
             # Calculate nakshatra for this planet
             nak_data = compute_nakshatra_pada(lon_sid)
             planet_data["nakshatra"] = nak_data
-            
+
             # Add sign lord for D1 sign
             sign_d1 = planet_data.get("sign_manual")
             if sign_d1:
                 planet_data["sign_lord"] = SIGN_LORDS_MAP.get(sign_d1, "")
-        
+
         # Add D9 sign and its lord
         if planet_name in d9:
             d9_sign = d9[planet_name].get("d9_sign")
             if d9_sign:
                 planet_data["d9_sign"] = d9_sign
                 planet_data["d9_sign_lord"] = SIGN_LORDS_MAP.get(d9_sign, "")
-        
+
         # Add D10 sign and its lord
         if planet_name in d10:
             d10_sign = d10[planet_name].get("d10_sign")
             if d10_sign:
                 planet_data["d10_sign"] = d10_sign
                 planet_data["d10_sign_lord"] = SIGN_LORDS_MAP.get(d10_sign, "")
-    
+
+
+def build_ascendant_data(houses_data: Dict[str, Any], d9: Dict[str, Any], d10: Dict[str, Any]) -> Dict[str, Any]:
+    """Ascendant with its nakshatra, sign lord and D9/D10 signs."""
+    asc_sidereal = houses_data["asc_sidereal"]
+    asc_sign = houses_data["ascendant"]["sign"]
+
     # Add nakshatra and sign lord for ascendant
     asc_nakshatra = None
     asc_sign_lord = None
     if asc_sidereal:
         asc_nakshatra = compute_nakshatra_pada(asc_sidereal)
         asc_sign_lord = SIGN_LORDS_MAP.get(asc_sign, "")
-    
+
     # Add ascendant info with nakshatra and sign lord
     ascendant_data = houses_data["ascendant"].copy()
     if asc_nakshatra:
@@ -1202,13 +1268,95 @@ def compute_chart(year: int, month: int, day: int, hour: int, minute: int, secon
         if asc_d9_sign:
             ascendant_data["d9_sign"] = asc_d9_sign
             ascendant_data["d9_sign_lord"] = SIGN_LORDS_MAP.get(asc_d9_sign, "")
-    
+
     if d10.get("_ascendant"):
         asc_d10_sign = d10["_ascendant"].get("sign")
         if asc_d10_sign:
             ascendant_data["d10_sign"] = asc_d10_sign
             ascendant_data["d10_sign_lord"] = SIGN_LORDS_MAP.get(asc_d10_sign, "")
+
+    return ascendant_data
+
+
+# ---------------------------
+# AYANAMSHA COMPARISON
+# ---------------------------
+def _sidereal_placement(lon_sid: float) -> Dict[str, Any]:
+    sign, deg = deg_to_sign_and_degree(lon_sid)
+    nak = compute_nakshatra_pada(lon_sid)
+    return {
+        "longitude": lon_sid,
+        "sign": sign,
+        "degree_in_sign": deg,
+        "nakshatra": nak["nakshatra"],
+        "pada": nak["pada"],
+    }
+
+
+def compute_ayanamsha_variants(jd_ut: float, res_planets: Dict[str, Any],
+                               asc_tropical: float, modes: List[str]) -> Dict[str, Any]:
+    """
+    Side-by-side sidereal signs and nakshatras for several ayanamsha modes.
+    The tropical positions of an already computed chart are reused; each mode
+    only costs one ayanamsha lookup.
+    """
+    variants = {}
+    for mode in modes:
+        ay = get_ayanamsha(jd_ut, mode)
+        variants[mode] = {
+            "ayanamsha_deg": ay,
+            "ascendant": _sidereal_placement(normalize_deg(asc_tropical - ay)),
+            "planets": {
+                name: _sidereal_placement(normalize_deg(pdata["lon_tropical"] - ay))
+                for name, pdata in res_planets.items() if "lon_tropical" in pdata
+            },
+        }
+    return variants
+
+
+# ---------------------------
+# MAIN CHART CALCULATION FUNCTION
+# ---------------------------
+def compute_chart(year: int, month: int, day: int, hour: int, minute: int, second: int,
+                  tz: str, lat: float, lon: float, planets: Optional[List[str]] = None,
+                  topo_alt: float = 0.0) -> Dict[str, Any]:
+    """
+    Compute complete astrological chart including planets, houses, dasha, etc.
+    
+    Returns:
+        Dictionary containing all chart data including planets, houses, d9, dasha, etc.
+    """
+    # Convert to UTC and get Julian Day
+    jd_ut, dt_utc = to_utc_julian_day(year, month, day, hour, minute, second, tz)
+    
+    # Get Ayanamsha
+    swe.set_topo(lon, lat, float(topo_alt))
+    ay = get_ayanamsha(jd_ut)
     
+    # Default planets list
+    planets = planets or DEFAULT_PLANETS
+    
+    # Calculate planets
+    res_planets = calculate_planets(jd_ut, ay, planets, lon, lat, topo_alt)
+    
+    # Calculate houses and ascendant
+    houses_data = calculate_houses(jd_ut, lat, lon, ay)
+    asc_sidereal = houses_data["asc_sidereal"]
+    asc_sign = houses_data["ascendant"]["sign"]
+    
+    # Calculate Nakshatra, Dasha, Karana, Tithi, Nithya Yoga
+    panchang = compute_panchang_sections(res_planets)
+    moon_sid = res_planets.get("Moon", {}).get("lon_sidereal_manual")
+    dasha = compute_vimshottari_timeline(jd_ut, moon_sid) if moon_sid else None
+
+    # Calculate Sunrise/Sunset
+    sun_data = compute_sunrise_sunset(jd_ut, lat, lon, tz)
+
+    # D9 / D10 charts, then per-planet nakshatra, sign lord and varga info
+    d9, d10 = compute_varga_sections(asc_sidereal, res_planets)
+    annotate_planets(res_planets, d9, d10)
+    ascendant_data = build_ascendant_data(houses_data, d9, d10)
+
     return {
         "jd_ut": jd_ut,
         "utc_at_birth": dt_utc.isoformat(),
@@ -1219,13 +1367,15 @@ def compute_chart(year: int, month: int, day: int, hour: int, minute: int, secon
         "d9": d9,
         "d10": d10,
         "vimshottari": dasha,
-        "nakshatra_of_moon": nakshatra,
-        "karana": karana_data,
-        "tithi": tithi_data,
-        "nithya_yoga": yoga_data,
+        "nakshatra_of_moon": panchang["nakshatra_of_moon"],
+        "karana": panchang["karana"],
+        "tithi": panchang["tithi"],
+        "nithya_yoga": panchang["nithya_yoga"],
         "sunrise": sun_data.get("sunrise"),
         "sunset": sun_data.get("sunset"),
-        "moon_sign": moon_sign,
+        "sunrise_jd": sun_data.get("sunrise_jd"),
+        "sunset_jd": sun_data.get("sunset_jd"),
+        "moon_sign": panchang["moon_sign"],
         "asc_sidereal": asc_sidereal,  # For use by calling code (e.g., lucky factors)
         "asc_sign": asc_sign  # For use by calling code
     }
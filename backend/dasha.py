@@ -0,0 +1,358 @@
+"""
+Dasha Module
+A generic, lazy dasha engine driven by system definitions:
+- Vimshottari (120 years, nakshatra lords)
+- Yogini (36 years, 8 yoginis from the Moon's nakshatra)
+- Ashtottari (108 years, 8 lords over groups of 3-4 nakshatras from Ardra)
+- Chara (Jaimini sign dasha from the Lagna, K.N. Rao's rules)
+
+A system is a sequence of lords with their years, a starting rule and a
+sub-period rule. A chart's "plan" is one repeating cycle of mahadashas from
+an epoch; every deeper level is the parent's span cut at fixed fractions
+that depend only on the parent's lord. Nothing below the mahadashas is
+stored: point and range queries walk the tree with bisects and only
+materialise the periods they return.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from backend.calculations import (
+    DEBILITATION_SIGNS,
+    EXALTATION_SIGNS,
+    NAKSHATRA_LORDS,
+    SIGNS,
+    SIGN_LORDS_MAP,
+    VIMSHOTTARI_ORDER,
+    VIMSHOTTARI_YEARS,
+    jd_to_datetime,
+    normalize_deg,
+)
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+DAYS_IN_YEAR = 365.2425
+NAKSHATRA_SIZE = 360.0 / 27.0
+
+LEVEL_NAMES = ["mahadasha", "antardasha", "pratyantardasha", "sookshma", "prana", "deha"]
+MAX_DEPTH = len(LEVEL_NAMES)
+
+YOGINI_ORDER = ["Mangala", "Pingala", "Dhanya", "Bhramari",
+                "Bhadrika", "Ulka", "Siddha", "Sankata"]
+YOGINI_YEARS = {name: i + 1 for i, name in enumerate(YOGINI_ORDER)}
+YOGINI_PLANETS = {
+    "Mangala": "Moon", "Pingala": "Sun", "Dhanya": "Jupiter", "Bhramari": "Mars",
+    "Bhadrika": "Mercury", "Ulka": "Saturn", "Siddha": "Venus", "Sankata": "Rahu",
+}
+# Nakshatra number + 3, counted in eights: Ashwini -> Bhramari
+YOGINI_NAKSHATRA_LORDS = [YOGINI_ORDER[(i + 3) % 8] for i in range(27)]
+
+ASHTOTTARI_ORDER = ["Sun", "Moon", "Mars", "Mercury", "Saturn", "Jupiter", "Rahu", "Venus"]
+ASHTOTTARI_YEARS = {
+    "Sun": 6, "Moon": 15, "Mars": 8, "Mercury": 17,
+    "Saturn": 10, "Jupiter": 19, "Rahu": 12, "Venus": 21,
+}
+# Groups of 4, 3, 4, 3, ... nakshatras from Ardra. Saturn's group holds
+# Abhijit, which lies inside the Purvashada-Shravana span used here.
+_ASHTOTTARI_GROUPS = [("Sun", 4), ("Moon", 3), ("Mars", 4), ("Mercury", 3),
+                      ("Saturn", 3), ("Jupiter", 3), ("Rahu", 4), ("Venus", 3)]
+ASHTOTTARI_NAKSHATRA_LORDS = [None] * 27
+_n = 5  # Ardra
+for _lord, _count in _ASHTOTTARI_GROUPS:
+    for _ in range(_count):
+        ASHTOTTARI_NAKSHATRA_LORDS[_n % 27] = _lord
+        _n += 1
+
+# Chara dasha: signs counted forward (savya) or backward (apasavya)
+CHARA_FORWARD_SIGNS = {"Aries", "Taurus", "Gemini", "Libra", "Scorpio", "Sagittarius"}
+CHARA_CO_LORDS = {"Scorpio": ("Mars", "Ketu"), "Aquarius": ("Saturn", "Rahu")}
+CHARA_PLANETS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]
+
+
+# ---------------------------
+# SUB-PERIOD TABLES
+# ---------------------------
+def _proportional_subs(order: List[str], years: Dict[str, float]) -> Dict[str, Tuple[Tuple[str, ...], Tuple[float, ...]]]:
+    """Sub-periods from the parent's lord onwards, in proportion to their years."""
+    total = float(sum(years.values()))
+    table = {}
+    for i, lord in enumerate(order):
+        lords = tuple(order[(i + k) % len(order)] for k in range(len(order)))
+        cum = [0.0]
+        for sub in lords:
+            cum.append(cum[-1] + years[sub] / total)
+        cum[-1] = 1.0
+        table[lord] = (lords, tuple(cum))
+    return table
+
+
+def _chara_step(sign_idx: int) -> int:
+    return 1 if SIGNS[sign_idx] in CHARA_FORWARD_SIGNS else -1
+
+
+def _chara_subs() -> Dict[str, Tuple[Tuple[str, ...], Tuple[float, ...]]]:
+    """Twelve equal sub-periods from the next sign, ending with the sign itself."""
+    table = {}
+    for i, sign in enumerate(SIGNS):
+        step = _chara_step(i)
+        lords = tuple(SIGNS[(i + step * k) % 12] for k in range(1, 13))
+        table[sign] = (lords, tuple(k / 12.0 for k in range(13)))
+    return table
+
+
+# ---------------------------
+# STARTING RULES
+# ---------------------------
+def _nakshatra_start(system: Dict[str, Any], jd_birth: float, moon_lon: float,
+                     **_) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    The Moon's nakshatra gives the first lord; the balance is the part of
+    that lord's run of consecutive nakshatras still to be traversed.
+    """
+    lords = system["nakshatra_lords"]
+    lon = normalize_deg(moon_lon)
+    nak = int(lon // NAKSHATRA_SIZE) % 27
+    lord = lords[nak]
+    first = nak
+    while lords[(first - 1) % 27] == lord and (first - 1) % 27 != nak:
+        first -= 1
+    count = 1
+    while lords[(nak + count) % 27] == lord and count < 27:
+        count += 1
+    span = (nak - first + count) * NAKSHATRA_SIZE
+    elapsed = ((lon - first * NAKSHATRA_SIZE) % 360.0) / span
+
+    order = system["order"]
+    start = order.index(lord)
+    cycle = [(order[(start + k) % len(order)], float(system["years"][order[(start + k) % len(order)]]))
+             for k in range(len(order))]
+    return jd_birth - elapsed * cycle[0][1] * DAYS_IN_YEAR, cycle
+
+
+def _chara_lord(sign_idx: int, signs: Dict[str, int]) -> str:
+    """Sign lord; for Scorpio and Aquarius the stronger of the two lords."""
+    sign = SIGNS[sign_idx]
+    if sign not in CHARA_CO_LORDS:
+        return SIGN_LORDS_MAP[sign]
+    a, b = CHARA_CO_LORDS[sign]
+    if signs[a] == sign_idx and signs[b] != sign_idx:
+        return b
+    if signs[b] == sign_idx and signs[a] != sign_idx:
+        return a
+    # More planets in company, then (approximation) the primary lord
+    company = {p: sum(1 for q in CHARA_PLANETS if q != p and signs[q] == signs[p]) for p in (a, b)}
+    return b if company[b] > company[a] else a
+
+
+def _chara_years(sign_idx: int, signs: Dict[str, int]) -> int:
+    lord = _chara_lord(sign_idx, signs)
+    lord_idx = signs[lord]
+    count = (lord_idx - sign_idx) * _chara_step(sign_idx) % 12
+    years = count or 12
+    if EXALTATION_SIGNS.get(lord) == SIGNS[lord_idx]:
+        years += 1
+    elif DEBILITATION_SIGNS.get(lord) == SIGNS[lord_idx]:
+        years -= 1
+    return years
+
+
+def _chara_start(system: Dict[str, Any], jd_birth: float, moon_lon: float,
+                 asc_lon: Optional[float] = None,
+                 planet_lons: Optional[Dict[str, float]] = None) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Signs from the Lagna, forward when the 9th sign is a savya sign. The
+    second round gives each sign the balance of 12 years.
+    """
+    if asc_lon is None or not planet_lons or not set(CHARA_PLANETS) <= set(planet_lons):
+        raise ValueError("Chara dasha needs the Lagna and all nine planets")
+    signs = {p: int(normalize_deg(planet_lons[p]) // 30.0) for p in CHARA_PLANETS}
+    lagna = int(normalize_deg(asc_lon) // 30.0)
+    step = _chara_step((lagna + 8) % 12)
+    order = [(lagna + step * k) % 12 for k in range(12)]
+    first = [(SIGNS[s], float(_chara_years(s, signs))) for s in order]
+    second = [(sign, 12.0 - years) for sign, years in first if years < 12.0]
+    return jd_birth, first + second
+
+
+# ---------------------------
+# SYSTEM DEFINITIONS
+# ---------------------------
+DASHA_SYSTEMS = {
+    "vimshottari": {
+        "order": VIMSHOTTARI_ORDER,
+        "years": VIMSHOTTARI_YEARS,
+        "nakshatra_lords": NAKSHATRA_LORDS,
+        "start": _nakshatra_start,
+        "subs": _proportional_subs(VIMSHOTTARI_ORDER, VIMSHOTTARI_YEARS),
+    },
+    "yogini": {
+        "order": YOGINI_ORDER,
+        "years": YOGINI_YEARS,
+        "nakshatra_lords": YOGINI_NAKSHATRA_LORDS,
+        "planets": YOGINI_PLANETS,
+        "start": _nakshatra_start,
+        "subs": _proportional_subs(YOGINI_ORDER, YOGINI_YEARS),
+    },
+    "ashtottari": {
+        "order": ASHTOTTARI_ORDER,
+        "years": ASHTOTTARI_YEARS,
+        "nakshatra_lords": ASHTOTTARI_NAKSHATRA_LORDS,
+        "start": _nakshatra_start,
+        "subs": _proportional_subs(ASHTOTTARI_ORDER, ASHTOTTARI_YEARS),
+    },
+    "chara": {
+        "order": SIGNS,
+        "start": _chara_start,
+        "subs": _chara_subs(),
+    },
+}
+
+# A period: (lords from the mahadasha down, start JD, end JD)
+Period = Tuple[Tuple[str, ...], float, float]
+
+
+# ---------------------------
+# PLAN
+# ---------------------------
+def dasha_plan(system: str, jd_birth: float, moon_lon: float,
+               asc_lon: Optional[float] = None,
+               planet_lons: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """
+    One mahadasha cycle of a chart: the epoch (start of the first
+    mahadasha, before birth when a balance is running) and cumulative
+    offsets in days. Everything else is derived from it on demand.
+    """
+    if system not in DASHA_SYSTEMS:
+        raise ValueError(f"system must be one of {list(DASHA_SYSTEMS)}")
+    definition = DASHA_SYSTEMS[system]
+    epoch, cycle = definition["start"](definition, jd_birth, moon_lon,
+                                       asc_lon=asc_lon, planet_lons=planet_lons)
+    offsets = [0.0]
+    for _, years in cycle:
+        offsets.append(offsets[-1] + years * DAYS_IN_YEAR)
+    return {
+        "system": system,
+        "jd_birth": jd_birth,
+        "epoch": epoch,
+        "lords": tuple(lord for lord, _ in cycle),
+        "offsets": tuple(offsets),
+        "cycle_days": offsets[-1],
+        "subs": definition["subs"],
+    }
+
+
+def chart_dasha_plan(system: str, chart: Dict[str, Any]) -> Dict[str, Any]:
+    """dasha_plan from a compute_chart result."""
+    planet_lons = {name: p["lon_sidereal_manual"] for name, p in chart["planets"].items()
+                   if isinstance(p, dict) and p.get("lon_sidereal_manual") is not None}
+    if "Moon" not in planet_lons:
+        raise ValueError("The chart has no Moon position")
+    return dasha_plan(system, chart["jd_ut"], planet_lons["Moon"],
+                      asc_lon=chart.get("asc_sidereal"), planet_lons=planet_lons)
+
+
+# ---------------------------
+# TREE WALK
+# ---------------------------
+def _mahadasha(plan: Dict[str, Any], n: int) -> Period:
+    """The n-th mahadasha from the epoch (cycles repeat)."""
+    k, i = divmod(n, len(plan["lords"]))
+    base = plan["epoch"] + k * plan["cycle_days"]
+    offsets = plan["offsets"]
+    return (plan["lords"][i],), base + offsets[i], base + offsets[i + 1]
+
+
+def _mahadasha_index(plan: Dict[str, Any], jd: float) -> int:
+    k, r = divmod(jd - plan["epoch"], plan["cycle_days"])
+    i = min(bisect_right(plan["offsets"], r) - 1, len(plan["lords"]) - 1)
+    return int(k) * len(plan["lords"]) + i
+
+
+def _child(plan: Dict[str, Any], period: Period, i: int) -> Period:
+    lords, start, end = period
+    subs, cum = plan["subs"][lords[-1]]
+    length = end - start
+    child_end = end if i == len(subs) - 1 else start + cum[i + 1] * length
+    return lords + (subs[i],), start + cum[i] * length, child_end
+
+
+def children(plan: Dict[str, Any], period: Period) -> List[Period]:
+    """All sub-periods of a period."""
+    return [_child(plan, period, i) for i in range(len(plan["subs"][period[0][-1]][0]))]
+
+
+def _check_depth(depth: int) -> None:
+    if not 1 <= depth <= MAX_DEPTH:
+        raise ValueError(f"depth must be between 1 and {MAX_DEPTH}")
+
+
+def period_at(plan: Dict[str, Any], jd: float, depth: int = 3) -> List[Period]:
+    """The running period at each level down to `depth` (one bisect per level)."""
+    _check_depth(depth)
+    period = _mahadasha(plan, _mahadasha_index(plan, jd))
+    chain = [period]
+    for _ in range(depth - 1):
+        lords, start, end = period
+        _, cum = plan["subs"][lords[-1]]
+        i = min(max(bisect_right(cum, (jd - start) / (end - start)) - 1, 0), len(cum) - 2)
+        period = _child(plan, period, i)
+        chain.append(period)
+    return chain
+
+
+def _overlapping(plan: Dict[str, Any], period: Period, jd_start: float,
+                 jd_end: float, depth: int) -> Iterator[Period]:
+    if len(period[0]) == depth:
+        yield period
+        return
+    lords, start, end = period
+    _, cum = plan["subs"][lords[-1]]
+    length = end - start
+    first = max(bisect_right(cum, (jd_start - start) / length) - 1, 0)
+    last = min(bisect_left(cum, (jd_end - start) / length), len(cum) - 1)
+    for i in range(first, last):
+        child = _child(plan, period, i)
+        if child[2] > jd_start and child[1] < jd_end:
+            yield from _overlapping(plan, child, jd_start, jd_end, depth)
+
+
+def periods_between(plan: Dict[str, Any], jd_start: float, jd_end: float,
+                    depth: int = 1) -> Iterator[Period]:
+    """
+    Periods at `depth` overlapping [jd_start, jd_end), in time order. Only
+    the branches that reach the window are expanded.
+    """
+    _check_depth(depth)
+    n = _mahadasha_index(plan, jd_start)
+    while True:
+        md = _mahadasha(plan, n)
+        if md[1] >= jd_end:
+            return
+        if md[2] > jd_start:
+            yield from _overlapping(plan, md, jd_start, jd_end, depth)
+        n += 1
+
+
+# ---------------------------
+# OUTPUT
+# ---------------------------
+def period_dict(plan: Dict[str, Any], period: Period) -> Dict[str, Any]:
+    """A period as JSON, clipped to the birth time like the Vimshottari timeline."""
+    lords, start, end = period
+    clipped = max(start, plan["jd_birth"])
+    out = {
+        "level": LEVEL_NAMES[len(lords) - 1],
+        "lord": lords[-1],
+        "lords": list(lords),
+        "start_jd": clipped,
+        "end_jd": end,
+        "start_date": jd_to_datetime(clipped).isoformat(),
+        "end_date": jd_to_datetime(end).isoformat(),
+        "years": round((end - clipped) / DAYS_IN_YEAR, 6),
+        "is_partial": clipped > start,
+    }
+    planets = DASHA_SYSTEMS[plan["system"]].get("planets")
+    if planets:
+        out["planet"] = planets[lords[-1]]
+    return out
@@ -0,0 +1,191 @@
+"""
+Day Divisions Module
+Splits a location-day into the classical time segments used for muhurta:
+- Planetary Hora (24 unequal hours from sunrise to next sunrise)
+- Rahu Kalam, Yamaganda and Gulika Kalam (1/8th parts of daytime)
+- Choghadiya (8 day and 8 night segments)
+
+Every table depends only on (date, place), so results are cached per
+location-day and shared by all users asking about the same city.
+"""
+
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Any, List
+
+from backend.calculations import (
+    local_midnight_jd,
+    find_sunrise_sunset_jd,
+    jd_to_local_datetime,
+)
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+# Weekday lords indexed by Python's date.weekday() (Monday=0 ... Sunday=6)
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+WEEKDAY_LORDS = ["Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Sun"]
+
+# Hora sequence: each hour is ruled by the next planet in this (Chaldean) order
+HORA_SEQUENCE = ["Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars"]
+
+# Which 1/8th part of daytime (1-based) each kalam occupies, keyed by weekday name
+RAHU_KALAM_PART = {
+    "Sunday": 8, "Monday": 2, "Tuesday": 7, "Wednesday": 5,
+    "Thursday": 6, "Friday": 4, "Saturday": 3
+}
+YAMAGANDA_PART = {
+    "Sunday": 5, "Monday": 4, "Tuesday": 3, "Wednesday": 2,
+    "Thursday": 1, "Friday": 7, "Saturday": 6
+}
+GULIKA_PART = {
+    "Sunday": 7, "Monday": 6, "Tuesday": 5, "Wednesday": 4,
+    "Thursday": 3, "Friday": 2, "Saturday": 1
+}
+
+# Choghadiya names follow the hora lords
+CHOGHADIYA_BY_LORD = {
+    "Sun": "Udveg", "Venus": "Char", "Mercury": "Labh", "Moon": "Amrit",
+    "Saturn": "Kaal", "Jupiter": "Shubh", "Mars": "Rog"
+}
+CHOGHADIYA_QUALITY = {
+    "Amrit": "Good", "Shubh": "Good", "Labh": "Good", "Char": "Neutral",
+    "Udveg": "Bad", "Kaal": "Bad", "Rog": "Bad"
+}
+
+# Coordinates are rounded before caching so nearby users share one entry
+# (0.01 deg moves sunrise by only a few seconds).
+COORD_PRECISION = 2
+
+
+# ---------------------------
+# HELPER FUNCTIONS
+# ---------------------------
+def _segment(start_jd: float, end_jd: float, tz_name: str, **extra) -> Dict[str, Any]:
+    """Build a time segment with JDs and local ISO timestamps."""
+    seg = {
+        "start_jd": start_jd,
+        "end_jd": end_jd,
+        "start": jd_to_local_datetime(start_jd, tz_name).isoformat(),
+        "end": jd_to_local_datetime(end_jd, tz_name).isoformat(),
+    }
+    seg.update(extra)
+    return seg
+
+
+def _split(start_jd: float, end_jd: float, parts: int) -> List[float]:
+    """Return parts+1 equally spaced boundaries between start_jd and end_jd."""
+    step = (end_jd - start_jd) / parts
+    return [start_jd + i * step for i in range(parts + 1)]
+
+
+def compute_hora_table(sunrise_jd: float, sunset_jd: float, next_sunrise_jd: float,
+                       weekday: str, tz_name: str) -> List[Dict[str, Any]]:
+    """
+    Calculate the 24 planetary horas of a day.
+    The first hora after sunrise belongs to the weekday lord; each following
+    hora is ruled by the next planet in HORA_SEQUENCE.
+    """
+    bounds = _split(sunrise_jd, sunset_jd, 12) + _split(sunset_jd, next_sunrise_jd, 12)[1:]
+    start_idx = HORA_SEQUENCE.index(WEEKDAY_LORDS[WEEKDAY_NAMES.index(weekday)])
+
+    horas = []
+    for i in range(24):
+        horas.append(_segment(
+            bounds[i], bounds[i + 1], tz_name,
+            hora=i + 1,
+            lord=HORA_SEQUENCE[(start_idx + i) % 7],
+            is_day=i < 12
+        ))
+    return horas
+
+
+def compute_kalams(sunrise_jd: float, sunset_jd: float, weekday: str,
+                   tz_name: str) -> Dict[str, Dict[str, Any]]:
+    """Calculate Rahu Kalam, Yamaganda and Gulika Kalam for the daytime."""
+    bounds = _split(sunrise_jd, sunset_jd, 8)
+    kalams = {}
+    for key, table in (("rahu_kalam", RAHU_KALAM_PART),
+                       ("yamaganda", YAMAGANDA_PART),
+                       ("gulika_kalam", GULIKA_PART)):
+        part = table[weekday]
+        kalams[key] = _segment(bounds[part - 1], bounds[part], tz_name, part=part)
+    return kalams
+
+
+def compute_choghadiya(sunrise_jd: float, sunset_jd: float, next_sunrise_jd: float,
+                       weekday: str, tz_name: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Calculate the 8 day and 8 night Choghadiya segments.
+    Day starts with the weekday lord and advances one step in HORA_SEQUENCE;
+    night starts with the lord of the 5th weekday and moves back two steps.
+    """
+    wd = WEEKDAY_NAMES.index(weekday)
+    day_start = HORA_SEQUENCE.index(WEEKDAY_LORDS[wd])
+    night_start = HORA_SEQUENCE.index(WEEKDAY_LORDS[(wd + 4) % 7])
+
+    result = {"day": [], "night": []}
+    for key, (start, end), first, step in (
+        ("day", (sunrise_jd, sunset_jd), day_start, 1),
+        ("night", (sunset_jd, next_sunrise_jd), night_start, -2),
+    ):
+        bounds = _split(start, end, 8)
+        for i in range(8):
+            lord = HORA_SEQUENCE[(first + i * step) % 7]
+            name = CHOGHADIYA_BY_LORD[lord]
+            result[key].append(_segment(
+                bounds[i], bounds[i + 1], tz_name,
+                name=name, lord=lord, quality=CHOGHADIYA_QUALITY[name]
+            ))
+    return result
+
+
+# ---------------------------
+# MAIN DAY TABLE FUNCTION
+# ---------------------------
+@lru_cache(maxsize=4096)
+def _day_divisions_cached(year: int, month: int, day: int,
+                          lat: float, lon: float, tz_name: str) -> Dict[str, Any]:
+    jd_midnight = local_midnight_jd(year, month, day, tz_name)
+    today = find_sunrise_sunset_jd(jd_midnight, lat, lon)
+    sunrise_jd = today["sunrise_jd"]
+    sunset_jd = today["sunset_jd"]
+    # First sunrise after today's sunset closes the Hindu day
+    next_sunrise_jd = find_sunrise_sunset_jd(sunset_jd, lat, lon)["sunrise_jd"]
+
+    weekday = WEEKDAY_NAMES[date(year, month, day).weekday()]
+
+    return {
+        "date": date(year, month, day).isoformat(),
+        "weekday": weekday,
+        "weekday_lord": WEEKDAY_LORDS[WEEKDAY_NAMES.index(weekday)],
+        "lat": lat,
+        "lon": lon,
+        "tz": tz_name,
+        "sunrise_jd": sunrise_jd,
+        "sunset_jd": sunset_jd,
+        "next_sunrise_jd": next_sunrise_jd,
+        "sunrise": jd_to_local_datetime(sunrise_jd, tz_name).isoformat(),
+        "sunset": jd_to_local_datetime(sunset_jd, tz_name).isoformat(),
+        "next_sunrise": jd_to_local_datetime(next_sunrise_jd, tz_name).isoformat(),
+        "hora": compute_hora_table(sunrise_jd, sunset_jd, next_sunrise_jd, weekday, tz_name),
+        **compute_kalams(sunrise_jd, sunset_jd, weekday, tz_name),
+        "choghadiya": compute_choghadiya(sunrise_jd, sunset_jd, next_sunrise_jd, weekday, tz_name),
+    }
+
+
+def compute_day_divisions(year: int, month: int, day: int,
+                          lat: float, lon: float, tz_name: str) -> Dict[str, Any]:
+    """
+    Compute hora, kalams and choghadiya for a local civil date and place.
+
+    Results are cached per (date, rounded lat/lon, tz). The returned dict is
+    shared between callers and must not be mutated. Raises ValueError (not
+    cached) on days without a sunrise or sunset.
+    """
+    return _day_divisions_cached(
+        year, month, day,
+        round(float(lat), COORD_PRECISION),
+        round(float(lon), COORD_PRECISION),
+        tz_name
+    )
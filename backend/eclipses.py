@@ -0,0 +1,179 @@
+"""
+Eclipses Module
+Solar and lunar eclipses (grahan) from 1900 to 2100:
+- Found once per process with the Swiss Ephemeris global eclipse search
+  and kept as a compact table sorted by time
+- Each eclipse carries its type, phase times and the sidereal (Lahiri)
+  longitude, sign and nakshatra of the eclipsed luminary
+- A second index sorted by longitude answers "eclipses within orb of a
+  natal point"; both queries are binary searches over the table
+"""
+
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+import swisseph as swe
+
+from backend.calculations import (
+    SIGNS,
+    compute_nakshatra_pada,
+    jd_to_datetime,
+    sidereal_position,
+)
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+TABLE_START_YEAR = 1900
+TABLE_END_YEAR = 2100
+
+ECLIPSE_KINDS = ("solar", "lunar")
+
+# Eclipses of one kind are at least a lunation apart, so the next search
+# can safely start a day after the previous maximum
+SEARCH_RESTART_DAYS = 1.0
+
+SOLAR_TYPES = [
+    (swe.ECL_ANNULAR_TOTAL, "hybrid"),
+    (swe.ECL_TOTAL, "total"),
+    (swe.ECL_ANNULAR, "annular"),
+    (swe.ECL_PARTIAL, "partial"),
+]
+LUNAR_TYPES = [
+    (swe.ECL_TOTAL, "total"),
+    (swe.ECL_PARTIAL, "partial"),
+    (swe.ECL_PENUMBRAL, "penumbral"),
+]
+
+# Table row: (max_jd, kind, type, start_jd, end_jd, sidereal longitude)
+EclipseRow = Tuple[float, str, str, float, float, float]
+
+
+# ---------------------------
+# SHARED ECLIPSE TABLE
+# ---------------------------
+def _eclipse_type(flags: int, types: List[Tuple[int, str]]) -> str:
+    for bit, name in types:
+        if flags & bit == bit:
+            return name
+    return "unknown"
+
+
+def _search(kind: str, jd_start: float, jd_end: float) -> List[EclipseRow]:
+    rows = []
+    jd = jd_start
+    while True:
+        if kind == "solar":
+            flags, tret = swe.sol_eclipse_when_glob(jd, swe.FLG_SWIEPH, 0, False)
+            ecl_type = _eclipse_type(flags, SOLAR_TYPES)
+            start, end = tret[2], tret[3]
+            body = "Sun"
+        else:
+            flags, tret = swe.lun_eclipse_when(jd, swe.FLG_SWIEPH, 0, False)
+            ecl_type = _eclipse_type(flags, LUNAR_TYPES)
+            start, end = tret[6], tret[7]
+            body = "Moon"
+        jd_max = tret[0]
+        if jd_max >= jd_end:
+            return rows
+        lon, _ = sidereal_position(jd_max, body)
+        rows.append((jd_max, kind, ecl_type, start, end, lon))
+        jd = jd_max + SEARCH_RESTART_DAYS
+
+
+@lru_cache(maxsize=1)
+def eclipse_table() -> Tuple[Tuple[EclipseRow, ...], Tuple[float, ...],
+                             Tuple[float, ...], Tuple[int, ...]]:
+    """
+    (rows sorted by time, their max JDs, longitudes sorted, row index of
+    each sorted longitude). Built once per process (about a second).
+    """
+    jd_start = swe.julday(TABLE_START_YEAR, 1, 1, 0.0, swe.GREG_CAL)
+    jd_end = swe.julday(TABLE_END_YEAR + 1, 1, 1, 0.0, swe.GREG_CAL)
+
+    rows = sorted(_search("solar", jd_start, jd_end) + _search("lunar", jd_start, jd_end))
+    by_lon = sorted(range(len(rows)), key=lambda i: rows[i][5])
+    return (tuple(rows), tuple(r[0] for r in rows),
+            tuple(rows[i][5] for i in by_lon), tuple(by_lon))
+
+
+def _as_dict(row: EclipseRow) -> Dict[str, Any]:
+    jd_max, kind, ecl_type, start, end, lon = row
+    nak = compute_nakshatra_pada(lon)
+    return {
+        "kind": kind,
+        "type": ecl_type,
+        "jd": jd_max,
+        "time_utc": jd_to_datetime(jd_max).isoformat(),
+        "start_jd": start,
+        "end_jd": end,
+        "duration_minutes": round((end - start) * 1440.0, 1),
+        "longitude": lon,
+        "sign": SIGNS[int(lon // 30) % 12],
+        "nakshatra": nak["nakshatra"],
+        "pada": nak["pada"],
+    }
+
+
+def _check_kinds(kinds: Optional[List[str]]) -> Tuple[str, ...]:
+    kinds = tuple(kinds or ECLIPSE_KINDS)
+    if not set(kinds) <= set(ECLIPSE_KINDS):
+        raise ValueError(f"kinds must be among {list(ECLIPSE_KINDS)}")
+    return kinds
+
+
+# ---------------------------
+# QUERIES
+# ---------------------------
+def eclipses_between(jd_start: float, jd_end: float,
+                     kinds: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Eclipses whose maximum falls in [jd_start, jd_end), in time order."""
+    kinds = _check_kinds(kinds)
+    rows, jds, _, _ = eclipse_table()
+    lo, hi = bisect_left(jds, jd_start), bisect_left(jds, jd_end)
+    return [_as_dict(r) for r in rows[lo:hi] if r[1] in kinds]
+
+
+def eclipses_near(lon: float, orb: float, jd_start: Optional[float] = None,
+                  jd_end: Optional[float] = None,
+                  kinds: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Eclipses within `orb` degrees of a sidereal longitude, optionally
+    limited to a time window, in time order with their distance.
+    """
+    if not 0 < orb <= 30:
+        raise ValueError("orb must be between 0 and 30 degrees")
+    kinds = _check_kinds(kinds)
+    rows, _, lons, by_lon = eclipse_table()
+    lon = lon % 360.0
+
+    # Longitude window, split in two where it wraps past 0/360
+    ranges = [(lon - orb, lon + orb)]
+    if lon - orb < 0:
+        ranges = [(0.0, lon + orb), (lon - orb + 360.0, 360.0)]
+    elif lon + orb >= 360.0:
+        ranges = [(lon - orb, 360.0), (0.0, lon + orb - 360.0)]
+
+    hits = []
+    for a, b in ranges:
+        for k in range(bisect_left(lons, a), bisect_right(lons, b)):
+            row = rows[by_lon[k]]
+            if row[1] not in kinds:
+                continue
+            if jd_start is not None and row[0] < jd_start:
+                continue
+            if jd_end is not None and row[0] >= jd_end:
+                continue
+            hits.append(row)
+    hits.sort()
+    return [{**_as_dict(r), "orb": round(abs((r[5] - lon + 180.0) % 360.0 - 180.0), 4)}
+            for r in hits]
+
+
+def natal_eclipses(points: Dict[str, float], orb: float, jd_start: Optional[float] = None,
+                   jd_end: Optional[float] = None,
+                   kinds: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """eclipses_near for each {name: sidereal longitude} natal point."""
+    return {name: eclipses_near(lon, orb, jd_start, jd_end, kinds)
+            for name, lon in points.items()}
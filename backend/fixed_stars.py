@@ -0,0 +1,234 @@
+"""
+Fixed Stars Module
+Conjunctions of natal planets and the ascendant with the fixed stars of the
+Swiss Ephemeris catalog (backend/ephe/sefstars.txt):
+- The catalog is parsed once at import into J2000 unit vectors with their
+  proper motions (duplicate spellings of one star become aliases)
+- Star positions for a chart epoch are computed for the whole catalog in one
+  NumPy pass (proper motion, IAU 1976 precession, nutation, aberration) and
+  kept sorted by sidereal longitude
+- Each body is matched against the sorted longitudes with a binary search,
+  so only the stars inside the orb are ever visited
+"""
+
+import math
+import os
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from backend.calculations import get_ayanamsha, normalize_deg
+from backend.config import EPHE_PATH
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+STAR_CATALOG = os.path.join(EPHE_PATH, "sefstars.txt")
+
+DEFAULT_ORB = 1.0
+MAX_ORB = 10.0
+
+J2000 = 2451545.0
+B1950 = 2433282.4235
+ARCSEC = math.pi / (180.0 * 3600.0)
+ABERRATION = 20.49552  # constant of aberration, arcsec
+
+# Positions are cached per whole day of the chart epoch; stars move less
+# than 0.5" in that time
+EPOCH_CACHE_SIZE = 256
+
+
+# ---------------------------
+# CATALOG
+# ---------------------------
+def _precession_matrix(jd_tt: float) -> np.ndarray:
+    """IAU 1976 precession matrix from the J2000 mean equator to that of jd_tt."""
+    t = (jd_tt - J2000) / 36525.0
+    zeta = (2306.2181 * t + 0.30188 * t * t + 0.017998 * t ** 3) * ARCSEC
+    z = (2306.2181 * t + 1.09468 * t * t + 0.018203 * t ** 3) * ARCSEC
+    theta = (2004.3109 * t - 0.42665 * t * t - 0.041833 * t ** 3) * ARCSEC
+    cz, sz = math.cos(zeta), math.sin(zeta)
+    cZ, sZ = math.cos(z), math.sin(z)
+    ct, st = math.cos(theta), math.sin(theta)
+    return np.array([
+        [cZ * ct * cz - sZ * sz, -cZ * ct * sz - sZ * cz, -cZ * st],
+        [sZ * ct * cz + cZ * sz, -sZ * ct * sz + cZ * cz, -sZ * st],
+        [st * cz, -st * sz, ct],
+    ])
+
+
+def _parse_angle(deg: str, minutes: str, seconds: str) -> float:
+    value = abs(float(deg)) + float(minutes) / 60.0 + float(seconds) / 3600.0
+    return -value if deg.strip().startswith("-") else value
+
+
+def _load_catalog(path: str) -> Optional[Dict[str, Any]]:
+    """Parse sefstars.txt into arrays; None if the file is not installed."""
+    if not os.path.exists(path):
+        return None
+
+    to_j2000 = _precession_matrix(B1950).T
+    stars: Dict[str, Dict[str, Any]] = {}
+    with open(path, encoding="latin-1") as fh:
+        for line in fh:
+            if not line.strip() or line.startswith("#"):
+                continue
+            f = [x.strip() for x in line.split(",")]
+            if len(f) < 14:
+                continue
+            name, nomenclature = f[0], f[1]
+            if nomenclature in stars:
+                if name and name not in stars[nomenclature]["aliases"]:
+                    stars[nomenclature]["aliases"].append(name)
+                continue
+
+            ra = math.radians(15.0 * _parse_angle(f[3], f[4], f[5]))
+            dec = math.radians(_parse_angle(f[6], f[7], f[8]))
+            # Proper motion: 0.001"/yr (RA already multiplied by cos dec)
+            pm_ra = float(f[9]) / 1000.0 * ARCSEC
+            pm_dec = float(f[10]) / 1000.0 * ARCSEC
+            sa, ca, sd, cd = math.sin(ra), math.cos(ra), math.sin(dec), math.cos(dec)
+            vec = np.array([cd * ca, cd * sa, sd])
+            motion = pm_ra * np.array([-sa, ca, 0.0]) + pm_dec * np.array([-sd * ca, -sd * sa, cd])
+            if f[2] == "1950":
+                vec, motion = to_j2000 @ vec, to_j2000 @ motion
+            stars[nomenclature] = {
+                "name": name or nomenclature,
+                "nomenclature": nomenclature,
+                "aliases": [],
+                "magnitude": float(f[13]),
+                "vector": vec,
+                "motion": motion,
+            }
+
+    rows = list(stars.values())
+    return {
+        "name": np.array([r["name"] for r in rows], dtype=object),
+        "nomenclature": np.array([r["nomenclature"] for r in rows], dtype=object),
+        "aliases": [r["aliases"] for r in rows],
+        "magnitude": np.array([r["magnitude"] for r in rows]),
+        "vector": np.array([r["vector"] for r in rows]),
+        "motion": np.array([r["motion"] for r in rows]),
+    }
+
+
+CATALOG = _load_catalog(STAR_CATALOG)
+
+
+def catalog_size() -> int:
+    return 0 if CATALOG is None else len(CATALOG["name"])
+
+
+# ---------------------------
+# POSITIONS AT EPOCH
+# ---------------------------
+@lru_cache(maxsize=EPOCH_CACHE_SIZE)
+def _positions_for_day(day: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (order, sidereal longitudes, ecliptic latitudes) of the whole catalog,
+    sorted by longitude, for the given epoch (JD UT).
+    """
+    jd_tt = day + swe.deltat(day)
+    years = (jd_tt - J2000) / 365.25
+
+    vec = CATALOG["vector"] + years * CATALOG["motion"]
+    vec = vec @ _precession_matrix(jd_tt).T
+
+    nut = swe.calc_ut(day, swe.ECL_NUT)[0]
+    eps = math.radians(nut[1])  # mean obliquity; nutation added in longitude
+    x = vec[:, 0]
+    y = vec[:, 1] * math.cos(eps) + vec[:, 2] * math.sin(eps)
+    z = -vec[:, 1] * math.sin(eps) + vec[:, 2] * math.cos(eps)
+    lon = np.degrees(np.arctan2(y, x))
+    lat = np.degrees(np.arctan2(z, np.hypot(x, y)))
+
+    # Annual aberration from the Sun's longitude
+    sun_lon = swe.calc_ut(day, swe.SUN)[0][0]
+    elong = np.radians(sun_lon - lon)
+    lat_rad = np.radians(lat)
+    lon = lon - ABERRATION / 3600.0 * np.cos(elong) / np.cos(lat_rad)
+    lat = lat - ABERRATION / 3600.0 * np.sin(elong) * np.sin(lat_rad)
+
+    sidereal = np.mod(lon + nut[2] - get_ayanamsha(day), 360.0)
+    order = np.argsort(sidereal)
+    return order, sidereal[order], lat[order]
+
+
+def star_positions(jd_ut: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sorted catalog positions for a moment (cached per day)."""
+    if CATALOG is None:
+        raise ValueError(f"Fixed star catalog not found: {STAR_CATALOG}")
+    return _positions_for_day(float(round(jd_ut)))
+
+
+# ---------------------------
+# CONJUNCTIONS
+# ---------------------------
+def find_conjunctions(jd_ut: float, bodies: Dict[str, float], orb: float = DEFAULT_ORB,
+                      max_magnitude: Optional[float] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Stars within `orb` degrees of longitude of each body.
+
+    Args:
+        bodies: {name: sidereal longitude (Lahiri)}
+        max_magnitude: Skip stars fainter than this (larger magnitude)
+
+    Returns:
+        {name: [star dicts sorted by orb]} for every body
+    """
+    if not 0 < orb <= MAX_ORB:
+        raise ValueError(f"orb must be between 0 and {MAX_ORB} degrees")
+    order, lons, lats = star_positions(jd_ut)
+    n = len(lons)
+    # Longitudes repeated one turn either side so windows never wrap
+    padded = np.concatenate((lons - 360.0, lons, lons + 360.0))
+
+    names = list(bodies)
+    centers = np.array([normalize_deg(bodies[b]) for b in names])
+    lo = np.searchsorted(padded, centers - orb, side="left")
+    hi = np.searchsorted(padded, centers + orb, side="right")
+
+    result = {}
+    for name, center, a, b in zip(names, centers, lo, hi):
+        hits = []
+        for k in range(a, b):
+            i = k % n
+            star = order[i]
+            magnitude = CATALOG["magnitude"][star]
+            if max_magnitude is not None and magnitude > max_magnitude:
+                continue
+            hits.append({
+                "star": CATALOG["name"][star],
+                "nomenclature": CATALOG["nomenclature"][star],
+                "aliases": CATALOG["aliases"][star],
+                "magnitude": float(magnitude),
+                "longitude": float(lons[i]),
+                "latitude": float(lats[i]),
+                "orb": round(abs(float(padded[k]) - float(center)), 4),
+            })
+        hits.sort(key=lambda h: h["orb"])
+        result[name] = hits
+    return result
+
+
+# ---------------------------
+# CHART SECTION
+# ---------------------------
+def compute_fixed_stars(jd_ut: float, res_planets: Dict[str, Any], asc_tropical: float,
+                        orb: float = DEFAULT_ORB,
+                        max_magnitude: Optional[float] = None) -> Dict[str, Any]:
+    """Fixed-star conjunctions of the chart's planets and ascendant."""
+    ay = get_ayanamsha(jd_ut)
+    bodies = {
+        name: pdata["lon_tropical"] - ay
+        for name, pdata in res_planets.items() if "lon_tropical" in pdata
+    }
+    bodies["Ascendant"] = asc_tropical - ay
+    return {
+        "catalog_size": catalog_size(),
+        "orb": orb,
+        "max_magnitude": max_magnitude,
+        "conjunctions": find_conjunctions(jd_ut, bodies, orb, max_magnitude),
+    }
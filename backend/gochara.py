@@ -0,0 +1,124 @@
+"""
+Gochara Module
+Transits over a natal chart for a range of days:
+- Daily sidereal positions of the nine grahas (at 0h UT), cached per day and
+  shared by every user, since they do not depend on the birth chart
+- House of each transit counted from the natal Moon sign and the Lagna
+- Favourable houses from the Moon and Vedha (obstruction) by a planet in the
+  paired house, with the classical Sun-Saturn and Moon-Mercury exemptions
+
+The per-user part is a few NumPy operations on the day x planet matrix.
+"""
+
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+
+import numpy as np
+
+from backend.calculations import SIGNS, jd_to_datetime, sidereal_position
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+GOCHARA_PLANETS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]
+
+MAX_DAYS = 731
+
+# Favourable house from the Moon -> its Vedha house
+GOCHARA_VEDHA = {
+    "Sun": {3: 9, 6: 12, 10: 4, 11: 5},
+    "Moon": {1: 5, 3: 9, 6: 12, 7: 2, 10: 4, 11: 8},
+    "Mars": {3: 12, 6: 9, 11: 5},
+    "Mercury": {2: 5, 4: 3, 6: 9, 8: 1, 10: 8, 11: 12},
+    "Jupiter": {2: 12, 5: 4, 7: 3, 9: 10, 11: 8},
+    "Venus": {1: 8, 2: 7, 3: 1, 4: 10, 5: 9, 8: 5, 9: 11, 11: 6, 12: 3},
+    "Saturn": {3: 12, 6: 9, 11: 5},
+    "Rahu": {3: 12, 6: 9, 11: 5},
+    "Ketu": {3: 12, 6: 9, 11: 5},
+}
+
+# Pairs that never obstruct each other
+VEDHA_EXEMPT = {frozenset(("Sun", "Saturn")), frozenset(("Moon", "Mercury"))}
+
+# Cell codes of the status matrix
+STATUS_CODES = {"unfavourable": 0, "favourable": 1, "obstructed": -1}
+
+# Lookup tables indexed [planet, house 1-12]
+_FAVOURABLE = np.zeros((len(GOCHARA_PLANETS), 13), dtype=bool)
+_VEDHA_HOUSE = np.zeros((len(GOCHARA_PLANETS), 13), dtype=np.int8)
+for _p, _name in enumerate(GOCHARA_PLANETS):
+    for _house, _vedha in GOCHARA_VEDHA[_name].items():
+        _FAVOURABLE[_p, _house] = True
+        _VEDHA_HOUSE[_p, _house] = _vedha
+_CAN_OBSTRUCT = np.array([[a != b and frozenset((a, b)) not in VEDHA_EXEMPT
+                           for b in GOCHARA_PLANETS] for a in GOCHARA_PLANETS])
+
+
+# ---------------------------
+# SHARED DAILY POSITIONS
+# ---------------------------
+@lru_cache(maxsize=8192)
+def day_positions(day: int) -> Tuple[float, ...]:
+    """
+    Sidereal longitudes of GOCHARA_PLANETS at 0h UT of a day, given as the
+    integer Julian Day Number of that date. Shared by all users.
+    """
+    jd = day - 0.5
+    return tuple(sidereal_position(jd, planet)[0] for planet in GOCHARA_PLANETS)
+
+
+def transit_positions(jd_start: float, days: int) -> np.ndarray:
+    """(days x planets) array of daily sidereal longitudes from a 0h UT JD."""
+    first = int(jd_start + 0.5)
+    return np.array([day_positions(first + i) for i in range(days)])
+
+
+# ---------------------------
+# MAIN FUNCTION
+# ---------------------------
+def compute_gochara(moon_sign: str, asc_sign: str, jd_start: float, jd_end: float) -> Dict[str, Any]:
+    """
+    Day x planet Gochara matrix between two 0h UT Julian Days (end exclusive).
+
+    Returns:
+        Dictionary with the dates, planet order and matrices of transit
+        sign index (0-11), house from the Moon, house from the Lagna and
+        status (see STATUS_CODES), plus the obstructing planet per cell.
+    """
+    if moon_sign not in SIGNS or asc_sign not in SIGNS:
+        raise ValueError("Natal Moon sign and Lagna are required")
+    days = int(round(jd_end - jd_start))
+    if not 1 <= days <= MAX_DAYS:
+        raise ValueError(f"Range must cover 1 to {MAX_DAYS} days")
+
+    lons = transit_positions(jd_start, days)
+    signs = (lons // 30.0).astype(np.int8) % 12
+    from_moon = (signs - SIGNS.index(moon_sign)) % 12 + 1
+    from_lagna = (signs - SIGNS.index(asc_sign)) % 12 + 1
+
+    planet_idx = np.arange(len(GOCHARA_PLANETS))
+    favourable = _FAVOURABLE[planet_idx, from_moon]
+    vedha_house = _VEDHA_HOUSE[planet_idx, from_moon]
+    # blockers[d, p, q]: planet q sits in the Vedha house of planet p on day d
+    blockers = (from_moon[:, None, :] == vedha_house[:, :, None]) & _CAN_OBSTRUCT[None, :, :]
+    obstructed = favourable & blockers.any(axis=2)
+
+    status = np.where(obstructed, STATUS_CODES["obstructed"],
+                      np.where(favourable, STATUS_CODES["favourable"],
+                               STATUS_CODES["unfavourable"]))
+    first_blocker = blockers.argmax(axis=2)
+    vedha_by = [[GOCHARA_PLANETS[first_blocker[d, p]] if obstructed[d, p] else None
+                 for p in planet_idx] for d in range(days)]
+
+    return {
+        "dates": [jd_to_datetime(jd_start + i).date().isoformat() for i in range(days)],
+        "planets": GOCHARA_PLANETS,
+        "natal_moon_sign": moon_sign,
+        "natal_lagna": asc_sign,
+        "status_codes": STATUS_CODES,
+        "sign": signs.tolist(),
+        "house_from_moon": from_moon.tolist(),
+        "house_from_lagna": from_lagna.tolist(),
+        "status": status.tolist(),
+        "vedha_by": vedha_by,
+    }
@@ -0,0 +1,268 @@
+"""
+Horoscope Module
+Daily, weekly and monthly horoscopes for the 12 Moon signs:
+- Transits come from the shared Gochara day positions, counted from each
+  Moon sign (Chandra lagna) with favourable houses and Vedha
+- Each transit is weighted by the planet's dignity (strength_evaluator)
+- Transit yogas: Sade Sati, Ashtama and Kantaka Shani, Guru bala and
+  Chandrashtama
+- Scores per life area and an overall 1-5 rating with short texts
+
+All 12 results of a period are computed together once, stored in an
+in-process cache and served as-is until the period rolls over. A daemon
+thread rebuilds the cache at every local midnight.
+"""
+
+import hashlib
+import json
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, List, Tuple
+
+import pytz
+import swisseph as swe
+
+from backend.calculations import SIGNS
+from backend.gochara import GOCHARA_PLANETS, GOCHARA_VEDHA, STATUS_CODES, compute_gochara
+from backend.strength_evaluator import (
+    SCORE_DEBILITATED,
+    SCORE_ENEMY_SIGN,
+    SCORE_EXALTED,
+    SCORE_FRIEND_SIGN,
+    SCORE_OWN_SIGN,
+    get_sign_nature,
+)
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+HOROSCOPE_TZ = "Asia/Kolkata"
+PERIODS = ("daily", "weekly", "monthly")
+
+# Slow planets shape a period more than fast ones
+PLANET_WEIGHTS = {
+    "Sun": 1.0, "Moon": 1.0, "Mars": 1.0, "Mercury": 1.0, "Jupiter": 2.0,
+    "Venus": 1.0, "Saturn": 2.0, "Rahu": 0.5, "Ketu": 0.5,
+}
+
+# Karakas of each life area
+AREA_PLANETS = {
+    "career": ["Sun", "Saturn", "Mercury", "Jupiter"],
+    "finance": ["Jupiter", "Venus", "Mercury"],
+    "love": ["Venus", "Moon", "Jupiter"],
+    "health": ["Sun", "Mars", "Moon", "Saturn"],
+}
+
+DIGNITY_SCORES = {
+    "Exalted": SCORE_EXALTED,
+    "Own Sign": SCORE_OWN_SIGN,
+    "Friend Sign": SCORE_FRIEND_SIGN,
+    "Enemy Sign": SCORE_ENEMY_SIGN,
+    "Debilitated": SCORE_DEBILITATED,
+}
+
+RATING_WORDS = {1: "Challenging", 2: "Mixed", 3: "Steady", 4: "Good", 5: "Excellent"}
+PERIOD_WORDS = {"daily": "day", "weekly": "week", "monthly": "month"}
+
+SADE_SATI_HOUSES = {12: "Rising", 1: "Peak", 2: "Setting"}
+KANTAKA_HOUSES = {4, 7, 10}
+GURU_BALA_HOUSES = {2, 5, 7, 9, 11}
+
+
+# ---------------------------
+# PERIODS
+# ---------------------------
+def period_bounds(period: str, today: date) -> Tuple[str, date, date]:
+    """(period key, first day, day after the last) of the period containing today."""
+    if period == "daily":
+        return today.isoformat(), today, today + timedelta(days=1)
+    if period == "weekly":
+        start = today - timedelta(days=today.weekday())
+        year, week, _ = start.isocalendar()
+        return f"{year}-W{week:02d}", start, start + timedelta(days=7)
+    if period == "monthly":
+        start = today.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1)
+        return start.strftime("%Y-%m"), start, end
+    raise ValueError(f"period must be one of {list(PERIODS)}")
+
+
+def local_today() -> date:
+    return datetime.now(pytz.timezone(HOROSCOPE_TZ)).date()
+
+
+def rollover_at(end: date) -> datetime:
+    """Aware datetime of local midnight starting `end`."""
+    return pytz.timezone(HOROSCOPE_TZ).localize(datetime(end.year, end.month, end.day))
+
+
+# ---------------------------
+# SCORING
+# ---------------------------
+def _day_jd(d: date) -> float:
+    return swe.julday(d.year, d.month, d.day, 0.0, swe.GREG_CAL)
+
+
+def _rating(score: float) -> int:
+    """Map an average score in [-1, 1] to 1-5 stars."""
+    return max(1, min(5, int(round(3 + 2 * score))))
+
+
+def _signals(houses: Dict[str, List[int]], period: str) -> List[Dict[str, Any]]:
+    """Transit yogas present during the period (first day for slow planets)."""
+    signals = []
+    saturn = houses["Saturn"][0]
+    if saturn in SADE_SATI_HOUSES:
+        signals.append({"name": "Sade Sati", "phase": SADE_SATI_HOUSES[saturn],
+                        "effect": "negative", "text": "Saturn's Sade Sati asks for patience and discipline."})
+    elif saturn == 8:
+        signals.append({"name": "Ashtama Shani", "effect": "negative",
+                        "text": "Saturn in the 8th calls for caution with health and commitments."})
+    elif saturn in KANTAKA_HOUSES:
+        signals.append({"name": "Kantaka Shani", "effect": "negative",
+                        "text": "Saturn in a kendra from the Moon brings obstacles at work and home."})
+    if houses["Jupiter"][0] in GURU_BALA_HOUSES:
+        signals.append({"name": "Guru Bala", "effect": "positive",
+                        "text": "Jupiter's support favours growth, learning and auspicious beginnings."})
+    chandrashtama = sum(1 for h in houses["Moon"] if h == 8)
+    if chandrashtama and (period == "daily" or chandrashtama >= 2):
+        signals.append({"name": "Chandrashtama", "effect": "negative", "days": chandrashtama,
+                        "text": "The Moon transits the 8th; avoid major decisions on those days."})
+    return signals
+
+
+def _score_sign(matrix: Dict[str, Any], period: str) -> Dict[str, Any]:
+    days = len(matrix["dates"])
+    status = matrix["status"]
+    houses = {p: [matrix["house_from_moon"][d][i] for d in range(days)]
+              for i, p in enumerate(GOCHARA_PLANETS)}
+
+    # Per planet: mean status (+1 favourable, -1 unfavourable, 0 obstructed)
+    # scaled by dignity around a neutral 50, relative to the planet's
+    # average over all 12 houses (most planets favour only a few)
+    planet_scores = {}
+    for i, planet in enumerate(GOCHARA_PLANETS):
+        total = 0.0
+        for d in range(days):
+            code = status[d][i]
+            value = 1.0 if code == STATUS_CODES["favourable"] else (
+                -1.0 if code == STATUS_CODES["unfavourable"] else 0.0)
+            nature = get_sign_nature(planet, SIGNS[matrix["sign"][d][i]])
+            total += value * (0.5 + DIGNITY_SCORES.get(nature, 50) / 100.0)
+        baseline = (2 * len(GOCHARA_VEDHA[planet]) - 12) / 12.0
+        planet_scores[planet] = total / days - baseline
+
+    def weighted(planets: List[str]) -> float:
+        weight = sum(PLANET_WEIGHTS[p] for p in planets)
+        return sum(PLANET_WEIGHTS[p] * planet_scores[p] for p in planets) / weight
+
+    overall = weighted(GOCHARA_PLANETS)
+    signals = _signals(houses, period)
+    overall += 0.1 * sum(1 if s["effect"] == "positive" else -1 for s in signals)
+    rating = _rating(overall)
+
+    areas = {area: {"score": round(weighted(planets), 3), "rating": _rating(weighted(planets))}
+             for area, planets in AREA_PLANETS.items()}
+    best = max(areas, key=lambda a: areas[a]["score"])
+    worst = min(areas, key=lambda a: areas[a]["score"])
+    summary = (f"{RATING_WORDS[rating]} {PERIOD_WORDS[period]} ahead. "
+               f"Best supported: {best}; needs care: {worst}.")
+    if signals:
+        summary += " " + " ".join(s["text"] for s in signals)
+
+    return {
+        "rating": rating,
+        "score": round(overall, 3),
+        "areas": areas,
+        "signals": signals,
+        "transits": {p: {"house_from_moon": houses[p][0],
+                         "favourable_days": sum(1 for d in range(days)
+                                                if status[d][i] == STATUS_CODES["favourable"])}
+                     for i, p in enumerate(GOCHARA_PLANETS)},
+        "summary": summary,
+    }
+
+
+def build_period(period: str, today: date) -> Dict[str, Any]:
+    """All 12 Moon-sign horoscopes of the period containing `today`."""
+    key, start, end = period_bounds(period, today)
+    jd_start, jd_end = _day_jd(start), _day_jd(end)
+    signs = {}
+    for sign in SIGNS:
+        matrix = compute_gochara(sign, sign, jd_start, jd_end)
+        signs[sign] = {"sign": sign, **_score_sign(matrix, period)}
+    expires = rollover_at(end)
+    header = {
+        "period": period,
+        "key": key,
+        "start": start.isoformat(),
+        "end": (end - timedelta(days=1)).isoformat(),
+        "expires": expires.isoformat(),
+    }
+    # Response bodies are encoded once here, so serving one is a dict lookup
+    bodies = {sign: json.dumps({**header, **result}).encode("utf-8")
+              for sign, result in signs.items()}
+    bodies["all"] = json.dumps({**header, "signs": signs}).encode("utf-8")
+    return {
+        **header,
+        "expires_at": expires,
+        "etags": {part: '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+                  for part, body in bodies.items()},
+        "bodies": bodies,
+    }
+
+
+# ---------------------------
+# CACHE AND SCHEDULER
+# ---------------------------
+_store: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_store_lock = threading.Lock()
+
+
+def precompute(today: date) -> None:
+    """Build every period for `today` and drop entries that have rolled over."""
+    built = {}
+    for period in PERIODS:
+        key, _, _ = period_bounds(period, today)
+        with _store_lock:
+            if (period, key) in _store:
+                built[(period, key)] = _store[(period, key)]
+                continue
+        built[(period, key)] = build_period(period, today)
+    with _store_lock:
+        _store.clear()
+        _store.update(built)
+
+
+def get_period(period: str) -> Dict[str, Any]:
+    """The cached horoscopes of the current period (built on a cold miss)."""
+    today = local_today()
+    key, _, _ = period_bounds(period, today)
+    with _store_lock:
+        entry = _store.get((period, key))
+    if entry is None:
+        # Only add the missing entry; replacing the store is the scheduler's
+        # job, and a request from before midnight must not drop fresh entries
+        built = build_period(period, today)
+        with _store_lock:
+            entry = _store.setdefault((period, key), built)
+    return entry
+
+
+def _scheduler_loop() -> None:
+    while True:
+        today = local_today()
+        try:
+            precompute(today)
+        except Exception as e:
+            print(f"Horoscope precompute failed: {e}")
+        wait = (rollover_at(today + timedelta(days=1))
+                - datetime.now(pytz.timezone(HOROSCOPE_TZ))).total_seconds()
+        threading.Event().wait(max(1.0, wait + 1.0))
+
+
+def start_scheduler() -> threading.Thread:
+    """Precompute now and again after every local midnight, in a daemon thread."""
+    thread = threading.Thread(target=_scheduler_loop, name="horoscope-precompute", daemon=True)
+    thread.start()
+    return thread
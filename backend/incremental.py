@@ -0,0 +1,261 @@
+"""
+Incremental Chart Module
+Recomputes a chart after a small edit (birth time nudged by a few minutes,
+or a corrected birth place) by rebuilding only the sections whose inputs
+changed:
+- planets, panchang (nakshatra/tithi/karana/yoga) and Vimshottari dasha
+  depend on the birth instant only (positions are geocentric)
+- ascendant, whole-sign houses, D9/D10 charts depend on instant and place
+- sunrise/sunset depend on the local birth date and place only
+- the /compute extras: strengths depend on planets, ascendant and D9;
+  yogas on planets, whole-sign houses and ascendant sign; lucky factors
+  on the ascendant and Moon signs only
+
+A section is reused only when every input it depends on is bit-identical,
+so the result always equals a full compute_chart call.
+Time edits are not accelerated: every planet moves with the instant, so
+they reuse little more than sunrise/sunset and lucky factors and cost
+about as much as a full recompute. Place edits reuse most of the chart.
+Recent charts are kept in a small in-process cache addressed by chart_key,
+together with the extras computed for them.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+import swisseph as swe
+
+from backend.calculations import (
+    DEFAULT_PLANETS,
+    annotate_planets,
+    build_ascendant_data,
+    calculate_houses,
+    calculate_planets,
+    compute_panchang_sections,
+    compute_sunrise_sunset,
+    compute_varga_sections,
+    compute_vimshottari_timeline,
+    get_ayanamsha,
+    jd_to_local_datetime,
+    to_utc_julian_day,
+)
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+BIRTH_FIELDS = ("year", "month", "day", "hour", "minute", "second",
+                "tz", "lat", "lon", "planets", "topo_alt")
+
+CHART_CACHE_SIZE = 128
+
+SECTIONS = ["planets", "panchang", "vimshottari", "ascendant", "vargas", "sunrise"]
+DERIVED_SECTIONS = ["yogas", "strengths", "lucky_factors"]
+
+
+# ---------------------------
+# CHART CACHE
+# ---------------------------
+_chart_cache: "OrderedDict[str, Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def chart_key(birth: Dict[str, Any]) -> str:
+    """Stable key for a set of compute_chart arguments."""
+    payload = json.dumps([birth.get(f) for f in BIRTH_FIELDS])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def remember_chart(birth: Dict[str, Any], chart: Dict[str, Any],
+                   derived: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Store a chart with the arguments that produced it and the derived
+    sections (DERIVED_SECTIONS) computed for it; returns its key.
+    """
+    key = chart_key(birth)
+    with _cache_lock:
+        _chart_cache[key] = (dict(birth), chart, dict(derived or {}))
+        _chart_cache.move_to_end(key)
+        while len(_chart_cache) > CHART_CACHE_SIZE:
+            _chart_cache.popitem(last=False)
+    return key
+
+
+def cached_chart(key: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]:
+    """(birth arguments, chart, derived sections) for a key, or None if unknown or evicted."""
+    with _cache_lock:
+        entry = _chart_cache.get(key)
+        if entry is not None:
+            _chart_cache.move_to_end(key)
+        return entry
+
+
+# ---------------------------
+# HELPER FUNCTIONS
+# ---------------------------
+def apply_delta(birth: Dict[str, Any], minutes: int = 0, seconds: int = 0,
+                lat: Optional[float] = None, lon: Optional[float] = None) -> Dict[str, Any]:
+    """Shift the local birth time and/or replace the birth place."""
+    dt = datetime(birth["year"], birth["month"], birth["day"],
+                  birth["hour"], birth["minute"], birth["second"])
+    dt += timedelta(minutes=minutes, seconds=seconds)
+    new = dict(birth)
+    new.update(year=dt.year, month=dt.month, day=dt.day,
+               hour=dt.hour, minute=dt.minute, second=dt.second)
+    if lat is not None:
+        new["lat"] = lat
+    if lon is not None:
+        new["lon"] = lon
+    return new
+
+
+def _jd_now() -> float:
+    now = datetime.utcnow()
+    return swe.julday(now.year, now.month, now.day,
+                      now.hour + now.minute / 60.0 + now.second / 3600.0, swe.GREG_CAL)
+
+
+def _dasha_flags_valid(dasha: Dict[str, Any], jd_now: float) -> bool:
+    """
+    True if the is_current flags in a dasha timeline are still the ones a
+    fresh computation would set, i.e. now is inside the deepest period that
+    was marked current.
+    """
+    level: List[Dict[str, Any]] = dasha["timeline"]
+    deepest = None
+    while level:
+        marked = next((p for p in level if p["is_current"]), None)
+        if marked is None:
+            break
+        deepest = marked
+        level = marked.get("antar_dashas") or marked.get("pratyantar_dashas") or []
+    return deepest is not None and deepest["start_jd"] <= jd_now < deepest["end_jd"]
+
+
+# ---------------------------
+# MAIN RECOMPUTE FUNCTION
+# ---------------------------
+def recompute_chart(prev_birth: Dict[str, Any], prev_chart: Dict[str, Any],
+                    birth: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, List[str]]]:
+    """
+    Compute the chart for `birth`, reusing every section of `prev_chart`
+    (computed for `prev_birth`) whose inputs are unchanged.
+
+    Returns:
+        (chart, report) where chart equals compute_chart(**birth) and report
+        lists the "reused" and "recomputed" sections.
+    """
+    jd_ut, dt_utc = to_utc_julian_day(birth["year"], birth["month"], birth["day"],
+                                      birth["hour"], birth["minute"], birth["second"],
+                                      birth["tz"])
+    lat, lon = birth["lat"], birth["lon"]
+    topo_alt = birth.get("topo_alt") or 0.0
+    swe.set_topo(lon, lat, float(topo_alt))
+    ay = get_ayanamsha(jd_ut)
+
+    planets = birth.get("planets") or DEFAULT_PLANETS
+    same_instant = jd_ut == prev_chart["jd_ut"]
+    same_place = lat == prev_birth["lat"] and lon == prev_birth["lon"]
+    reused = set()
+
+    # Planets and everything derived from them alone
+    if same_instant and planets == (prev_birth.get("planets") or DEFAULT_PLANETS):
+        res_planets = prev_chart["planets"]
+        panchang = {k: prev_chart[k] for k in
+                    ("nakshatra_of_moon", "karana", "tithi", "nithya_yoga", "moon_sign")}
+        reused.update(("planets", "panchang"))
+    else:
+        res_planets = calculate_planets(jd_ut, ay, planets, lon, lat, topo_alt)
+        panchang = compute_panchang_sections(res_planets)
+
+    moon_sid = res_planets.get("Moon", {}).get("lon_sidereal_manual")
+    if "planets" in reused and (prev_chart["vimshottari"] is None
+                                or _dasha_flags_valid(prev_chart["vimshottari"], _jd_now())):
+        dasha = prev_chart["vimshottari"]
+        reused.add("vimshottari")
+    else:
+        dasha = compute_vimshottari_timeline(jd_ut, moon_sid) if moon_sid else None
+
+    # Ascendant and houses
+    if same_instant and same_place:
+        asc_sidereal = prev_chart["asc_sidereal"]
+        asc_sign = prev_chart["asc_sign"]
+        whole_sign_houses = prev_chart["whole_sign_houses"]
+        reused.add("ascendant")
+    else:
+        houses_data = calculate_houses(jd_ut, lat, lon, ay)
+        asc_sidereal = houses_data["asc_sidereal"]
+        asc_sign = houses_data["ascendant"]["sign"]
+        whole_sign_houses = houses_data["whole_sign_houses"]
+
+    # Vargas need both; reused planets were annotated when first computed
+    if "planets" in reused and "ascendant" in reused:
+        d9, d10 = prev_chart["d9"], prev_chart["d10"]
+        reused.add("vargas")
+    else:
+        d9, d10 = compute_varga_sections(asc_sidereal, res_planets)
+        if "planets" not in reused:
+            annotate_planets(res_planets, d9, d10)
+    if "ascendant" in reused:
+        ascendant_data = prev_chart["ascendant"]
+    else:
+        ascendant_data = build_ascendant_data(houses_data, d9, d10)
+
+    # Sunrise/sunset are searched from local midnight of the birth date
+    if (same_place and birth["tz"] == prev_birth["tz"]
+            and jd_to_local_datetime(jd_ut, birth["tz"]).date()
+            == jd_to_local_datetime(prev_chart["jd_ut"], prev_birth["tz"]).date()):
+        sun_data = {k: prev_chart[k] for k in ("sunrise", "sunset", "sunrise_jd", "sunset_jd")}
+        reused.add("sunrise")
+    else:
+        sun_data = compute_sunrise_sunset(jd_ut, lat, lon, birth["tz"])
+
+    chart = {
+        "jd_ut": jd_ut,
+        "utc_at_birth": dt_utc.isoformat(),
+        "ayanamsha_deg": ay,
+        "planets": res_planets,
+        "ascendant": ascendant_data,
+        "whole_sign_houses": whole_sign_houses,
+        "d9": d9,
+        "d10": d10,
+        "vimshottari": dasha,
+        "nakshatra_of_moon": panchang["nakshatra_of_moon"],
+        "karana": panchang["karana"],
+        "tithi": panchang["tithi"],
+        "nithya_yoga": panchang["nithya_yoga"],
+        "sunrise": sun_data.get("sunrise"),
+        "sunset": sun_data.get("sunset"),
+        "sunrise_jd": sun_data.get("sunrise_jd"),
+        "sunset_jd": sun_data.get("sunset_jd"),
+        "moon_sign": panchang["moon_sign"],
+        "asc_sidereal": asc_sidereal,
+        "asc_sign": asc_sign,
+    }
+    report = {
+        "reused": [s for s in SECTIONS if s in reused],
+        "recomputed": [s for s in SECTIONS if s not in reused],
+    }
+    return chart, report
+
+
+def reusable_derived(prev_chart: Dict[str, Any], prev_derived: Dict[str, Any],
+                     chart: Dict[str, Any], report: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    The derived sections of the previous chart that are still valid for
+    `chart` (as returned by recompute_chart with `report`).
+    """
+    reused = set(report["reused"])
+    valid = {
+        # Strengths read planets, the ascendant sign and the D9 placements
+        "strengths": "vargas" in reused,
+        "yogas": ("planets" in reused and chart["asc_sign"] == prev_chart["asc_sign"]
+                  and chart["whole_sign_houses"] == prev_chart["whole_sign_houses"]),
+        # The lagna lord follows from the ascendant sign
+        "lucky_factors": (chart["asc_sign"] == prev_chart["asc_sign"]
+                          and chart["moon_sign"] == prev_chart["moon_sign"]),
+    }
+    return {s: prev_derived[s] for s in DERIVED_SECTIONS if valid[s] and s in prev_derived}
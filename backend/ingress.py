@@ -0,0 +1,264 @@
+"""
+Ingress Module
+Finds the moments a planet enters a new sign, nakshatra or pada:
+- Coarse scan with per-planet step sizes bounded by each planet's maximum speed
+- Stations inside a step split it into monotonic pieces, so retrograde
+  re-entries into a previous sign/nakshatra are reported too
+- Each bracketed crossing is refined by bisection (Newton-accelerated with
+  the ephemeris speed, falling back to plain bisection near stations)
+"""
+
+import math
+from typing import Dict, Any, List, Iterable, Optional, Callable, Tuple
+
+from backend.calculations import (
+    SIGNS,
+    compute_nakshatra_pada,
+    jd_to_datetime,
+    normalize_deg,
+    sidereal_position,
+)
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+PADA_SIZE = 360.0 / 108.0
+NAKSHATRA_SIZE = 360.0 / 27.0
+SIGN_SIZE = 30.0
+
+INGRESS_KINDS = ("sign", "nakshatra", "pada")
+
+# Maximum |speed| (deg/day, sidereal) and coarse scan step (days) per planet.
+# Steps keep at most one station per step (Mercury stations are >= ~20 days
+# apart); the nodes wobble, so they get a short step.
+PLANET_MOTION = {
+    "Sun": {"max_speed": 1.03, "step": 5.0},
+    "Moon": {"max_speed": 15.5, "step": 1.0},
+    "Mercury": {"max_speed": 2.25, "step": 2.0},
+    "Venus": {"max_speed": 1.3, "step": 4.0},
+    "Mars": {"max_speed": 0.82, "step": 5.0},
+    "Jupiter": {"max_speed": 0.26, "step": 10.0},
+    "Saturn": {"max_speed": 0.14, "step": 10.0},
+    "Rahu": {"max_speed": 0.27, "step": 0.5},
+    "Ketu": {"max_speed": 0.27, "step": 0.5},
+}
+
+# Refinement tolerance in days (~1 second)
+DEFAULT_TOLERANCE = 1e-5
+
+# position(jd) -> (longitude, speed or None)
+PositionFn = Callable[[float], Tuple[float, Optional[float]]]
+
+
+# ---------------------------
+# HELPER FUNCTIONS
+# ---------------------------
+def _wrap180(d: float) -> float:
+    """Wrap an angle difference to [-180, 180)."""
+    return (d + 180.0) % 360.0 - 180.0
+
+
+def _grid_width(kinds: Iterable[str]) -> float:
+    """Coarsest boundary grid that still contains every requested kind."""
+    kinds = set(kinds)
+    if kinds == {"sign"}:
+        return SIGN_SIZE
+    if kinds == {"nakshatra"}:
+        return NAKSHATRA_SIZE
+    return PADA_SIZE
+
+
+def boundary_kinds(boundary_deg: float) -> List[str]:
+    """Which divisions (sign/nakshatra/pada) start at a boundary longitude."""
+    pada_idx = int(round(normalize_deg(boundary_deg) / PADA_SIZE)) % 108
+    kinds = ["pada"]
+    if pada_idx % 4 == 0:
+        kinds.append("nakshatra")
+    if pada_idx % 9 == 0:
+        kinds.append("sign")
+    return kinds
+
+
+def find_station_time(planet: str, t0: float, t1: float, speed0: float,
+                      tol: float = 1e-4) -> float:
+    """Bisect on the speed sign to locate a station between t0 and t1."""
+    lo, hi = t0, t1
+    neg0 = speed0 < 0
+    while hi - lo > tol:
+        mid = 0.5 * (lo + hi)
+        if (sidereal_position(mid, planet)[1] < 0) == neg0:
+            lo = mid
+        else:
+            hi = mid
+    return 0.5 * (lo + hi)
+
+
+def refine_crossing(position: PositionFn, boundary: float, lo: float, hi: float,
+                    retrograde: bool, guess: Optional[float] = None,
+                    tol: float = DEFAULT_TOLERANCE) -> float:
+    """
+    Find the time `position` crosses `boundary` inside the bracket [lo, hi].
+    Newton steps using the returned speed are taken while they stay inside
+    the bracket; otherwise (or when no speed is given) the bracket is bisected.
+    """
+    t = guess if guess is not None and lo < guess < hi else 0.5 * (lo + hi)
+    while hi - lo > tol:
+        lon, speed = position(t)
+        g = _wrap180(lon - boundary)
+        # Before the crossing g < 0 for direct motion, g >= 0 for retrograde
+        if (g < 0) != retrograde:
+            lo = t
+        else:
+            hi = t
+
+        newton = t - g / speed if speed else None
+        if newton is not None and lo <= newton <= hi:
+            if abs(g / speed) < tol:
+                return newton
+            if lo < newton < hi:
+                t = newton
+                continue
+        t = 0.5 * (lo + hi)
+    return 0.5 * (lo + hi)
+
+
+def _make_event(planet: str, jd: float, boundary: float, retrograde: bool) -> Dict[str, Any]:
+    """Describe a crossing, including the sign/nakshatra/pada being entered."""
+    boundary = normalize_deg(boundary)
+    # A hair inside the division being entered
+    entered = normalize_deg(boundary - 1e-6 if retrograde else boundary + 1e-6)
+    nak = compute_nakshatra_pada(entered)
+    return {
+        "planet": planet,
+        "jd": jd,
+        "utc": jd_to_datetime(jd).isoformat(),
+        "kinds": boundary_kinds(boundary),
+        "boundary_deg": round(boundary, 6),
+        "retrograde": retrograde,
+        "sign": SIGNS[int(entered // 30) % 12],
+        "nakshatra": nak["nakshatra"],
+        "nakshatra_index": nak["nakshatra_index"],
+        "pada": nak["pada"],
+    }
+
+
+def crossings_in_piece(position: PositionFn, t0: float, lon0: float, t1: float,
+                       lon1: float, width: float,
+                       tol: float = DEFAULT_TOLERANCE) -> List[Tuple[float, float, bool]]:
+    """
+    All crossings of multiples of `width` on an interval where the motion is
+    monotonic, as time-ordered (jd, boundary, retrograde) tuples.
+    """
+    delta = _wrap180(lon1 - lon0)
+    i0 = math.floor(lon0 / width)
+    i1 = math.floor((lon0 + delta) / width)
+    if i0 == i1:
+        return []
+
+    retrograde = delta < 0
+    ks = range(i0, i1, -1) if retrograde else range(i0 + 1, i1 + 1)
+
+    crossings = []
+    lo = t0
+    for k in ks:
+        boundary = k * width
+        # Linear first guess from the unwrapped motion across the piece
+        guess = t0 + (boundary - lon0) / delta * (t1 - t0)
+        jd = refine_crossing(position, boundary, lo, t1, retrograde, guess, tol)
+        crossings.append((jd, boundary, retrograde))
+        # Boundaries within a monotonic piece are crossed in order
+        lo = jd
+    return crossings
+
+
+def label_segments(position: PositionFn, width: float, start: float, end: float,
+                   step: float) -> List[Tuple[float, float, int]]:
+    """
+    Split [start, end] into (start, end, index) pieces where
+    index = floor(position / width) is constant. `position` must be
+    monotonic within each step (true for the Moon, Moon-Sun elongation and
+    the ascendant at any step; for planets, split at stations first).
+    """
+    divisions = int(round(360.0 / width))
+    lon0, _ = position(start)
+    idx = int(math.floor(lon0 / width)) % divisions
+
+    segments = []
+    seg_start = t0 = start
+    while t0 < end:
+        t1 = min(t0 + step, end)
+        lon1, _ = position(t1)
+        for jd, boundary, retro in crossings_in_piece(position, t0, lon0, t1, lon1, width):
+            segments.append((seg_start, jd, idx))
+            seg_start = jd
+            entered = boundary - width / 2 if retro else boundary + width / 2
+            idx = int(math.floor(normalize_deg(entered) / width)) % divisions
+        t0, lon0 = t1, lon1
+    segments.append((seg_start, end, idx))
+    return segments
+
+
+# ---------------------------
+# MAIN SEARCH FUNCTIONS
+# ---------------------------
+def find_ingresses(planet: str, jd_start: float, jd_end: float,
+                   kinds: Iterable[str] = INGRESS_KINDS,
+                   tol: float = DEFAULT_TOLERANCE) -> List[Dict[str, Any]]:
+    """
+    Find every sign/nakshatra/pada ingress of a planet between two Julian Days.
+
+    Args:
+        planet: One of PLANET_MOTION's keys
+        jd_start, jd_end: Search window (UT)
+        kinds: Subset of ("sign", "nakshatra", "pada") to report
+        tol: Time tolerance in days
+
+    Returns:
+        Time-ordered list of ingress events. Each event lists every kind
+        whose boundary was crossed and the sign/nakshatra/pada entered.
+    """
+    kinds = set(kinds)
+    unknown = kinds - set(INGRESS_KINDS)
+    if unknown:
+        raise ValueError(f"Unknown ingress kinds: {sorted(unknown)}")
+    if planet not in PLANET_MOTION:
+        raise ValueError(f"Unsupported planet: {planet}")
+
+    motion = PLANET_MOTION[planet]
+    # Keep the per-step motion well below 180 deg so it unwraps unambiguously
+    step = min(motion["step"], 90.0 / motion["max_speed"])
+    width = _grid_width(kinds)
+
+    def position(t: float) -> Tuple[float, float]:
+        return sidereal_position(t, planet)
+
+    events: List[Dict[str, Any]] = []
+    t0 = jd_start
+    lon0, sp0 = sidereal_position(t0, planet)
+    while t0 < jd_end:
+        t1 = min(t0 + step, jd_end)
+        lon1, sp1 = sidereal_position(t1, planet)
+
+        if (sp0 < 0) != (sp1 < 0):
+            # Station inside the step: split into two monotonic pieces
+            ts = find_station_time(planet, t0, t1, sp0)
+            lons, _ = sidereal_position(ts, planet)
+            pieces = [(t0, lon0, ts, lons), (ts, lons, t1, lon1)]
+        else:
+            pieces = [(t0, lon0, t1, lon1)]
+
+        for a, lon_a, b, lon_b in pieces:
+            for jd, boundary, retro in crossings_in_piece(position, a, lon_a, b, lon_b, width, tol):
+                events.append(_make_event(planet, jd, boundary, retro))
+
+        t0, lon0, sp0 = t1, lon1, sp1
+
+    return [e for e in events if kinds.intersection(e["kinds"])]
+
+
+def find_all_ingresses(jd_start: float, jd_end: float,
+                       planets: Optional[List[str]] = None,
+                       kinds: Iterable[str] = INGRESS_KINDS) -> Dict[str, List[Dict[str, Any]]]:
+    """Run find_ingresses for several planets over the same window."""
+    planets = planets or list(PLANET_MOTION.keys())
+    return {p: find_ingresses(p, jd_start, jd_end, kinds) for p in planets}
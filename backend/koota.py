@@ -0,0 +1,137 @@
+"""
+Koota Module
+Precomputed Ashta Koota compatibility for every Moon position pair:
+- The Moon's pada (0-107) fixes both its nakshatra and its sign, and
+  compute_ashta_koota reads nothing else, so there are only 108 x 108
+  groom/bride combinations (36 x 36 distinct nakshatra-sign pairs)
+- All of them are scored once at import with compute_ashta_koota itself;
+  a match is then a table lookup
+- KOOTA_SCORES (108 x 108 x 8) and KOOTA_TOTALS (108 x 108) hold the per
+  koota and total scores as NumPy arrays for bulk scoring, with boolean
+  NADI_DOSHA and BHAKOOT_DOSHA tables for filtering
+- birth_moon computes only the Moon's sidereal longitude for a birth, the
+  fast path for matching without full charts
+"""
+
+from typing import Dict, Any
+
+import numpy as np
+
+from backend.calculations import (
+    NAKSHATRA_NAMES,
+    SIGNS,
+    SIGN_LORDS_MAP,
+    compute_ashta_koota,
+    compute_nakshatra_pada,
+    deg_to_sign_and_degree,
+    normalize_deg,
+    sidereal_position,
+    to_utc_julian_day,
+)
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+PADA_COUNT = 108
+PADA_SIZE = 360.0 / PADA_COUNT
+
+KOOTA_NAMES = ["Varna", "Vashya", "Tara", "Yoni", "Graha Maitri", "Gana", "Rashi", "Nadi"]
+
+# Bhakoot dosha: Moon signs 2/12, 5/9 or 6/8 apart, unless both share a lord
+BHAKOOT_DOSHA_DISTANCES = {2, 12, 5, 9, 6, 8}
+
+
+# ---------------------------
+# TABLE CONSTRUCTION
+# ---------------------------
+def pada_nakshatra(pada: int) -> int:
+    return pada // 4
+
+
+def pada_sign(pada: int) -> int:
+    return pada // 9
+
+
+def _moon_only_chart(nak: int, sign: int) -> Dict[str, Any]:
+    """The part of a chart compute_ashta_koota reads."""
+    return {
+        "moon_sign": SIGNS[sign],
+        "planets": {"Moon": {"nakshatra": {"nakshatra": NAKSHATRA_NAMES[nak], "nakshatra_index": nak}}},
+    }
+
+
+def _build_tables():
+    units = []      # distinct (nakshatra, sign)
+    pada_unit = []  # pada -> index into units
+    for pada in range(PADA_COUNT):
+        unit = (pada_nakshatra(pada), pada_sign(pada))
+        if unit not in units:
+            units.append(unit)
+        pada_unit.append(units.index(unit))
+
+    charts = [_moon_only_chart(nak, sign) for nak, sign in units]
+    results = [[compute_ashta_koota(groom, bride) for bride in charts] for groom in charts]
+
+    unit_scores = np.array([[[k.get("score", 0) for k in results[g][b]["kootas"]]
+                             for b in range(len(units))] for g in range(len(units))], dtype=np.float32)
+    idx = np.array(pada_unit)
+    scores = unit_scores[idx[:, None], idx[None, :]]
+    return pada_unit, results, scores
+
+
+def _bhakoot_dosha(groom_sign: int, bride_sign: int) -> bool:
+    distance = (bride_sign - groom_sign) % 12 + 1
+    return (distance in BHAKOOT_DOSHA_DISTANCES
+            and SIGN_LORDS_MAP[SIGNS[groom_sign]] != SIGN_LORDS_MAP[SIGNS[bride_sign]])
+
+
+_PADA_UNIT, _UNIT_RESULTS, KOOTA_SCORES = _build_tables()
+KOOTA_TOTALS = KOOTA_SCORES.sum(axis=2)
+NADI_DOSHA = KOOTA_SCORES[:, :, KOOTA_NAMES.index("Nadi")] == 0
+BHAKOOT_DOSHA = np.array([[_bhakoot_dosha(pada_sign(g), pada_sign(b)) for b in range(PADA_COUNT)]
+                          for g in range(PADA_COUNT)])
+
+
+# ---------------------------
+# LOOKUPS
+# ---------------------------
+def moon_pada(moon_sidereal_lon: float) -> int:
+    """Pada index 0-107 of a sidereal Moon longitude."""
+    return int(normalize_deg(moon_sidereal_lon) // PADA_SIZE) % PADA_COUNT
+
+
+def chart_moon_pada(chart: Dict[str, Any]) -> int:
+    moon = chart.get("planets", {}).get("Moon", {})
+    if moon.get("lon_sidereal_manual") is None:
+        raise ValueError("The chart has no Moon position")
+    return moon_pada(moon["lon_sidereal_manual"])
+
+
+def koota_match(groom_pada: int, bride_pada: int) -> Dict[str, Any]:
+    """
+    compute_ashta_koota result for two Moon padas. Precomputed and shared;
+    the returned dict must not be mutated.
+    """
+    return _UNIT_RESULTS[_PADA_UNIT[groom_pada]][_PADA_UNIT[bride_pada]]
+
+
+# ---------------------------
+# MOON-ONLY FAST PATH
+# ---------------------------
+def birth_moon(year: int, month: int, day: int, hour: int, minute: int, second: int,
+               tz: str, **_) -> Dict[str, Any]:
+    """
+    The Moon's sidereal (Lahiri) longitude, sign, nakshatra and pada at a
+    birth, with the same convention as compute_chart's moon_sign and
+    nakshatra_of_moon. Place is not needed (geocentric Moon).
+    """
+    jd_ut, _ = to_utc_julian_day(year, month, day, hour, minute, second, tz)
+    lon, _ = sidereal_position(jd_ut, "Moon")
+    sign, _ = deg_to_sign_and_degree(lon)
+    return {
+        "jd_ut": jd_ut,
+        "moon_longitude": lon,
+        "moon_sign": sign,
+        "nakshatra_of_moon": compute_nakshatra_pada(lon),
+        "pada_index": moon_pada(lon),
+    }
@@ -0,0 +1,148 @@
+"""
+KP Module
+Krishnamurti Paddhati star, sub and sub-sub lords:
+- Each nakshatra (13 deg 20') is split into 9 subs in Vimshottari order,
+  starting from the nakshatra lord, in proportion to the dasha years
+- Subs crossing a sign boundary are split in two, giving the classic
+  249-row KP table; each sub is split again into 9 sub-subs
+- Tables are built once at import as sorted boundary arrays, so a lookup
+  is one bisect (O(log n)); kp_lords_array does the same for NumPy batches
+- compute_kp_chart gives the lords of every planet and KP cusp of a chart
+"""
+
+from bisect import bisect_right
+from typing import Dict, Any, List, Tuple
+
+import numpy as np
+
+from backend.bhava import compute_bhavas
+from backend.calculations import (
+    NAKSHATRA_LORDS,
+    SIGNS,
+    SIGN_LORDS_MAP,
+    VIMSHOTTARI_ORDER,
+    VIMSHOTTARI_YEARS,
+    get_ayanamsha,
+    normalize_deg,
+)
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+NAKSHATRA_SIZE = 360.0 / 27.0
+DASHA_CYCLE_YEARS = 120.0
+
+
+# ---------------------------
+# TABLE CONSTRUCTION
+# ---------------------------
+def _divide(start: float, size: float, first_lord: str) -> List[Tuple[float, str]]:
+    """Split [start, start + size) into 9 Vimshottari parts from first_lord."""
+    idx = VIMSHOTTARI_ORDER.index(first_lord)
+    parts = []
+    elapsed = 0.0
+    for i in range(9):
+        lord = VIMSHOTTARI_ORDER[(idx + i) % 9]
+        parts.append((start + size * elapsed / DASHA_CYCLE_YEARS, lord))
+        elapsed += VIMSHOTTARI_YEARS[lord]
+    return parts
+
+
+def _build_tables():
+    subs = []      # (start, end, star_lord, sub_lord)
+    sub_subs = []  # (start, sub_sub_lord)
+    for nak in range(27):
+        star_lord = NAKSHATRA_LORDS[nak]
+        nak_start = nak * NAKSHATRA_SIZE
+        parts = _divide(nak_start, NAKSHATRA_SIZE, star_lord)
+        for i, (start, sub_lord) in enumerate(parts):
+            end = parts[i + 1][0] if i < 8 else nak_start + NAKSHATRA_SIZE
+            subs.append((start, end, star_lord, sub_lord))
+            sub_subs.extend(_divide(start, end - start, sub_lord))
+
+    # Split subs at sign boundaries -> the 249 numbered KP divisions
+    rows = []
+    for start, end, star_lord, sub_lord in subs:
+        cuts = [start]
+        boundary = (int(start // 30.0) + 1) * 30.0
+        if start < boundary < end - 1e-9:
+            cuts.append(boundary)
+        cuts.append(end)
+        for a, b in zip(cuts, cuts[1:]):
+            rows.append((a, b, SIGNS[int(a // 30.0) % 12], star_lord, sub_lord))
+    return rows, sub_subs
+
+
+KP_TABLE, _SUB_SUBS = _build_tables()
+KP_STARTS = [row[0] for row in KP_TABLE]
+# The 243 points where the sub lord changes (every 9th also changes the star)
+SUB_STARTS = [row[0] for i, row in enumerate(KP_TABLE)
+              if i == 0 or KP_TABLE[i - 1][3:] != row[3:]]
+SUB_SUB_STARTS = [s for s, _ in _SUB_SUBS]
+SUB_SUB_LORDS = [lord for _, lord in _SUB_SUBS]
+
+# NumPy views for batch lookups
+_KP_STARTS_ARR = np.array(KP_STARTS)
+_SUB_SUB_STARTS_ARR = np.array(SUB_SUB_STARTS)
+_STAR_LORDS = np.array([row[3] for row in KP_TABLE], dtype=object)
+_SUB_LORDS = np.array([row[4] for row in KP_TABLE], dtype=object)
+_SIGN_NAMES = np.array([row[2] for row in KP_TABLE], dtype=object)
+_SUB_SUB_LORDS_ARR = np.array(SUB_SUB_LORDS, dtype=object)
+
+
+# ---------------------------
+# LOOKUPS
+# ---------------------------
+def kp_lords(lon_sidereal: float) -> Dict[str, Any]:
+    """Sign, star, sub and sub-sub lords of a sidereal longitude."""
+    lon = normalize_deg(lon_sidereal)
+    i = bisect_right(KP_STARTS, lon) - 1
+    start, end, sign, star_lord, sub_lord = KP_TABLE[i]
+    j = bisect_right(SUB_SUB_STARTS, lon) - 1
+    return {
+        "kp_number": i + 1,
+        "sign": sign,
+        "sign_lord": SIGN_LORDS_MAP[sign],
+        "star_lord": star_lord,
+        "sub_lord": sub_lord,
+        "sub_sub_lord": SUB_SUB_LORDS[j],
+    }
+
+
+def kp_lords_array(lons) -> Dict[str, np.ndarray]:
+    """Vectorized kp_lords for an array of sidereal longitudes."""
+    lons = np.mod(np.asarray(lons, dtype=float), 360.0)
+    i = np.searchsorted(_KP_STARTS_ARR, lons, side="right") - 1
+    j = np.searchsorted(_SUB_SUB_STARTS_ARR, lons, side="right") - 1
+    return {
+        "kp_number": i + 1,
+        "sign": _SIGN_NAMES[i],
+        "star_lord": _STAR_LORDS[i],
+        "sub_lord": _SUB_LORDS[i],
+        "sub_sub_lord": _SUB_SUB_LORDS_ARR[j],
+    }
+
+
+# ---------------------------
+# CHART SECTION
+# ---------------------------
+def compute_kp_chart(jd_ut: float, lat: float, lon: float,
+                     res_planets: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    KP lords of every planet and of the 12 KP (Placidus) cusps, using the
+    Krishnamurti ayanamsha on the chart's tropical positions.
+    """
+    ay = get_ayanamsha(jd_ut, "krishnamurti")
+    planets = {}
+    for name, pdata in res_planets.items():
+        if "lon_tropical" in pdata:
+            lon_kp = normalize_deg(pdata["lon_tropical"] - ay)
+            planets[name] = {"longitude": lon_kp, **kp_lords(lon_kp)}
+
+    bhava = compute_bhavas(jd_ut, lat, lon, res_planets, ["kp"])["kp"]
+    if "error" in bhava:
+        cusps = bhava
+    else:
+        cusps = [{"house": i + 1, "longitude": c, **kp_lords(c)}
+                 for i, c in enumerate(bhava["cusps"])]
+    return {"ayanamsha_deg": ay, "planets": planets, "cusps": cusps}
@@ -0,0 +1,145 @@
+"""
+Lagna Module
+Rise times of the sidereal ascendant for a place and civil day:
+- Start/end of each of the 12 lagna signs
+- Navamsa (D9) lagna boundaries, every 3°20' of the ascendant
+
+Boundaries are solved by root-finding on the ascendant longitude and cached
+per location-day, so election and rectification tools share one table.
+Inside the polar circles the ascendant stalls, runs backwards and jumps by
+180°, so tables (and rectification scans) are refused there.
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
+
+import swisseph as swe
+
+from backend.calculations import (
+    SIGNS,
+    get_ayanamsha,
+    jd_to_local_datetime,
+    local_midnight_jd,
+    navamsa_sign_num,
+    normalize_deg,
+)
+from backend.ingress import PositionFn, label_segments
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+NAVAMSA_SIZE = 30.0 / 9.0
+
+# Scan step (days); the ascendant only increases, so several boundaries
+# inside one step are all found
+LAGNA_STEP = 1.0 / 96.0  # 15 minutes
+
+COORD_PRECISION = 2
+
+
+# ---------------------------
+# ASCENDANT
+# ---------------------------
+def inside_polar_circle(lat: float, jd_ut: float) -> bool:
+    """True where some ecliptic degrees never rise (|lat| >= 90° - obliquity)."""
+    eps = swe.calc_ut(jd_ut, swe.ECL_NUT)[0][0]
+    return abs(lat) >= 90.0 - eps
+
+
+def check_lagna_latitude(lat: float, jd_ut: float) -> None:
+    """Raise ValueError inside the polar circles, where lagnas do not rise in order."""
+    if inside_polar_circle(lat, jd_ut):
+        raise ValueError(f"Latitude {lat} is inside the polar circle; "
+                         "the ascendant does not rise through the signs in order there")
+
+
+def ascendant_position(lat: float, lon: float) -> PositionFn:
+    """
+    Sidereal ascendant (same convention as calculate_houses) and its speed.
+    The ascendant does not depend on the house system; Porphyry is used
+    because Placidus raises inside the polar circles.
+    """
+    def position(t: float) -> Tuple[float, float]:
+        _, ascmc, _, ascmc_speed = swe.houses_ex2(t, lat, lon, b'O')
+        asc = normalize_deg(float(ascmc[0]) - get_ayanamsha(t))
+        return asc, float(ascmc_speed[0])
+    return position
+
+
+def navamsa_of_division(index: int) -> int:
+    """D9 sign number (1-12) for navamsa division 0-107 of the zodiac."""
+    d1_sign = index // 9 + 1
+    return navamsa_sign_num(d1_sign, (index % 9 + 0.5) * NAVAMSA_SIZE)
+
+
+# ---------------------------
+# MAIN TABLE FUNCTION
+# ---------------------------
+def _segments(rows: List[Tuple[float, float, int]], tz_name: str,
+              day_start: float, day_end: float, name_of) -> List[Dict[str, Any]]:
+    return [{
+        "sign": name_of(idx),
+        "start_jd": a,
+        "end_jd": b,
+        "start": jd_to_local_datetime(a, tz_name).isoformat(),
+        "end": jd_to_local_datetime(b, tz_name).isoformat(),
+        "duration_minutes": round((b - a) * 1440.0, 2),
+        # Cut by local midnight, so the real rise/set lies outside this day
+        "partial": a == day_start or b == day_end,
+    } for a, b, idx in rows]
+
+
+@lru_cache(maxsize=2048)
+def _lagna_table_cached(year: int, month: int, day: int,
+                        lat: float, lon: float, tz_name: str) -> Dict[str, Any]:
+    jd_start = local_midnight_jd(year, month, day, tz_name)
+    nxt = date(year, month, day) + timedelta(days=1)
+    jd_end = local_midnight_jd(nxt.year, nxt.month, nxt.day, tz_name)
+    check_lagna_latitude(lat, jd_start)
+
+    # One navamsa scan gives the sign boundaries too (every 9th division)
+    position = ascendant_position(lat, lon)
+    d9_rows = label_segments(position, NAVAMSA_SIZE, jd_start, jd_end, LAGNA_STEP)
+
+    sign_rows: List[Tuple[float, float, int]] = []
+    for a, b, idx in d9_rows:
+        sign_idx = idx // 9
+        if sign_rows and sign_rows[-1][2] == sign_idx:
+            sign_rows[-1] = (sign_rows[-1][0], b, sign_idx)
+        else:
+            sign_rows.append((a, b, sign_idx))
+
+    return {
+        "date": date(year, month, day).isoformat(),
+        "lat": lat,
+        "lon": lon,
+        "tz": tz_name,
+        "start_jd": jd_start,
+        "end_jd": jd_end,
+        "lagnas": _segments(sign_rows, tz_name, jd_start, jd_end, lambda i: SIGNS[i]),
+        "navamsa_lagnas": [
+            {**seg, "d1_sign": SIGNS[idx // 9], "navamsa": idx % 9 + 1}
+            for seg, (_, _, idx) in zip(
+                _segments(d9_rows, tz_name, jd_start, jd_end,
+                          lambda i: SIGNS[navamsa_of_division(i) - 1]),
+                d9_rows)
+        ],
+    }
+
+
+def compute_lagna_table(year: int, month: int, day: int,
+                        lat: float, lon: float, tz_name: str) -> Dict[str, Any]:
+    """
+    Lagna and navamsa-lagna rise/set times for a local civil day.
+
+    Results are cached per (date, rounded lat/lon, tz). The returned dict is
+    shared between callers and must not be mutated. Raises ValueError
+    inside the polar circles.
+    """
+    return _lagna_table_cached(
+        year, month, day,
+        round(float(lat), COORD_PRECISION),
+        round(float(lon), COORD_PRECISION),
+        tz_name
+    )
@@ -0,0 +1,274 @@
+"""
+Muhurta Module
+Searches a date range for windows that satisfy a set of panchang constraints
+(paksha, weekday, tithi, nakshatra, Rahu Kalam/Yamaganda/Gulika, lagna).
+
+Instead of evaluating a chart every minute, each constraint is turned into
+an interval set from its transition times and intersected with the
+surviving candidates. Constraints are applied from the slowest-changing
+(paksha) to the fastest (lagna), so the expensive fast searches only run
+inside the few hours that are still possible.
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Any, List, Optional, Callable, Tuple, Iterable
+
+from backend.calculations import (
+    SIGNS,
+    NAKSHATRA_NAMES,
+    TITHI_NAMES,
+    jd_to_local_datetime,
+    local_midnight_jd,
+    normalize_deg,
+    sidereal_position,
+)
+from backend.day_divisions import WEEKDAY_NAMES, compute_day_divisions
+from backend.ingress import label_segments
+from backend.lagna import compute_lagna_table
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+PAKSHAS = ["Shukla", "Krishna"]
+
+# Rikta tithis (Chaturthi, Navami, Chaturdashi) of both pakshas, 1-based
+RIKTA_TITHIS = {4, 9, 14, 19, 24, 29}
+
+LAGNA_GROUPS = {
+    "movable": ["Aries", "Cancer", "Libra", "Capricorn"],
+    "fixed": ["Taurus", "Leo", "Scorpio", "Aquarius"],
+    "dual": ["Gemini", "Virgo", "Sagittarius", "Pisces"],
+}
+
+KALAM_KEYS = ("rahu_kalam", "yamaganda", "gulika_kalam")
+
+# Scan steps (days). The searched quantities only increase, so a step may
+# cross several boundaries; label_segments finds all of them.
+ELONGATION_STEP = 0.5
+MOON_STEP = 0.5
+
+MAX_DAYS = 180
+
+
+# ---------------------------
+# POSITION FUNCTIONS
+# ---------------------------
+def _elongation(t: float) -> Tuple[float, float]:
+    """Moon - Sun sidereal elongation and its rate (tithi driver)."""
+    moon, moon_speed = sidereal_position(t, "Moon")
+    sun, sun_speed = sidereal_position(t, "Sun")
+    return normalize_deg(moon - sun), moon_speed - sun_speed
+
+
+def _moon(t: float) -> Tuple[float, float]:
+    return sidereal_position(t, "Moon")
+
+
+# ---------------------------
+# INTERVAL HELPERS
+# ---------------------------
+def _restrict(intervals: List[Dict[str, Any]],
+              pieces_for: Callable[[float, float], Iterable[Tuple[float, float, Any]]],
+              accept: Callable[[Any], bool], label_key: str,
+              label: Callable[[Any], Any]) -> List[Dict[str, Any]]:
+    """Keep the parts of each interval whose piece label is accepted."""
+    result = []
+    for iv in intervals:
+        for a, b, key in pieces_for(iv["start"], iv["end"]):
+            a, b = max(a, iv["start"]), min(b, iv["end"])
+            if b > a and accept(key):
+                result.append({"start": a, "end": b,
+                               "labels": {**iv["labels"], label_key: label(key)}})
+    return result
+
+
+def _subtract(intervals: List[Dict[str, Any]],
+              blocked: List[Tuple[float, float]]) -> List[Dict[str, Any]]:
+    """Remove blocked (start, end) spans from the intervals."""
+    blocked = sorted(blocked)
+    result = []
+    for iv in intervals:
+        cursor = iv["start"]
+        for a, b in blocked:
+            if b <= cursor or a >= iv["end"]:
+                continue
+            if a > cursor:
+                result.append({"start": cursor, "end": a, "labels": iv["labels"]})
+            cursor = max(cursor, b)
+        if cursor < iv["end"]:
+            result.append({"start": cursor, "end": iv["end"], "labels": iv["labels"]})
+    return result
+
+
+# ---------------------------
+# MAIN SEARCH FUNCTION
+# ---------------------------
+def find_muhurtas(year: int, month: int, day: int, days: int,
+                  lat: float, lon: float, tz_name: str,
+                  nakshatras: Optional[List[str]] = None,
+                  paksha: Optional[str] = None,
+                  tithis: Optional[List[int]] = None,
+                  exclude_tithis: Optional[List[int]] = None,
+                  avoid_rikta: bool = False,
+                  weekdays: Optional[List[str]] = None,
+                  lagna_signs: Optional[List[str]] = None,
+                  lagna_type: Optional[str] = None,
+                  avoid_kalams: Iterable[str] = ("rahu_kalam",),
+                  min_duration_minutes: float = 0.0,
+                  limit: int = 20) -> Dict[str, Any]:
+    """
+    Find auspicious windows in [local midnight of the start date, +days).
+
+    Args:
+        nakshatras: Allowed Moon nakshatras (names as in NAKSHATRA_NAMES)
+        paksha: "Shukla" or "Krishna"
+        tithis / exclude_tithis: Allowed / forbidden tithis, 1-30
+        avoid_rikta: Exclude Chaturthi, Navami and Chaturdashi
+        weekdays: Allowed varas (sunrise to sunrise)
+        lagna_signs / lagna_type: Allowed ascendant signs, or a group name
+            from LAGNA_GROUPS ("movable", "fixed", "dual")
+        avoid_kalams: Any of "rahu_kalam", "yamaganda", "gulika_kalam"
+        min_duration_minutes: Drop shorter windows
+        limit: Number of ranked windows to return
+
+    Returns:
+        Ranked windows with their labels, per-stage statistics and the total
+        number of candidate intervals evaluated.
+    """
+    if not 1 <= days <= MAX_DAYS:
+        raise ValueError(f"days must be between 1 and {MAX_DAYS}")
+
+    # Validate and normalise constraints up front
+    nak_idx = None
+    if nakshatras:
+        unknown = [n for n in nakshatras if n not in NAKSHATRA_NAMES]
+        if unknown:
+            raise ValueError(f"Unknown nakshatras: {unknown}")
+        nak_idx = {NAKSHATRA_NAMES.index(n) for n in nakshatras}
+    if paksha is not None and paksha not in PAKSHAS:
+        raise ValueError(f"paksha must be one of {PAKSHAS}")
+    allowed_tithis = set(range(1, 31))
+    if tithis:
+        allowed_tithis &= set(tithis)
+    if exclude_tithis:
+        allowed_tithis -= set(exclude_tithis)
+    if avoid_rikta:
+        allowed_tithis -= RIKTA_TITHIS
+    if weekdays:
+        unknown = [w for w in weekdays if w not in WEEKDAY_NAMES]
+        if unknown:
+            raise ValueError(f"Unknown weekdays: {unknown}")
+    lagnas = set(lagna_signs or [])
+    if lagna_type:
+        if lagna_type not in LAGNA_GROUPS:
+            raise ValueError(f"lagna_type must be one of {list(LAGNA_GROUPS)}")
+        lagnas = (lagnas & set(LAGNA_GROUPS[lagna_type])) if lagnas else set(LAGNA_GROUPS[lagna_type])
+    unknown = [s for s in lagnas if s not in SIGNS]
+    if unknown:
+        raise ValueError(f"Unknown lagna signs: {unknown}")
+    avoid_kalams = list(avoid_kalams or [])
+    unknown = [k for k in avoid_kalams if k not in KALAM_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown kalams: {unknown}")
+
+    jd_start = local_midnight_jd(year, month, day, tz_name)
+    end_date = date(year, month, day) + timedelta(days=days)
+    jd_end = local_midnight_jd(end_date.year, end_date.month, end_date.day, tz_name)
+
+    # Day tables (cached per location-day) from the day before, since the
+    # hours before sunrise belong to the previous vara
+    day_tables = []
+    d = date(year, month, day) - timedelta(days=1)
+    while d <= end_date:
+        day_tables.append(compute_day_divisions(d.year, d.month, d.day, lat, lon, tz_name))
+        d += timedelta(days=1)
+
+    def vara_pieces(a: float, b: float):
+        return [(t["sunrise_jd"], t["next_sunrise_jd"], t["weekday"]) for t in day_tables]
+
+    def elongation_pieces(width: float):
+        return lambda a, b: label_segments(_elongation, width, a, b, ELONGATION_STEP)
+
+    def lagna_pieces(a: float, b: float):
+        # Cached per-day lagna tables, joined across local midnight
+        pieces: List[Tuple[float, float, str]] = []
+        d = jd_to_local_datetime(a, tz_name).date()
+        while True:
+            table = compute_lagna_table(d.year, d.month, d.day, lat, lon, tz_name)
+            for seg in table["lagnas"]:
+                if pieces and pieces[-1][2] == seg["sign"]:
+                    pieces[-1] = (pieces[-1][0], seg["end_jd"], seg["sign"])
+                else:
+                    pieces.append((seg["start_jd"], seg["end_jd"], seg["sign"]))
+            if table["end_jd"] >= b:
+                return pieces
+            d += timedelta(days=1)
+
+    # Stages, slowest-changing first. Each entry: (name, active, apply)
+    stages = [
+        ("paksha", paksha is not None, lambda ivs: _restrict(
+            ivs, elongation_pieces(180.0), lambda i: PAKSHAS[i] == paksha,
+            "paksha", lambda i: PAKSHAS[i])),
+        ("weekday", bool(weekdays), lambda ivs: _restrict(
+            ivs, vara_pieces, lambda w: w in weekdays, "weekday", lambda w: w)),
+        ("tithi", len(allowed_tithis) < 30, lambda ivs: _restrict(
+            ivs, elongation_pieces(12.0), lambda i: i + 1 in allowed_tithis,
+            "tithi", lambda i: {"index": i + 1, "name": TITHI_NAMES[i]})),
+        ("nakshatra", nak_idx is not None, lambda ivs: _restrict(
+            ivs, lambda a, b: label_segments(_moon, 360.0 / 27.0, a, b, MOON_STEP),
+            lambda i: i in nak_idx, "nakshatra", lambda i: NAKSHATRA_NAMES[i])),
+        ("kalam", bool(avoid_kalams), lambda ivs: _subtract(
+            ivs, [(t[k]["start_jd"], t[k]["end_jd"]) for t in day_tables for k in avoid_kalams])),
+        ("lagna", bool(lagnas), lambda ivs: _restrict(
+            ivs, lagna_pieces, lambda s: s in lagnas, "lagna", lambda s: s)),
+    ]
+
+    intervals = [{"start": jd_start, "end": jd_end, "labels": {}}]
+    stage_stats = []
+    evaluated = 0
+    for name, active, apply in stages:
+        if not active:
+            continue
+        n_in = len(intervals)
+        evaluated += n_in
+        if intervals:
+            intervals = apply(intervals)
+        stage_stats.append({
+            "stage": name,
+            "input_intervals": n_in,
+            "output_intervals": len(intervals),
+            "hours_remaining": round(sum(iv["end"] - iv["start"] for iv in intervals) * 24.0, 2),
+        })
+
+    # Rank: up to 1 point for length (capped at 2 hours) + share spent in a
+    # Good choghadiya (Amrit/Shubh/Labh)
+    good_spans = [(seg["start_jd"], seg["end_jd"])
+                  for t in day_tables
+                  for part in ("day", "night")
+                  for seg in t["choghadiya"][part] if seg["quality"] == "Good"]
+
+    windows = []
+    for iv in intervals:
+        minutes = (iv["end"] - iv["start"]) * 1440.0
+        if minutes < min_duration_minutes or minutes <= 0:
+            continue
+        good = sum(max(0.0, min(b, iv["end"]) - max(a, iv["start"])) for a, b in good_spans)
+        good_fraction = good / (iv["end"] - iv["start"])
+        windows.append({
+            "start_jd": iv["start"],
+            "end_jd": iv["end"],
+            "start": jd_to_local_datetime(iv["start"], tz_name).isoformat(),
+            "end": jd_to_local_datetime(iv["end"], tz_name).isoformat(),
+            "duration_minutes": round(minutes, 1),
+            "labels": iv["labels"],
+            "good_choghadiya_fraction": round(good_fraction, 3),
+            "score": round(min(minutes, 120.0) / 120.0 + good_fraction, 4),
+        })
+
+    windows.sort(key=lambda w: (-w["score"], w["start_jd"]))
+    return {
+        "total_windows": len(windows),
+        "windows": windows[:limit],
+        "stages": stage_stats,
+        "candidates_evaluated": evaluated,
+    }
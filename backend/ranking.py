@@ -0,0 +1,161 @@
+"""
+Ranking Module
+Top-K partner ranking over large candidate pools by Ashta Koota:
+- A pool keeps each candidate's Moon pada and groups candidates by pada;
+  there are only 108 groups, and every member of a group gets the same
+  score against a given person
+- A ranking scores the 108 groups once from the precomputed koota tables,
+  drops groups failing the filters (minimum score, Nadi dosha, Bhakoot
+  dosha), orders them with a heap and reads the requested page straight
+  from the group member lists
+- Ties are broken by the order candidates were added to the pool
+
+Pools live in process memory, keyed by name.
+"""
+
+import heapq
+import threading
+from typing import Dict, Any, Optional, Sequence
+
+import numpy as np
+
+from backend.calculations import NAKSHATRA_NAMES, SIGNS
+from backend.koota import (
+    BHAKOOT_DOSHA,
+    KOOTA_TOTALS,
+    NADI_DOSHA,
+    PADA_COUNT,
+    moon_pada,
+    pada_nakshatra,
+    pada_sign,
+)
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+MAX_PAGE_SIZE = 500
+MATCH_ROLES = ("boy", "girl")
+
+VERDICTS = [(30, "Excellent"), (24, "Very Good"), (18, "Acceptable")]
+
+
+def _verdict(total: float) -> str:
+    """Same thresholds as compute_ashta_koota."""
+    for threshold, verdict in VERDICTS:
+        if total >= threshold:
+            return verdict
+    return "Not Compatible"
+
+
+# ---------------------------
+# POOLS
+# ---------------------------
+_pools: Dict[str, Dict[str, Any]] = {}
+_pools_lock = threading.Lock()
+
+
+def build_pool(ids: Sequence[str], padas: Sequence[int]) -> Dict[str, Any]:
+    """Candidates grouped by Moon pada, each group in insertion order."""
+    if len(ids) != len(padas):
+        raise ValueError("ids and padas must have the same length")
+    pada_arr = np.asarray(padas, dtype=np.int16)
+    if len(pada_arr) and (pada_arr.min() < 0 or pada_arr.max() >= PADA_COUNT):
+        raise ValueError(f"padas must be between 0 and {PADA_COUNT - 1}")
+    order = np.argsort(pada_arr, kind="stable")
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(pada_arr, minlength=PADA_COUNT))))
+    return {
+        "ids": list(ids),
+        "padas": pada_arr,
+        "groups": [order[bounds[p]:bounds[p + 1]] for p in range(PADA_COUNT)],
+        "sizes": np.diff(bounds),
+    }
+
+
+def add_to_pool(name: str, ids: Sequence[str], moon_longitudes: Sequence[float],
+                replace: bool = False) -> Dict[str, Any]:
+    """Add candidates (id, sidereal Moon longitude) to a named pool; returns its size."""
+    padas = [moon_pada(lon) for lon in moon_longitudes]
+    with _pools_lock:
+        old = _pools.get(name)
+        if old is not None and not replace:
+            ids = old["ids"] + list(ids)
+            padas = old["padas"].tolist() + padas
+        pool = build_pool(ids, padas)
+        _pools[name] = pool
+    return {"pool": name, "size": len(pool["ids"])}
+
+
+def get_pool(name: str) -> Optional[Dict[str, Any]]:
+    with _pools_lock:
+        return _pools.get(name)
+
+
+# ---------------------------
+# RANKING
+# ---------------------------
+def rank_candidates(pool: Dict[str, Any], pada: int, role: str = "boy", k: int = 20,
+                    offset: int = 0, min_score: float = 0.0, no_nadi_dosha: bool = False,
+                    no_bhakoot_dosha: bool = False) -> Dict[str, Any]:
+    """
+    One page (offset, k) of the pool ranked by Ashta Koota total against a
+    person with Moon pada `pada`. `role` is the person's side ("boy" or
+    "girl"); candidates take the other.
+    """
+    if role not in MATCH_ROLES:
+        raise ValueError(f"role must be one of {list(MATCH_ROLES)}")
+    if not 1 <= k <= MAX_PAGE_SIZE:
+        raise ValueError(f"k must be between 1 and {MAX_PAGE_SIZE}")
+    if offset < 0:
+        raise ValueError("offset must not be negative")
+
+    if role == "boy":
+        totals, nadi, bhakoot = KOOTA_TOTALS[pada], NADI_DOSHA[pada], BHAKOOT_DOSHA[pada]
+    else:
+        totals, nadi, bhakoot = KOOTA_TOTALS[:, pada], NADI_DOSHA[:, pada], BHAKOOT_DOSHA[:, pada]
+
+    eligible = (pool["sizes"] > 0) & (totals >= min_score)
+    if no_nadi_dosha:
+        eligible &= ~nadi
+    if no_bhakoot_dosha:
+        eligible &= ~bhakoot
+    group_ids = np.flatnonzero(eligible).tolist()
+    matches = int(pool["sizes"][group_ids].sum()) if group_ids else 0
+
+    # Groups best first; groups with equal scores are merged by pool order
+    heap = [(-float(totals[g]), g) for g in group_ids]
+    heapq.heapify(heap)
+    page = []
+    skip = offset
+    while heap and len(page) < k:
+        score = heap[0][0]
+        tied = []
+        while heap and heap[0][0] == score:
+            tied.append(heapq.heappop(heap)[1])
+        size = int(sum(pool["sizes"][g] for g in tied))
+        if skip >= size:
+            skip -= size
+            continue
+        members = (pool["groups"][tied[0]].tolist() if len(tied) == 1 else
+                   heapq.merge(*(pool["groups"][g].tolist() for g in tied)))
+        for n, idx in enumerate(members):
+            if n < skip:
+                continue
+            page.append((idx, -score))
+            if len(page) == k:
+                break
+        skip = 0
+
+    results = []
+    for idx, total in page:
+        other = int(pool["padas"][idx])
+        results.append({
+            "id": pool["ids"][idx],
+            "total": round(total, 2),
+            "verdict": _verdict(total),
+            "moon_sign": SIGNS[pada_sign(other)],
+            "nakshatra": NAKSHATRA_NAMES[pada_nakshatra(other)],
+            "pada": other % 4 + 1,
+            "nadi_dosha": bool(nadi[other]),
+            "bhakoot_dosha": bool(bhakoot[other]),
+        })
+    return {"matches": matches, "offset": offset, "k": k, "results": results}
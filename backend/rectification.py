@@ -0,0 +1,266 @@
+"""
+Rectification Module
+Scans a window around an uncertain birth time and reports every moment
+where a chart factor used for rectification changes:
+- Ascendant sign, D9 (navamsa) lagna and D10 (dashamsha) lagna
+- KP star and sub lord of the ascendant (Krishnamurti ayanamsha)
+- Moon nakshatra pada, nakshatra and the starting Vimshottari dasha lord
+
+The Moon and ascendant are sampled sparsely (with their speeds) and
+interpolated with cubic Hermite splines, so a +/-2 hour scan costs a few
+dozen ephemeris calls instead of one full chart per minute.
+"""
+
+import math
+from bisect import bisect_right
+from typing import Dict, Any, List, Callable, Tuple
+
+from backend.calculations import (
+    SIGNS,
+    compute_nakshatra_pada,
+    dashamsha_sign_num,
+    deg_in_sign,
+    get_ayanamsha,
+    jd_to_local_datetime,
+    navamsa_sign_num,
+    normalize_deg,
+    sidereal_position,
+    to_utc_julian_day,
+)
+from backend.kp import SUB_STARTS, kp_lords
+from backend.lagna import ascendant_position, check_lagna_latitude
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+MAX_WINDOW_MINUTES = 720
+
+# Hermite node spacing (days). Max interpolation error is ~0.001" for the
+# Moon and < 0.05" for the ascendant below 50 deg latitude.
+MOON_NODE_STEP = 3.0 / 24.0
+ASC_NODE_STEP = 10.0 / 1440.0
+ASC_NODE_STEP_HIGH_LAT = 5.0 / 1440.0
+HIGH_LATITUDE = 50.0
+
+PADA_SIZE = 360.0 / 108.0
+D10_SIZE = 3.0
+
+# Events closer than this (days, ~0.01 s) are the same boundary
+SAME_EVENT = 1e-7
+
+
+# ---------------------------
+# HERMITE INTERPOLATION
+# ---------------------------
+def sample_nodes(position: Callable[[float], Tuple[float, float]], start: float,
+                 end: float, step: float) -> List[Tuple[float, float, float]]:
+    """Sample (t, unwrapped longitude, speed) nodes covering [start, end]."""
+    count = max(1, int(math.ceil((end - start) / step)))
+    step = (end - start) / count
+    nodes = []
+    prev = None
+    for i in range(count + 1):
+        t = start + i * step
+        lon, speed = position(t)
+        if prev is not None:
+            lon = prev + ((lon - prev + 180.0) % 360.0 - 180.0)
+        nodes.append((t, lon, speed))
+        prev = lon
+    return nodes
+
+
+def _hermite(n0: Tuple[float, float, float], n1: Tuple[float, float, float], t: float) -> float:
+    t0, y0, d0 = n0
+    t1, y1, d1 = n1
+    h = t1 - t0
+    s = (t - t0) / h
+    s2, s3 = s * s, s * s * s
+    return ((2 * s3 - 3 * s2 + 1) * y0 + (s3 - 2 * s2 + s) * h * d0
+            + (-2 * s3 + 3 * s2) * y1 + (s3 - s2) * h * d1)
+
+
+def interpolate(nodes: List[Tuple[float, float, float]], t: float) -> float:
+    """Unwrapped longitude at t from the Hermite spline through the nodes."""
+    lo, hi = 0, len(nodes) - 1
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if nodes[mid][0] <= t:
+            lo = mid
+        else:
+            hi = mid
+    return _hermite(nodes[lo], nodes[hi], t)
+
+
+def _solve(n0: Tuple[float, float, float], n1: Tuple[float, float, float],
+           target: float, tol: float) -> float:
+    """Bisection for the time the spline piece n0-n1 reaches target."""
+    lo, hi = n0[0], n1[0]
+    while hi - lo > tol:
+        mid = 0.5 * (lo + hi)
+        if _hermite(n0, n1, mid) < target:
+            lo = mid
+        else:
+            hi = mid
+    return 0.5 * (lo + hi)
+
+
+def spline_crossings(nodes: List[Tuple[float, float, float]], width: float,
+                     tol: float = 1e-7) -> List[Tuple[float, int]]:
+    """
+    Times where the (increasing) spline crosses multiples of `width`,
+    as (jd, boundary index) pairs. Solved by bisection on the spline only.
+    """
+    crossings = []
+    for n0, n1 in zip(nodes, nodes[1:]):
+        k0 = math.floor(n0[1] / width)
+        k1 = math.floor(n1[1] / width)
+        for k in range(k0 + 1, k1 + 1):
+            crossings.append((_solve(n0, n1, k * width, tol), k))
+    return crossings
+
+
+def spline_crossings_at(nodes: List[Tuple[float, float, float]], starts: List[float],
+                        tol: float = 1e-7) -> List[Tuple[float, int]]:
+    """
+    Like spline_crossings for an irregular sorted list of boundaries in
+    [0, 360); returns (jd, index into starts) pairs.
+    """
+    crossings = []
+    for n0, n1 in zip(nodes, nodes[1:]):
+        for turn in range(math.floor(n0[1] / 360.0), math.floor(n1[1] / 360.0) + 1):
+            base = turn * 360.0
+            lo = bisect_right(starts, n0[1] - base)
+            hi = bisect_right(starts, n1[1] - base)
+            for k in range(lo, hi):
+                crossings.append((_solve(n0, n1, base + starts[k], tol), k))
+    return crossings
+
+
+# ---------------------------
+# CHART FACTORS
+# ---------------------------
+def lagna_factors(asc_lon: float) -> Dict[str, str]:
+    """Ascendant sign with its D9 and D10 lagna."""
+    asc = normalize_deg(asc_lon)
+    sign_num = int(asc // 30) + 1
+    dins = deg_in_sign(asc)
+    return {
+        "asc_sign": SIGNS[sign_num - 1],
+        "d9_lagna": SIGNS[navamsa_sign_num(sign_num, dins) - 1],
+        "d10_lagna": SIGNS[dashamsha_sign_num(sign_num, dins) - 1],
+    }
+
+
+def kp_factors(asc_kp_lon: float) -> Dict[str, str]:
+    """KP star and sub lord of the ascendant."""
+    lords = kp_lords(asc_kp_lon)
+    return {"asc_star_lord": lords["star_lord"], "asc_sub_lord": lords["sub_lord"]}
+
+
+def moon_factors(moon_lon: float) -> Dict[str, Any]:
+    """Moon nakshatra, pada and the dasha lord running at birth."""
+    nak = compute_nakshatra_pada(moon_lon)
+    return {
+        "moon_nakshatra": nak["nakshatra"],
+        "moon_pada": nak["pada"],
+        "dasha_lord": nak["lord"],
+    }
+
+
+# ---------------------------
+# MAIN SCAN FUNCTION
+# ---------------------------
+def scan_rectification(year: int, month: int, day: int, hour: int, minute: int,
+                       second: int, tz: str, lat: float, lon: float,
+                       window_minutes: int = 120) -> Dict[str, Any]:
+    """
+    Find every change of lagna, D9/D10 lagna, KP ascendant star/sub lord,
+    Moon pada/nakshatra and starting dasha lord within +/- window_minutes
+    of the given birth time.
+
+    Returns:
+        Dictionary with the change events (time-ordered, simultaneous
+        changes merged) and the intervals between them, each carrying the
+        full set of factors valid for that interval.
+
+    Raises ValueError inside the polar circles.
+    """
+    if not 1 <= window_minutes <= MAX_WINDOW_MINUTES:
+        raise ValueError(f"window_minutes must be between 1 and {MAX_WINDOW_MINUTES}")
+
+    jd_birth, _ = to_utc_julian_day(year, month, day, hour, minute, second, tz)
+    # The ascendant spline assumes a forward-moving ascendant
+    check_lagna_latitude(lat, jd_birth)
+    start = jd_birth - window_minutes / 1440.0
+    end = jd_birth + window_minutes / 1440.0
+
+    # One batched pass of sparse ephemeris samples
+    asc_step = ASC_NODE_STEP_HIGH_LAT if abs(lat) > HIGH_LATITUDE else ASC_NODE_STEP
+    asc_nodes = sample_nodes(ascendant_position(lat, lon), start, end, asc_step)
+    moon_nodes = sample_nodes(lambda t: sidereal_position(t, "Moon"), start, end, MOON_NODE_STEP)
+
+    raw: List[Tuple[float, List[str]]] = []
+    for jd, k in spline_crossings(asc_nodes, PADA_SIZE):
+        raw.append((jd, ["asc_sign", "d9_lagna"] if k % 9 == 0 else ["d9_lagna"]))
+    for jd, _ in spline_crossings(asc_nodes, D10_SIZE):
+        raw.append((jd, ["d10_lagna"]))
+    # KP lords use the Krishnamurti ayanamsha; its offset from Lahiri is
+    # constant to well below a milliarcsecond over the window
+    kp_offset = get_ayanamsha(jd_birth) - get_ayanamsha(jd_birth, "krishnamurti")
+    kp_nodes = [(t, y + kp_offset, d) for t, y, d in asc_nodes]
+    for jd, k in spline_crossings_at(kp_nodes, SUB_STARTS):
+        raw.append((jd, ["asc_star_lord", "asc_sub_lord"] if k % 9 == 0 else ["asc_sub_lord"]))
+    for jd, k in spline_crossings(moon_nodes, PADA_SIZE):
+        raw.append((jd, ["moon_pada", "moon_nakshatra", "dasha_lord"] if k % 4 == 0 else ["moon_pada"]))
+    raw.sort(key=lambda e: e[0])
+
+    # Merge simultaneous boundaries (e.g. a sign change moves D1, D9 and D10)
+    merged: List[Tuple[float, List[str]]] = []
+    for jd, kinds in raw:
+        if merged and jd - merged[-1][0] < SAME_EVENT:
+            merged[-1][1].extend(k for k in kinds if k not in merged[-1][1])
+        else:
+            merged.append((jd, list(kinds)))
+
+    def factors_at(t: float) -> Dict[str, Any]:
+        asc = interpolate(asc_nodes, t)
+        return {**lagna_factors(asc),
+                **kp_factors(asc + kp_offset),
+                **moon_factors(interpolate(moon_nodes, t))}
+
+    def local(t: float) -> str:
+        return jd_to_local_datetime(t, tz).isoformat()
+
+    bounds = [start] + [jd for jd, _ in merged] + [end]
+    intervals = []
+    for a, b in zip(bounds, bounds[1:]):
+        intervals.append({
+            "start_jd": a,
+            "end_jd": b,
+            "start": local(a),
+            "end": local(b),
+            "offset_start_minutes": round((a - jd_birth) * 1440.0, 2),
+            "offset_end_minutes": round((b - jd_birth) * 1440.0, 2),
+            "duration_minutes": round((b - a) * 1440.0, 2),
+            "contains_birth_time": a <= jd_birth < b,
+            **factors_at(0.5 * (a + b)),
+        })
+
+    events = []
+    for i, (jd, kinds) in enumerate(merged):
+        events.append({
+            "jd": jd,
+            "time": local(jd),
+            "offset_minutes": round((jd - jd_birth) * 1440.0, 2),
+            "changes": kinds,
+            "before": {k: intervals[i][k] for k in kinds},
+            "after": {k: intervals[i + 1][k] for k in kinds},
+        })
+
+    return {
+        "jd_birth": jd_birth,
+        "window_minutes": window_minutes,
+        "ephemeris_samples": {"ascendant": len(asc_nodes), "moon": len(moon_nodes)},
+        "events": events,
+        "intervals": intervals,
+    }
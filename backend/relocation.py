@@ -0,0 +1,124 @@
+"""
+Relocation Module
+Evaluates one birth moment at many places at once:
+- Ascendant sign and degree (sidereal, Lahiri)
+- Which planets fall in kendras (whole-sign houses)
+
+Planet positions are geocentric, so they are computed once for the birth
+JD; only the ascendant varies with place and comes from the vectorized
+ascendant kernel. Results are flat row-major arrays suitable for a heatmap.
+"""
+
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from backend.ascendant_kernel import ascendant_mc
+from backend.calculations import DEFAULT_PLANETS, SIGNS, sidereal_position, to_utc_julian_day
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+MAX_POINTS = 200000
+KENDRA_HOUSES = (1, 4, 7, 10)
+
+
+# ---------------------------
+# HELPER FUNCTIONS
+# ---------------------------
+def grid_axis(start: float, stop: float, step: float, limit: float) -> np.ndarray:
+    """Inclusive axis from start to stop in `step` increments."""
+    if step <= 0:
+        raise ValueError("Grid step must be positive")
+    if not -limit <= start <= stop <= limit:
+        raise ValueError(f"Grid bounds must satisfy -{limit} <= min <= max <= {limit}")
+    count = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return start + step * np.arange(count)
+
+
+def _evaluate(jd_ut: float, lat: np.ndarray, lon: np.ndarray,
+              planets: List[str]) -> Dict[str, Any]:
+    """Ascendant sign/degree and kendra mask for flat lat/lon arrays."""
+    asc, _ = ascendant_mc(jd_ut, lat, lon)
+    asc_sign = (asc // 30.0).astype(np.int64) % 12
+
+    # Whole-sign house of a planet = (planet sign - asc sign) % 12 + 1, so
+    # per-point houses follow from asc_sign and the fixed planet signs
+    planet_signs = []
+    kendra_mask = np.zeros(asc.shape, dtype=np.int64)
+    for bit, planet in enumerate(planets):
+        p_lon, _ = sidereal_position(jd_ut, planet)
+        p_sign = int(p_lon // 30) % 12
+        planet_signs.append(p_sign)
+        house = (p_sign - asc_sign) % 12 + 1
+        kendra_mask |= np.isin(house, KENDRA_HOUSES).astype(np.int64) << bit
+
+    return {
+        "planet_signs": planet_signs,
+        "asc_sign": asc_sign.tolist(),
+        "asc_degree": np.round(asc % 30.0, 2).tolist(),
+        "kendra_mask": kendra_mask.tolist(),
+    }
+
+
+# ---------------------------
+# MAIN FUNCTION
+# ---------------------------
+def compute_relocation(year: int, month: int, day: int, hour: int, minute: int,
+                       second: int, tz: str,
+                       grid: Optional[Dict[str, float]] = None,
+                       cities: Optional[List[Dict[str, Any]]] = None,
+                       planets: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Ascendant and kendra placements for a birth moment over a lat/lon grid
+    or a list of cities.
+
+    Args:
+        grid: lat_min, lat_max, lon_min, lon_max and step (degrees)
+        cities: [{"name", "lat", "lon"}, ...]
+        planets: Planets to place (default: the nine grahas)
+
+    Returns:
+        Dictionary with the birth JD, planet_signs (indices into "signs", in
+        planet_order), the point layout ("lats"/"lons" axes and "shape" for a
+        grid, "names" for cities) and flat row-major arrays: asc_sign (index
+        into "signs"), asc_degree and kendra_mask (bit i set when
+        planet_order[i] is in a kendra).
+    """
+    if (grid is None) == (cities is None):
+        raise ValueError("Provide exactly one of grid or cities")
+    planets = planets or DEFAULT_PLANETS
+    unknown = [p for p in planets if p not in DEFAULT_PLANETS]
+    if unknown:
+        raise ValueError(f"Unknown planets: {unknown}")
+
+    jd_ut, _ = to_utc_julian_day(year, month, day, hour, minute, second, tz)
+
+    if grid is not None:
+        lats = grid_axis(grid["lat_min"], grid["lat_max"], grid["step"], 90.0)
+        lons = grid_axis(grid["lon_min"], grid["lon_max"], grid["step"], 180.0)
+        if lats.size * lons.size > MAX_POINTS:
+            raise ValueError(f"Grid has {lats.size * lons.size} points; the limit is {MAX_POINTS}")
+        lat2d, lon2d = np.meshgrid(lats, lons, indexing="ij")
+        layout = {
+            "lats": np.round(lats, 6).tolist(),
+            "lons": np.round(lons, 6).tolist(),
+            "shape": [int(lats.size), int(lons.size)],
+        }
+        lat_flat, lon_flat = lat2d.ravel(), lon2d.ravel()
+    else:
+        if len(cities) > MAX_POINTS:
+            raise ValueError(f"At most {MAX_POINTS} cities are allowed")
+        lat_flat = np.array([c["lat"] for c in cities], dtype=float)
+        lon_flat = np.array([c["lon"] for c in cities], dtype=float)
+        if np.any(np.abs(lat_flat) > 90.0) or np.any(np.abs(lon_flat) > 180.0):
+            raise ValueError("City coordinates out of range")
+        layout = {"names": [c.get("name") for c in cities]}
+
+    return {
+        "jd_ut": jd_ut,
+        "signs": SIGNS,
+        "planet_order": list(planets),
+        **layout,
+        **_evaluate(jd_ut, lat_flat, lon_flat, planets),
+    }
@@ -1,13 +1,29 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
 from typing import Optional, List
 import os
 
-from backend.schemas import ComputeRequest, MatchRequest
+from backend.schemas import (
+    ComputeRequest, IncrementalComputeRequest, MatchBulkRequest, MatchPoolRequest, MatchRankRequest,
+    MatchRequest, RectificationRequest, RelocationRequest, VarshaphalaRequest,
+)
 from backend.models import User
 from backend.dependencies import get_current_user_optional
-from backend.calculations import compute_chart, compute_match_for_birth_data
+from backend.calculations import compute_ayanamsha_variants, compute_chart
 from backend.tables import compute_lucky_factors, SIGN_LORDS as TABLES_SIGN_LORDS
 from backend.strength_evaluator import calculate_chart_strengths
+from backend.rectification import scan_rectification
+from backend.incremental import (
+    DERIVED_SECTIONS, apply_delta, cached_chart, chart_key, recompute_chart, remember_chart,
+    reusable_derived,
+)
+from backend.relocation import compute_relocation
+from backend.bhava import compute_bhavas
+from backend.kp import compute_kp_chart
+from backend.fixed_stars import compute_fixed_stars
+from backend.varshaphala import compute_varshaphala
+from backend.koota import birth_moon, chart_moon_pada, koota_match
+from backend.ranking import add_to_pool, get_pool, rank_candidates
 
 router = APIRouter()
 
@@ -15,32 +31,128 @@ router = APIRouter()
 # The logic in main.py used SIGN_LORDS for `lagna_lord` calculation.
 # We will use the one from tables module to stay DRY.
 
+def _birth_params(req: ComputeRequest) -> dict:
+    return {
+        "year": req.year,
+        "month": req.month,
+        "day": req.day,
+        "hour": req.hour,
+        "minute": req.minute,
+        "second": req.second,
+        "tz": req.tz,
+        "lat": req.lat,
+        "lon": req.lon,
+        "planets": req.planets,
+        "topo_alt": req.topo_alt or 0.0,
+    }
+
+
 @router.post("/compute")
 def compute(
     req: ComputeRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     # Use the calculations module to compute the complete chart
-    chart_data = compute_chart(
-        year=req.year,
-        month=req.month,
-        day=req.day,
-        hour=req.hour,
-        minute=req.minute,
-        second=req.second,
-        tz=req.tz,
-        lat=req.lat,
-        lon=req.lon,
-        planets=req.planets,
-        topo_alt=req.topo_alt or 0.0
-    )
+    birth = _birth_params(req)
+    chart_data = compute_chart(**birth)
+
+    response = _chart_response(req.dict(), chart_data, current_user)
+    response["chart_key"] = remember_chart(birth, chart_data, _derived(response, current_user))
+    if req.ayanamshas:
+        # Side-by-side sidereal placements from the same tropical positions
+        try:
+            response["ayanamshas"] = compute_ayanamsha_variants(
+                chart_data["jd_ut"], chart_data["planets"],
+                chart_data["ascendant"]["tropical"], req.ayanamshas)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if req.house_systems:
+        # Cusp-based bhavas; whole-sign-only requests skip this entirely
+        try:
+            response["bhavas"] = compute_bhavas(
+                chart_data["jd_ut"], req.lat, req.lon, chart_data["planets"], req.house_systems)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if req.kp:
+        response["kp"] = compute_kp_chart(
+            chart_data["jd_ut"], req.lat, req.lon, chart_data["planets"])
+    if req.fixed_stars:
+        try:
+            response["fixed_stars"] = compute_fixed_stars(
+                chart_data["jd_ut"], chart_data["planets"], chart_data["ascendant"]["tropical"],
+                req.fixed_star_orb, req.fixed_star_max_magnitude)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    return response
+
+
+@router.post("/compute/incremental")
+def compute_incremental(
+    req: IncrementalComputeRequest,
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Recompute a previous chart after a time/place edit, reusing unchanged
+    sections; `incremental` lists which were reused and which recomputed.
+
+    Place edits reuse most of the chart. Time edits are not accelerated:
+    every planet moves with the birth instant, so only sunrise/sunset and
+    (when the ascendant and Moon signs stay put) lucky factors are reused,
+    and the request costs about as much as a full /compute.
+    """
+    if req.chart_key:
+        entry = cached_chart(req.chart_key)
+        if entry is None:
+            raise HTTPException(status_code=404, detail="Unknown or expired chart_key")
+        prev_birth, prev_chart, prev_derived = entry
+    elif req.previous is not None:
+        prev_birth = _birth_params(req.previous)
+        entry = cached_chart(chart_key(prev_birth))
+        if entry:
+            _, prev_chart, prev_derived = entry
+        else:
+            prev_chart, prev_derived = compute_chart(**prev_birth), {}
+    else:
+        raise HTTPException(status_code=400, detail="Provide chart_key or previous")
+
+    birth = apply_delta(prev_birth, req.delta.minutes, req.delta.seconds,
+                        req.delta.lat, req.delta.lon)
+    chart_data, report = recompute_chart(prev_birth, prev_chart, birth)
+    reuse = reusable_derived(prev_chart, prev_derived, chart_data, report)
+
+    response = _chart_response(birth, chart_data, current_user, reuse)
+    response["chart_key"] = remember_chart(birth, chart_data, _derived(response, current_user))
+    for section in DERIVED_SECTIONS:
+        if section == "yogas" and current_user is None:
+            continue  # not evaluated for anonymous users
+        report["reused" if section in reuse else "recomputed"].append(section)
+    response["incremental"] = report
+    return response
+
+
+def _derived(response: dict, current_user: Optional[User]) -> dict:
+    """The derived sections of a chart response worth keeping with the chart."""
+    derived = {"strengths": response["strengths"], "lucky_factors": response["lucky_factors"]}
+    if current_user is not None:
+        derived["yogas"] = response["yogas"]
+    return derived
+
+
+def _chart_response(request_data: dict, chart_data: dict, current_user: Optional[User],
+                    reuse: Optional[dict] = None) -> dict:
+    # `reuse` holds derived sections still valid from a previous chart
+    reuse = reuse or {}
 
     # Calculate Signs & Strengths
-    planet_strengths = calculate_chart_strengths(chart_data)
+    planet_strengths = reuse.get("strengths")
+    if planet_strengths is None:
+        planet_strengths = calculate_chart_strengths(chart_data)
 
     # Evaluate yogas using rulesets - ONLY for authenticated users
     yogas = []
-    if current_user is not None:
+    if current_user is not None and "yogas" in reuse:
+        yogas = reuse["yogas"]
+    elif current_user is not None:
         # User is authenticated, compute yogas
         # We need to find the ruleset dir. Since this file is in backend/routes/, 
         # we need to go up one level then into rulesets.
@@ -68,15 +180,17 @@ def compute(
     # We use table's SIGN_LORDS
     lagna_lord = TABLES_SIGN_LORDS.get(chart_data["asc_sign"], "")
     
-    lucky_factors_data = compute_lucky_factors(
-        asc_sign=chart_data["asc_sign"],
-        moon_sign=chart_data.get("moon_sign") or "",
-        lagna_lord=lagna_lord
-    )
+    lucky_factors_data = reuse.get("lucky_factors")
+    if lucky_factors_data is None:
+        lucky_factors_data = compute_lucky_factors(
+            asc_sign=chart_data["asc_sign"],
+            moon_sign=chart_data.get("moon_sign") or "",
+            lagna_lord=lagna_lord
+        )
 
     # Return response with all computed data
     return {
-        "request": req.dict(),
+        "request": request_data,
         "jd_ut": chart_data["jd_ut"],
         "utc_at_birth": chart_data["utc_at_birth"],
         "ayanamsha_deg": chart_data["ayanamsha_deg"],
@@ -99,44 +213,170 @@ def compute(
     }
 
 
-@router.post("/match")
-def match(req: MatchRequest):
-    boy_params = {
-        "year": req.boy.year,
-        "month": req.boy.month,
-        "day": req.boy.day,
-        "hour": req.boy.hour,
-        "minute": req.boy.minute,
-        "second": req.boy.second,
-        "tz": req.boy.tz,
-        "lat": req.boy.lat,
-        "lon": req.boy.lon,
-        "planets": req.boy.planets,
-        "topo_alt": req.boy.topo_alt or 0.0,
-    }
-    girl_params = {
-        "year": req.girl.year,
-        "month": req.girl.month,
-        "day": req.girl.day,
-        "hour": req.girl.hour,
-        "minute": req.girl.minute,
-        "second": req.girl.second,
-        "tz": req.girl.tz,
-        "lat": req.girl.lat,
-        "lon": req.girl.lon,
-        "planets": req.girl.planets,
-        "topo_alt": req.girl.topo_alt or 0.0,
+# Candidates scored per /match/bulk request
+MAX_BULK_CANDIDATES = 5000
+
+
+def _match_params(b) -> dict:
+    return {
+        "year": b.year,
+        "month": b.month,
+        "day": b.day,
+        "hour": b.hour,
+        "minute": b.minute,
+        "second": b.second,
+        "tz": b.tz,
+        "lat": b.lat,
+        "lon": b.lon,
+        "planets": b.planets,
+        "topo_alt": b.topo_alt or 0.0,
     }
 
-    result = compute_match_for_birth_data(boy_params, girl_params)
+
+def _match_side(chart: dict) -> dict:
     return {
-        "ashta_koota": result["ashta_koota"],
-        "boy": {
-            "moon_sign": result["boy"].get("moon_sign"),
-            "nakshatra_of_moon": result["boy"].get("nakshatra_of_moon"),
-        },
-        "girl": {
-            "moon_sign": result["girl"].get("moon_sign"),
-            "nakshatra_of_moon": result["girl"].get("nakshatra_of_moon"),
-        },
+        "moon_sign": chart.get("moon_sign"),
+        "nakshatra_of_moon": chart.get("nakshatra_of_moon"),
+    }
+
+
+@router.post("/match")
+def match(req: MatchRequest):
+    # Ashta Koota depends only on the two Moon padas: compute just the Moons
+    # and look the result up, unless full charts are asked for
+    if req.full_charts:
+        boy_chart = compute_chart(**_match_params(req.boy))
+        girl_chart = compute_chart(**_match_params(req.girl))
+        boy_pada, girl_pada = chart_moon_pada(boy_chart), chart_moon_pada(girl_chart)
+    else:
+        boy_chart = birth_moon(**_match_params(req.boy))
+        girl_chart = birth_moon(**_match_params(req.girl))
+        boy_pada, girl_pada = boy_chart["pada_index"], girl_chart["pada_index"]
+
+    response = {
+        "ashta_koota": koota_match(boy_pada, girl_pada),
+        "boy": _match_side(boy_chart),
+        "girl": _match_side(girl_chart),
     }
+    if req.full_charts:
+        response["charts"] = {"boy": boy_chart, "girl": girl_chart}
+    return response
+
+
+@router.post("/match/bulk")
+def match_bulk(req: MatchBulkRequest):
+    """Ashta Koota of one person against many candidates, in input order."""
+    if req.role not in ("boy", "girl"):
+        raise HTTPException(status_code=400, detail="role must be 'boy' or 'girl'")
+    if not 1 <= len(req.candidates) <= MAX_BULK_CANDIDATES:
+        raise HTTPException(status_code=400, detail=f"Provide 1 to {MAX_BULK_CANDIDATES} candidates")
+
+    person = birth_moon(**_match_params(req.person))
+    results = []
+    for i, candidate in enumerate(req.candidates):
+        moon = birth_moon(**_match_params(candidate))
+        if req.role == "boy":
+            ashta = koota_match(person["pada_index"], moon["pada_index"])
+        else:
+            ashta = koota_match(moon["pada_index"], person["pada_index"])
+        row = {"index": i, "total": ashta["total"], "verdict": ashta["verdict"], **_match_side(moon)}
+        if req.breakdown:
+            row["kootas"] = ashta["kootas"]
+        results.append(row)
+    return {"role": req.role, "person": _match_side(person), "results": results}
+
+
+@router.post("/match/pool/{name}")
+def match_pool(name: str, req: MatchPoolRequest):
+    """Add candidate profiles to a named in-memory ranking pool."""
+    longitudes = []
+    for profile in req.profiles:
+        if profile.moon_longitude is not None:
+            longitudes.append(profile.moon_longitude)
+        elif profile.birth is not None:
+            longitudes.append(birth_moon(**_match_params(profile.birth))["moon_longitude"])
+        else:
+            raise HTTPException(status_code=400,
+                                detail=f"Profile {profile.id}: provide moon_longitude or birth")
+    return add_to_pool(name, [p.id for p in req.profiles], longitudes, replace=bool(req.replace))
+
+
+@router.post("/match/rank")
+def match_rank(req: MatchRankRequest):
+    """Top candidates of a pool by Ashta Koota, one page at a time."""
+    pool = get_pool(req.pool)
+    if pool is None:
+        raise HTTPException(status_code=404, detail=f"Unknown pool: {req.pool}")
+    person = birth_moon(**_match_params(req.person))
+    try:
+        ranking = rank_candidates(pool, person["pada_index"], req.role, req.k, req.offset,
+                                  req.min_score, bool(req.no_nadi_dosha), bool(req.no_bhakoot_dosha))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"pool": req.pool, "role": req.role, "person": _match_side(person), **ranking}
+
+
+@router.post("/rectify")
+def rectify(req: RectificationRequest):
+    """Lagna, D9/D10 lagna, Moon pada and dasha-lord changes around a birth time."""
+    try:
+        return scan_rectification(
+            year=req.year,
+            month=req.month,
+            day=req.day,
+            hour=req.hour,
+            minute=req.minute,
+            second=req.second,
+            tz=req.tz,
+            lat=req.lat,
+            lon=req.lon,
+            window_minutes=req.window_minutes,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/relocation")
+def relocation(req: RelocationRequest):
+    """Ascendant sign/degree and kendra placements of a birth moment over many places."""
+    try:
+        result = compute_relocation(
+            year=req.year,
+            month=req.month,
+            day=req.day,
+            hour=req.hour,
+            minute=req.minute,
+            second=req.second,
+            tz=req.tz,
+            grid=req.grid.dict() if req.grid else None,
+            cities=[c.dict() for c in req.cities] if req.cities is not None else None,
+            planets=req.planets,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Already plain lists/numbers; skip jsonable_encoder, which dominates
+    # the response time on large grids
+    return JSONResponse(content=result)
+
+
+@router.post("/varshaphala")
+def varshaphala(req: VarshaphalaRequest):
+    """Solar return moments, varsha lagna, Muntha and year lord for a span of ages."""
+    try:
+        return compute_varshaphala(
+            year=req.year,
+            month=req.month,
+            day=req.day,
+            hour=req.hour,
+            minute=req.minute,
+            second=req.second,
+            tz=req.tz,
+            lat=req.lat,
+            lon=req.lon,
+            start_age=req.start_age,
+            end_age=req.end_age,
+            place=req.place.dict() if req.place else None,
+            chart_ages=req.chart_ages,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
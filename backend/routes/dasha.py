@@ -0,0 +1,123 @@
+import json
+from datetime import date
+
+import swisseph as swe
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from backend.calculations import compute_chart
+from backend.dasha import (
+    DAYS_IN_YEAR,
+    LEVEL_NAMES,
+    MAX_DEPTH,
+    chart_dasha_plan,
+    period_at,
+    period_dict,
+    periods_between,
+)
+from backend.incremental import cached_chart
+from backend.schemas import DashaRequest
+
+router = APIRouter(prefix="/dasha", tags=["dasha"])
+
+MAX_YEARS = 150
+
+# Longest window per depth; a prana (depth 5) window of this size is a few
+# thousand periods
+MAX_WINDOW_DAYS = {1: 150 * 366, 2: 150 * 366, 3: 150 * 366, 4: 20 * 366, 5: 2 * 366, 6: 90}
+
+# Periods per streamed chunk
+STREAM_BATCH = 256
+
+
+def _date_to_jd(d: date) -> float:
+    return swe.julday(d.year, d.month, d.day, 0.0, swe.GREG_CAL)
+
+
+def _chart(req) -> dict:
+    if req.chart_key:
+        entry = cached_chart(req.chart_key)
+        if entry is None:
+            raise HTTPException(status_code=404, detail="Unknown or expired chart_key")
+        return entry[1]
+    if req.birth is None:
+        raise HTTPException(status_code=400, detail="Provide chart_key or birth")
+    b = req.birth
+    return compute_chart(
+        year=b.year,
+        month=b.month,
+        day=b.day,
+        hour=b.hour,
+        minute=b.minute,
+        second=b.second,
+        tz=b.tz,
+        lat=b.lat,
+        lon=b.lon,
+        topo_alt=b.topo_alt or 0.0
+    )
+
+
+@router.post("")
+def dasha(req: DashaRequest):
+    """Mahadashas of any supported system and the periods running on a date."""
+    if not 1 <= req.years <= MAX_YEARS:
+        raise HTTPException(status_code=400, detail=f"years must be between 1 and {MAX_YEARS}")
+    chart = _chart(req)
+    try:
+        plan = chart_dasha_plan(req.system, chart)
+        jd_at = _date_to_jd(req.at or date.today())
+        running = period_at(plan, jd_at, req.depth)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    jd_birth = plan["jd_birth"]
+    return {
+        "system": req.system,
+        "at": (req.at or date.today()).isoformat(),
+        "running": [period_dict(plan, p) for p in running],
+        "mahadashas": [period_dict(plan, p)
+                       for p in periods_between(plan, jd_birth, jd_birth + req.years * DAYS_IN_YEAR)],
+    }
+
+
+@router.get("/window")
+def dasha_window(
+    chart_key: str,
+    start: date,
+    end: date,
+    depth: int = Query(5, ge=1, le=MAX_DEPTH, description="1 = mahadasha ... 5 = prana, 6 = deha"),
+    system: str = "vimshottari",
+):
+    """
+    Periods at one depth overlapping [start, end), streamed as NDJSON: a
+    header line, then one period per line. Only the branches of the dasha
+    tree that reach the window are generated.
+    """
+    entry = cached_chart(chart_key)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired chart_key")
+    jd_start, jd_end = _date_to_jd(start), _date_to_jd(end)
+    if jd_end <= jd_start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if jd_end - jd_start > MAX_WINDOW_DAYS[depth]:
+        raise HTTPException(status_code=400,
+                            detail=f"Window longer than {MAX_WINDOW_DAYS[depth]} days for depth {depth}")
+    try:
+        plan = chart_dasha_plan(system, entry[1])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    jd_start = max(jd_start, plan["jd_birth"])
+
+    def lines():
+        yield (json.dumps({"system": system, "level": LEVEL_NAMES[depth - 1],
+                           "start": start.isoformat(), "end": end.isoformat()}) + "\n").encode("utf-8")
+        batch = []
+        for period in periods_between(plan, jd_start, jd_end, depth):
+            batch.append(json.dumps(period_dict(plan, period)))
+            if len(batch) == STREAM_BATCH:
+                yield ("\n".join(batch) + "\n").encode("utf-8")
+                batch = []
+        if batch:
+            yield ("\n".join(batch) + "\n").encode("utf-8")
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Request, Response
+import pytz
+
+from backend.calculations import SIGNS
+from backend.horoscope import HOROSCOPE_TZ, PERIODS, get_period
+
+router = APIRouter(prefix="/horoscope", tags=["horoscope"])
+
+
+def _serve(period: str, part: str, request: Request) -> Response:
+    if period not in PERIODS:
+        raise HTTPException(status_code=404, detail=f"period must be one of {list(PERIODS)}")
+    entry = get_period(period)
+    etag = entry["etags"][part]
+    # Valid until the period rolls over at local midnight
+    max_age = max(0, int((entry["expires_at"] - datetime.now(pytz.timezone(HOROSCOPE_TZ))).total_seconds()))
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}",
+        "Expires": entry["expires_at"].astimezone(pytz.utc).strftime("%a, %d %b %Y %H:%M:%S GMT"),
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry["bodies"][part], media_type="application/json", headers=headers)
+
+
+@router.get("/{period}")
+def horoscopes(period: str, request: Request):
+    """Precomputed daily/weekly/monthly horoscopes for all 12 Moon signs."""
+    return _serve(period, "all", request)
+
+
+@router.get("/{period}/{sign}")
+def horoscope(period: str, sign: str, request: Request):
+    """Precomputed horoscope of one Moon sign for the current day, week or month."""
+    sign = sign.capitalize()
+    if sign not in SIGNS:
+        raise HTTPException(status_code=404, detail=f"Unknown sign: {sign}")
+    return _serve(period, sign, request)
@@ -0,0 +1,96 @@
+from fastapi import APIRouter, HTTPException, Query
+import pytz
+
+from backend.day_divisions import compute_day_divisions
+from backend.lagna import compute_lagna_table
+from backend.muhurta import find_muhurtas
+from backend.schemas import MuhurtaRequest
+from backend.tarabala import daily_table, day_quality
+
+router = APIRouter(tags=["panchang"])
+
+
+def _check_tz(tz: str) -> None:
+    if tz not in pytz.all_timezones_set:
+        raise HTTPException(status_code=400, detail=f"Unknown timezone: {tz}")
+
+
+@router.get("/day-table")
+def day_table(
+    year: int,
+    month: int,
+    day: int,
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    tz: str = "Asia/Kolkata",
+):
+    """Hora, Rahu Kalam, Yamaganda, Gulika and Choghadiya for a place and date."""
+    _check_tz(tz)
+    try:
+        return compute_day_divisions(year, month, day, lat, lon, tz)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/lagna-table")
+def lagna_table(
+    year: int,
+    month: int,
+    day: int,
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    tz: str = "Asia/Kolkata",
+):
+    """Start/end times of the 12 lagnas and of every navamsa lagna for a local day."""
+    _check_tz(tz)
+    try:
+        return compute_lagna_table(year, month, day, lat, lon, tz)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/muhurta")
+def muhurta(req: MuhurtaRequest):
+    """Ranked windows matching nakshatra/tithi/paksha/weekday/kalam/lagna constraints."""
+    _check_tz(req.tz)
+    try:
+        return find_muhurtas(
+            req.year, req.month, req.day, req.days, req.lat, req.lon, req.tz,
+            nakshatras=req.nakshatras,
+            paksha=req.paksha,
+            tithis=req.tithis,
+            exclude_tithis=req.exclude_tithis,
+            avoid_rikta=req.avoid_rikta,
+            weekdays=req.weekdays,
+            lagna_signs=req.lagna_signs,
+            lagna_type=req.lagna_type,
+            avoid_kalams=req.avoid_kalams,
+            min_duration_minutes=req.min_duration_minutes,
+            limit=req.limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/tarabala/table")
+def tarabala_table(year: int, month: int, day: int, tz: str = "Asia/Kolkata"):
+    """Tarabala for all 27 nakshatras and Chandrabala for all 12 Moon signs for a local day."""
+    _check_tz(tz)
+    return daily_table(year, month, day, tz)
+
+
+@router.get("/tarabala")
+def tarabala(
+    year: int,
+    month: int,
+    day: int,
+    nakshatra_index: int = Query(..., ge=0, le=26),
+    moon_sign: str = Query(...),
+    tz: str = "Asia/Kolkata",
+):
+    """A natal chart's Tarabala, Chandrabala and day quality, read from the shared day table."""
+    _check_tz(tz)
+    try:
+        return day_quality(year, month, day, tz, nakshatra_index, moon_sign)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
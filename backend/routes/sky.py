@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from backend.sky import current_sky, subscribe, unsubscribe
+
+router = APIRouter(prefix="/sky", tags=["sky"])
+
+
+@router.get("/now")
+def sky_now():
+    """Latest shared snapshot of planetary positions and panchang."""
+    return Response(content=current_sky()["body"], media_type="application/json")
+
+
+@router.get("/stream")
+async def sky_stream():
+    """Server-sent events: the current snapshot, then every refresh."""
+    async def events():
+        sub = subscribe()
+        try:
+            yield current_sky()["sse"]
+            while True:
+                snapshot = await sub[1].get()
+                yield snapshot["sse"]
+        finally:
+            unsubscribe(sub)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+
+@router.websocket("/ws")
+async def sky_ws(websocket: WebSocket):
+    """WebSocket: the current snapshot, then every refresh."""
+    await websocket.accept()
+    sub = subscribe()
+    try:
+        await websocket.send_text(current_sky()["text"])
+        while True:
+            snapshot = await sub[1].get()
+            await websocket.send_text(snapshot["text"])
+    except WebSocketDisconnect:
+        pass
+    finally:
+        unsubscribe(sub)
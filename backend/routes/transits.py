@@ -0,0 +1,169 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+import swisseph as swe
+
+from backend.ingress import PLANET_MOTION, INGRESS_KINDS, find_ingresses
+from backend.stations import STATION_PLANETS, find_retrograde_periods
+from backend.sade_sati import compute_saturn_periods
+from backend.eclipses import ECLIPSE_KINDS, eclipses_between, natal_eclipses
+from backend.gochara import MAX_DAYS, compute_gochara
+from backend.incremental import cached_chart
+from backend.schemas import ComputeRequest, GocharaRequest
+from backend.calculations import compute_chart
+
+router = APIRouter(prefix="/transits", tags=["transits"])
+
+# Longest window a single request may scan
+MAX_WINDOW_YEARS = 150
+
+
+def _date_to_jd(d: date) -> float:
+    return swe.julday(d.year, d.month, d.day, 0.0, swe.GREG_CAL)
+
+
+def _kinds(kinds: Optional[str]) -> list:
+    kind_list = [k.strip() for k in (kinds or "").split(",") if k.strip()] or list(ECLIPSE_KINDS)
+    if not set(kind_list) <= set(ECLIPSE_KINDS):
+        raise HTTPException(status_code=400, detail=f"kinds must be among {list(ECLIPSE_KINDS)}")
+    return kind_list
+
+
+def _window(start: date, end: date) -> tuple:
+    jd_start, jd_end = _date_to_jd(start), _date_to_jd(end)
+    if jd_end <= jd_start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if jd_end - jd_start > MAX_WINDOW_YEARS * 365.2425:
+        raise HTTPException(status_code=400, detail=f"Window longer than {MAX_WINDOW_YEARS} years")
+    return jd_start, jd_end
+
+
+@router.get("/ingress")
+def ingress(
+    planet: str,
+    start: date,
+    end: date,
+    kinds: Optional[str] = Query("sign", description="Comma separated: sign,nakshatra,pada"),
+):
+    """Every sign/nakshatra/pada ingress of a planet between two dates (UTC)."""
+    if planet not in PLANET_MOTION:
+        raise HTTPException(status_code=400, detail=f"Unsupported planet: {planet}")
+    kind_list = [k.strip() for k in (kinds or "sign").split(",") if k.strip()]
+    if not kind_list or not set(kind_list) <= set(INGRESS_KINDS):
+        raise HTTPException(status_code=400, detail=f"kinds must be among {list(INGRESS_KINDS)}")
+
+    jd_start, jd_end = _window(start, end)
+    events = find_ingresses(planet, jd_start, jd_end, kind_list)
+    return {"planet": planet, "kinds": kind_list, "count": len(events), "ingresses": events}
+
+
+@router.get("/stations")
+def stations(planet: str, start: date, end: date):
+    """Stationary retrograde/direct moments and retrograde periods (UTC)."""
+    if planet not in STATION_PLANETS:
+        raise HTTPException(status_code=400, detail=f"planet must be one of {STATION_PLANETS}")
+    jd_start, jd_end = _window(start, end)
+    return find_retrograde_periods(planet, jd_start, jd_end)
+
+
+@router.post("/sade-sati")
+def sade_sati(req: ComputeRequest, years: int = Query(100, ge=1, le=120)):
+    """Sade Sati phases and Ashtama Shani periods over a lifetime."""
+    chart = compute_chart(
+        year=req.year,
+        month=req.month,
+        day=req.day,
+        hour=req.hour,
+        minute=req.minute,
+        second=req.second,
+        tz=req.tz,
+        lat=req.lat,
+        lon=req.lon,
+        planets=["Sun", "Moon"],
+        topo_alt=req.topo_alt or 0.0
+    )
+    if not chart.get("moon_sign"):
+        raise HTTPException(status_code=400, detail="Could not determine the natal Moon sign")
+    return compute_saturn_periods(chart["moon_sign"], chart["jd_ut"], years)
+
+
+@router.get("/eclipses")
+def eclipses(
+    start: date,
+    end: date,
+    kinds: Optional[str] = Query(None, description="Comma separated: solar,lunar"),
+):
+    """Solar and lunar eclipses between two dates (1900-2100), with nakshatra."""
+    jd_start, jd_end = _window(start, end)
+    events = eclipses_between(jd_start, jd_end, _kinds(kinds))
+    return {"count": len(events), "eclipses": events}
+
+
+@router.post("/eclipses/natal")
+def eclipses_natal(
+    req: ComputeRequest,
+    orb: float = Query(3.0, gt=0, le=30),
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    kinds: Optional[str] = Query(None, description="Comma separated: solar,lunar"),
+):
+    """Eclipses falling within an orb of each natal planet and the ascendant."""
+    chart = compute_chart(
+        year=req.year,
+        month=req.month,
+        day=req.day,
+        hour=req.hour,
+        minute=req.minute,
+        second=req.second,
+        tz=req.tz,
+        lat=req.lat,
+        lon=req.lon,
+        planets=req.planets,
+        topo_alt=req.topo_alt or 0.0
+    )
+    points = {name: p["lon_sidereal_manual"] for name, p in chart["planets"].items()
+              if "lon_sidereal_manual" in p}
+    points["Ascendant"] = chart["asc_sidereal"]
+    jd_start = _date_to_jd(start) if start else None
+    jd_end = _date_to_jd(end) if end else None
+    return {
+        "orb": orb,
+        "points": points,
+        "eclipses": natal_eclipses(points, orb, jd_start, jd_end, _kinds(kinds)),
+    }
+
+
+@router.post("/gochara")
+def gochara(req: GocharaRequest):
+    """Daily transit houses from the natal Moon and Lagna, with Vedha, as a day x planet matrix."""
+    if req.chart_key:
+        entry = cached_chart(req.chart_key)
+        if entry is None:
+            raise HTTPException(status_code=404, detail="Unknown or expired chart_key")
+        chart = entry[1]
+    elif req.birth is not None:
+        b = req.birth
+        chart = compute_chart(
+            year=b.year,
+            month=b.month,
+            day=b.day,
+            hour=b.hour,
+            minute=b.minute,
+            second=b.second,
+            tz=b.tz,
+            lat=b.lat,
+            lon=b.lon,
+            planets=["Sun", "Moon"],
+            topo_alt=b.topo_alt or 0.0
+        )
+    else:
+        raise HTTPException(status_code=400, detail="Provide chart_key or birth")
+
+    jd_start, jd_end = _date_to_jd(req.start), _date_to_jd(req.end)
+    if not 0 < jd_end - jd_start <= MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"end must be 1 to {MAX_DAYS} days after start")
+    try:
+        return compute_gochara(chart.get("moon_sign") or "", chart["asc_sign"], jd_start, jd_end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,130 @@
+"""
+Sade Sati Module
+Saturn transit periods relative to the natal Moon sign:
+- Sade Sati: Saturn in the 12th, 1st and 2nd sign from the Moon
+  (Rising, Peak and Setting phases)
+- Ashtama Shani: Saturn in the 8th sign from the Moon
+
+All answers come from one shared, retrograde-aware table of Saturn sign
+intervals, built once per process from the ingress engine. The table is
+identical for all 12 Moon signs, so a query is just a scan over it.
+"""
+
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
+
+import swisseph as swe
+
+from backend.calculations import SIGNS, jd_to_datetime, sidereal_position
+from backend.ingress import find_ingresses
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+# Span covered by the shared Saturn table
+TABLE_START_YEAR = 1850
+TABLE_END_YEAR = 2200
+
+# Offset from the Moon sign -> phase name
+SADE_SATI_PHASES = {-1: "Rising", 0: "Peak", 1: "Setting"}
+ASHTAMA_OFFSET = 7  # 8th sign from the Moon
+
+# Saturn needs ~29.5 years to return, so any gap shorter than this between
+# two matching intervals is a retrograde back-and-forth within one period.
+MERGE_GAP_DAYS = 2 * 365.25
+
+
+# ---------------------------
+# SHARED SATURN TABLE
+# ---------------------------
+@lru_cache(maxsize=1)
+def saturn_sign_intervals() -> Tuple[Tuple[float, float, int], ...]:
+    """
+    Saturn's sidereal sign occupancy as (start_jd, end_jd, sign_index) rows,
+    including retrograde re-entries. Built once per process.
+    """
+    jd_start = swe.julday(TABLE_START_YEAR, 1, 1, 0.0, swe.GREG_CAL)
+    jd_end = swe.julday(TABLE_END_YEAR, 1, 1, 0.0, swe.GREG_CAL)
+
+    lon, _ = sidereal_position(jd_start, "Saturn")
+    current_sign = int(lon // 30) % 12
+
+    rows = []
+    cursor = jd_start
+    for ev in find_ingresses("Saturn", jd_start, jd_end, kinds=("sign",)):
+        rows.append((cursor, ev["jd"], current_sign))
+        cursor = ev["jd"]
+        current_sign = SIGNS.index(ev["sign"])
+    rows.append((cursor, jd_end, current_sign))
+    return tuple(rows)
+
+
+# ---------------------------
+# PERIOD CALCULATIONS
+# ---------------------------
+def _period(start_jd: float, end_jd: float, **extra) -> Dict[str, Any]:
+    period = {
+        "start_jd": start_jd,
+        "end_jd": end_jd,
+        "start_date": jd_to_datetime(start_jd).isoformat(),
+        "end_date": jd_to_datetime(end_jd).isoformat(),
+    }
+    period.update(extra)
+    return period
+
+
+def _collect(offsets: Dict[int, str], moon_idx: int, jd_from: float,
+             jd_to: float) -> List[Dict[str, Any]]:
+    """
+    Group Saturn intervals whose sign is at one of `offsets` from the Moon
+    into periods, each listing its phases in time order.
+    """
+    targets = {(moon_idx + off) % 12: name for off, name in offsets.items()}
+    periods: List[Dict[str, Any]] = []
+    for start, end, sign_idx in saturn_sign_intervals():
+        if end <= jd_from or start >= jd_to or sign_idx not in targets:
+            continue
+        start, end = max(start, jd_from), min(end, jd_to)
+        phase = _period(start, end, phase=targets[sign_idx], sign=SIGNS[sign_idx])
+
+        if periods and start - periods[-1]["end_jd"] < MERGE_GAP_DAYS:
+            current = periods[-1]
+            current["end_jd"] = end
+            current["end_date"] = phase["end_date"]
+            current["phases"].append(phase)
+        else:
+            periods.append(_period(start, end, phases=[phase]))
+
+    for p in periods:
+        p["years"] = round((p["end_jd"] - p["start_jd"]) / 365.2425, 2)
+    return periods
+
+
+def compute_saturn_periods(moon_sign: str, jd_birth: float,
+                           years: int = 100) -> Dict[str, Any]:
+    """
+    Sade Sati and Ashtama Shani periods for a natal Moon sign over a lifetime.
+
+    Args:
+        moon_sign: Natal Moon sign (as in compute_chart's "moon_sign")
+        jd_birth: Julian Day of birth (UT)
+        years: Length of the lifetime window
+
+    Returns:
+        Dictionary with Sade Sati cycles (with Rising/Peak/Setting phases,
+        repeated when Saturn retrogrades across a boundary), Ashtama Shani
+        periods, and the cycle running at birth if any.
+    """
+    moon_idx = SIGNS.index(moon_sign)
+    jd_end = jd_birth + years * 365.2425
+
+    sade_sati = _collect(SADE_SATI_PHASES, moon_idx, jd_birth, jd_end)
+    ashtama = _collect({ASHTAMA_OFFSET: "Ashtama"}, moon_idx, jd_birth, jd_end)
+
+    return {
+        "moon_sign": moon_sign,
+        "years": years,
+        "sade_sati": sade_sati,
+        "ashtama_shani": ashtama,
+        "in_sade_sati_at_birth": bool(sade_sati) and sade_sati[0]["start_jd"] <= jd_birth,
+    }
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional
+from datetime import date
 
 class ComputeRequest(BaseModel):
     year: int
@@ -14,6 +15,12 @@ class ComputeRequest(BaseModel):
     planets: Optional[List[str]] = None
     use_topo: Optional[bool] = False
     topo_alt: Optional[float] = 0.0
+    ayanamshas: Optional[List[str]] = None  # e.g. ["lahiri", "raman", "true_citra"]
+    house_systems: Optional[List[str]] = None  # e.g. ["placidus", "sripati", "kp"]
+    kp: Optional[bool] = False  # KP star/sub/sub-sub lords of planets and cusps
+    fixed_stars: Optional[bool] = False  # conjunctions with catalog stars
+    fixed_star_orb: Optional[float] = 1.0
+    fixed_star_max_magnitude: Optional[float] = None
 
 class BirthDetails(BaseModel):
     year: int
@@ -33,6 +40,32 @@ class BirthDetails(BaseModel):
 class MatchRequest(BaseModel):
     boy: BirthDetails
     girl: BirthDetails
+    full_charts: Optional[bool] = False  # also compute and return both full charts
+
+class MatchBulkRequest(BaseModel):
+    person: BirthDetails
+    role: str = "boy"  # the person's side; candidates take the other
+    candidates: List[BirthDetails]
+    breakdown: Optional[bool] = False  # include the per-koota scores
+
+class MatchProfile(BaseModel):
+    id: str
+    moon_longitude: Optional[float] = None  # sidereal (Lahiri), if already known
+    birth: Optional[BirthDetails] = None  # or the birth details
+
+class MatchPoolRequest(BaseModel):
+    profiles: List[MatchProfile]
+    replace: Optional[bool] = False  # drop the pool's existing profiles first
+
+class MatchRankRequest(BaseModel):
+    pool: str
+    person: BirthDetails
+    role: str = "boy"  # the person's side; candidates take the other
+    k: int = 20
+    offset: int = 0
+    min_score: float = 0.0
+    no_nadi_dosha: Optional[bool] = False
+    no_bhakoot_dosha: Optional[bool] = False
 
 class FamilyMemberCreate(BaseModel):
     name: str
@@ -51,3 +84,105 @@ class FamilyMemberResponse(FamilyMemberCreate):
     
     class Config:
         from_attributes = True
+
+
+class MuhurtaRequest(BaseModel):
+    year: int
+    month: int
+    day: int
+    days: int = 30
+    tz: str
+    lat: float
+    lon: float
+    nakshatras: Optional[List[str]] = None
+    paksha: Optional[str] = None  # "Shukla" or "Krishna"
+    tithis: Optional[List[int]] = None  # 1-30
+    exclude_tithis: Optional[List[int]] = None
+    avoid_rikta: bool = False
+    weekdays: Optional[List[str]] = None
+    lagna_signs: Optional[List[str]] = None
+    lagna_type: Optional[str] = None  # "movable", "fixed" or "dual"
+    avoid_kalams: List[str] = ["rahu_kalam"]
+    min_duration_minutes: float = 0.0
+    limit: int = 20
+
+class RectificationRequest(BaseModel):
+    year: int
+    month: int
+    day: int
+    hour: int
+    minute: int = 0
+    second: int = 0
+    tz: str
+    lat: float
+    lon: float
+    window_minutes: int = 120  # scan +/- this many minutes, up to 720
+
+class ChartDelta(BaseModel):
+    minutes: int = 0
+    seconds: int = 0
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+class IncrementalComputeRequest(BaseModel):
+    chart_key: Optional[str] = None  # from a previous /compute response
+    previous: Optional[ComputeRequest] = None  # or the previous request itself
+    delta: ChartDelta
+
+class RelocationGrid(BaseModel):
+    lat_min: float = -60.0
+    lat_max: float = 60.0
+    lon_min: float = -180.0
+    lon_max: float = 180.0
+    step: float = 1.0
+
+class City(BaseModel):
+    name: str
+    lat: float
+    lon: float
+
+class RelocationRequest(BaseModel):
+    year: int
+    month: int
+    day: int
+    hour: int
+    minute: int = 0
+    second: int = 0
+    tz: str
+    planets: Optional[List[str]] = None
+    grid: Optional[RelocationGrid] = None  # either a grid ...
+    cities: Optional[List[City]] = None  # ... or a list of cities
+
+class ReturnPlace(BaseModel):
+    lat: float
+    lon: float
+    tz: Optional[str] = None  # defaults to the birth time zone
+
+class VarshaphalaRequest(BaseModel):
+    year: int
+    month: int
+    day: int
+    hour: int
+    minute: int = 0
+    second: int = 0
+    tz: str
+    lat: float
+    lon: float
+    start_age: int = 0
+    end_age: int = 100
+    place: Optional[ReturnPlace] = None  # residence for the return charts
+    chart_ages: Optional[List[int]] = None  # include full return charts for these ages
+
+class GocharaRequest(BaseModel):
+    chart_key: Optional[str] = None  # from a previous /compute response
+    birth: Optional[ComputeRequest] = None  # or the birth details
+    start: date
+    end: date  # exclusive
+
+class DashaRequest(BaseModel):
+    chart_key: Optional[str] = None  # from a previous /compute response
+    birth: Optional[ComputeRequest] = None  # or the birth details
+    system: str = "vimshottari"  # vimshottari, yogini, ashtottari or chara
+    at: Optional[date] = None  # running periods on this date (default: today)
+    depth: int = 3  # 1 = mahadasha ... 6 = deha
+    years: int = 120  # mahadashas listed from birth
@@ -0,0 +1,170 @@
+"""
+Sky Module
+One process-wide snapshot of the current sky, shared by every request:
+- Sidereal (Lahiri) longitude, speed, sign, nakshatra and pada of the
+  nine grahas
+- Panchang limbs: tithi, karana, nithya yoga and the Moon's nakshatra
+
+A daemon thread rebuilds the snapshot every SKY_REFRESH_SECONDS and swaps a
+single module-level reference, so readers never take a lock. Each new
+snapshot is JSON-encoded once and the same bytes are pushed to every
+streaming subscriber (SSE or WebSocket).
+"""
+
+import asyncio
+import json
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional, Set, Tuple
+
+import swisseph as swe
+
+from backend.calculations import (
+    compute_nakshatra_pada,
+    compute_panchang_sections,
+    deg_to_sign_and_degree,
+    get_ayanamsha,
+    sidereal_position,
+)
+from backend.gochara import GOCHARA_PLANETS
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+SKY_REFRESH_SECONDS = 60.0
+
+# Per-subscriber backlog; a client this far behind only misses old skies
+SUBSCRIBER_QUEUE_SIZE = 4
+
+
+# ---------------------------
+# SNAPSHOT
+# ---------------------------
+def _jd_utc(now: datetime) -> float:
+    return swe.julday(now.year, now.month, now.day,
+                      now.hour + now.minute / 60.0 + (now.second + now.microsecond / 1e6) / 3600.0,
+                      swe.GREG_CAL)
+
+
+def build_snapshot(now: Optional[datetime] = None, version: int = 0) -> Dict[str, Any]:
+    """Positions and panchang for a UTC moment (default: now)."""
+    now = now or datetime.utcnow()
+    jd = _jd_utc(now)
+
+    planets = {}
+    for name in GOCHARA_PLANETS:
+        lon, speed = sidereal_position(jd, name)
+        sign, degree = deg_to_sign_and_degree(lon)
+        nak = compute_nakshatra_pada(lon)
+        planets[name] = {
+            "longitude": lon,
+            "speed": speed,
+            "retrograde": speed < 0,
+            "sign": sign,
+            "degree": degree,
+            "nakshatra": nak["nakshatra"],
+            "nakshatra_index": nak["nakshatra_index"],
+            "pada": nak["pada"],
+        }
+
+    panchang = compute_panchang_sections({
+        name: {"lon_sidereal_manual": planets[name]["longitude"]} for name in ("Sun", "Moon")
+    })
+    snapshot = {
+        "version": version,
+        "utc": now.isoformat() + "Z",
+        "jd_ut": jd,
+        "ayanamsha_deg": get_ayanamsha(jd),
+        "refresh_seconds": SKY_REFRESH_SECONDS,
+        "planets": planets,
+        **panchang,
+    }
+    # Encoded once for every reader and subscriber
+    text = json.dumps(snapshot)
+    snapshot["text"] = text
+    snapshot["body"] = text.encode("utf-8")
+    snapshot["sse"] = b"event: sky\ndata: " + snapshot["body"] + b"\n\n"
+    return snapshot
+
+
+# Replaced wholesale by the refresher; never mutated after publication
+_snapshot: Optional[Dict[str, Any]] = None
+_build_lock = threading.Lock()
+
+
+def current_sky() -> Dict[str, Any]:
+    """
+    The latest snapshot. Lock-free: it reads one reference that the
+    refresher swaps atomically. The dict is shared and must not be mutated.
+    """
+    snap = _snapshot
+    if snap is None:
+        # First read before the refresher ran
+        with _build_lock:
+            if _snapshot is None:
+                _publish(build_snapshot())
+            snap = _snapshot
+    return snap
+
+
+# ---------------------------
+# BROADCAST
+# ---------------------------
+# Subscribers are (event loop, queue) pairs; the refresher thread hands each
+# queue the same snapshot (with its encoded forms) through its loop
+_subscribers: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = set()
+_subscribers_lock = threading.Lock()
+
+
+def subscribe() -> Tuple[asyncio.AbstractEventLoop, asyncio.Queue]:
+    """Register the calling coroutine's loop for snapshot pushes."""
+    sub = (asyncio.get_running_loop(), asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE))
+    with _subscribers_lock:
+        _subscribers.add(sub)
+    return sub
+
+
+def unsubscribe(sub: Tuple[asyncio.AbstractEventLoop, asyncio.Queue]) -> None:
+    with _subscribers_lock:
+        _subscribers.discard(sub)
+
+
+def _offer(queue: asyncio.Queue, snapshot: Dict[str, Any]) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(snapshot)
+
+
+def _publish(snapshot: Dict[str, Any]) -> None:
+    global _snapshot
+    _snapshot = snapshot
+    with _subscribers_lock:
+        subscribers = list(_subscribers)
+    for loop, queue in subscribers:
+        try:
+            loop.call_soon_threadsafe(_offer, queue, snapshot)
+        except RuntimeError:
+            # Loop already closed; the subscriber is gone
+            unsubscribe((loop, queue))
+
+
+# ---------------------------
+# REFRESHER
+# ---------------------------
+def _refresh_loop(stop: threading.Event) -> None:
+    version = 0
+    while not stop.is_set():
+        version += 1
+        try:
+            with _build_lock:
+                _publish(build_snapshot(version=version))
+        except Exception as e:
+            print(f"Sky snapshot refresh failed: {e}")
+        stop.wait(SKY_REFRESH_SECONDS)
+
+
+def start_sky_refresher() -> threading.Event:
+    """Start the refresher thread; set the returned event to stop it."""
+    stop = threading.Event()
+    threading.Thread(target=_refresh_loop, args=(stop,), name="sky-refresh", daemon=True).start()
+    return stop
@@ -0,0 +1,197 @@
+"""
+Stations Module
+Finds stationary-retrograde and stationary-direct moments for Mercury-Saturn:
+- Coarse scan of the longitude speed with the ingress step sizes
+- Each speed sign change is refined with Brent's method (speed = 0)
+- Retrograde intervals are built from consecutive SR/SD stations
+
+Stations are the same for everyone, so they are computed in fixed-size
+blocks of time and cached per (planet, block); any date range is stitched
+together from the shared blocks.
+"""
+
+import math
+from functools import lru_cache
+from typing import Dict, Any, List, Callable, Optional, Tuple
+
+from backend.calculations import (
+    compute_nakshatra_pada,
+    deg_to_sign_and_degree,
+    jd_to_datetime,
+    sidereal_position,
+)
+from backend.ingress import PLANET_MOTION
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+STATION_PLANETS = ["Mercury", "Venus", "Mars", "Jupiter", "Saturn"]
+
+# Cache blocks: one (planet, block) entry covers BLOCK_DAYS starting at
+# BLOCK_EPOCH + k * BLOCK_DAYS. A year is longer than any retrograde period.
+BLOCK_EPOCH = 2451545.0  # J2000
+BLOCK_DAYS = 365.25
+
+# Refinement tolerance in days (~1 second)
+STATION_TOLERANCE = 1e-5
+
+STATION_RETROGRADE = "stationary_retrograde"
+STATION_DIRECT = "stationary_direct"
+
+
+# ---------------------------
+# ROOT FINDING
+# ---------------------------
+def brent_root(f: Callable[[float], float], a: float, b: float,
+               fa: float, fb: float, tol: float = STATION_TOLERANCE,
+               max_iter: int = 100) -> float:
+    """
+    Brent's method: root of f on [a, b] given f(a) and f(b) of opposite sign.
+    Combines bisection, secant and inverse quadratic interpolation.
+    """
+    if fa == 0.0:
+        return a
+    if fb == 0.0:
+        return b
+    if (fa < 0) == (fb < 0):
+        raise ValueError("Root is not bracketed")
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(max_iter):
+        if (fb < 0) == (fc < 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2.0 * 1e-15 * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0.0:
+            return b
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p = 2.0 * xm * s
+                q = 1.0 - s
+            else:
+                # Inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * xm * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * xm * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, xm)
+        fb = f(b)
+    return b
+
+
+# ---------------------------
+# STATION SEARCH
+# ---------------------------
+def _station_event(planet: str, jd: float, kind: str) -> Dict[str, Any]:
+    lon, _ = sidereal_position(jd, planet)
+    sign, deg = deg_to_sign_and_degree(lon)
+    nak = compute_nakshatra_pada(lon)
+    return {
+        "planet": planet,
+        "type": kind,
+        "jd": jd,
+        "utc": jd_to_datetime(jd).isoformat(),
+        "longitude": lon,
+        "sign": sign,
+        "degree_in_sign": deg,
+        "nakshatra": nak["nakshatra"],
+        "pada": nak["pada"],
+    }
+
+
+def scan_stations(planet: str, jd_start: float, jd_end: float) -> List[Dict[str, Any]]:
+    """Find all stations of a planet in [jd_start, jd_end) without caching."""
+    step = PLANET_MOTION[planet]["step"]
+
+    def speed(t: float) -> float:
+        return sidereal_position(t, planet)[1]
+
+    stations = []
+    t0 = jd_start
+    s0 = speed(t0)
+    while t0 < jd_end:
+        t1 = min(t0 + step, jd_end)
+        s1 = speed(t1)
+        if (s0 < 0) != (s1 < 0):
+            jd = brent_root(speed, t0, t1, s0, s1)
+            kind = STATION_RETROGRADE if s0 >= 0 else STATION_DIRECT
+            stations.append(_station_event(planet, jd, kind))
+        t0, s0 = t1, s1
+    return stations
+
+
+@lru_cache(maxsize=4096)
+def _stations_block(planet: str, block: int) -> Tuple[Dict[str, Any], ...]:
+    start = BLOCK_EPOCH + block * BLOCK_DAYS
+    return tuple(scan_stations(planet, start, start + BLOCK_DAYS))
+
+
+def find_stations(planet: str, jd_start: float, jd_end: float) -> List[Dict[str, Any]]:
+    """
+    Stations of a planet between two Julian Days, served from shared
+    per-block caches. Returned dicts are shared and must not be mutated.
+    """
+    if planet not in STATION_PLANETS:
+        raise ValueError(f"Stations are only defined for {STATION_PLANETS}")
+    first = math.floor((jd_start - BLOCK_EPOCH) / BLOCK_DAYS)
+    last = math.floor((jd_end - BLOCK_EPOCH) / BLOCK_DAYS)
+    result = []
+    for block in range(first, last + 1):
+        result.extend(s for s in _stations_block(planet, block)
+                      if jd_start <= s["jd"] < jd_end)
+    return result
+
+
+def find_retrograde_periods(planet: str, jd_start: float, jd_end: float) -> Dict[str, Any]:
+    """
+    Retrograde intervals of a planet overlapping [jd_start, jd_end).
+    Periods already running at jd_start (or still running at jd_end) are
+    completed from the neighbouring blocks, so every interval has both stations.
+    """
+    # One block of margin covers any retrograde period (Saturn's is ~140 days)
+    stations = find_stations(planet, jd_start - BLOCK_DAYS, jd_end + BLOCK_DAYS)
+
+    periods = []
+    pending: Optional[Dict[str, Any]] = None
+    for st in stations:
+        if st["type"] == STATION_RETROGRADE:
+            pending = st
+        elif pending is not None:
+            if pending["jd"] < jd_end and st["jd"] > jd_start:
+                periods.append({
+                    "planet": planet,
+                    "start_jd": pending["jd"],
+                    "end_jd": st["jd"],
+                    "start_utc": pending["utc"],
+                    "end_utc": st["utc"],
+                    "days": round(st["jd"] - pending["jd"], 4),
+                    "station_retrograde": pending,
+                    "station_direct": st,
+                })
+            pending = None
+
+    return {
+        "planet": planet,
+        "stations": [s for s in stations if jd_start <= s["jd"] < jd_end],
+        "retrograde_periods": periods,
+    }
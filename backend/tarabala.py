@@ -0,0 +1,175 @@
+"""
+Tarabala Module
+Daily Tarabala and Chandrabala for every natal nakshatra and Moon sign:
+- Tarabala: count from the natal nakshatra to the transit Moon's
+  nakshatra, reduced to one of the 9 taras (Janma ... Parama Mitra)
+- Chandrabala: house of the transit Moon from the natal Moon sign
+
+Both depend only on the transiting Moon, so a local day has at most 27 + 12
+distinct answers for the whole user base. They are built once per
+(date, time zone) with the Moon's nakshatra/sign transition times, and a
+user's day quality is then a lookup by nakshatra_index and Moon sign.
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
+
+from backend.calculations import (
+    NAKSHATRA_NAMES,
+    SIGNS,
+    jd_to_local_datetime,
+    local_midnight_jd,
+    sidereal_position,
+)
+from backend.ingress import NAKSHATRA_SIZE, SIGN_SIZE, label_segments
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+TARA_NAMES = ["Janma", "Sampat", "Vipat", "Kshema", "Pratyak",
+              "Sadhana", "Naidhana", "Mitra", "Parama Mitra"]
+TARA_QUALITY = {
+    "Janma": "Neutral", "Sampat": "Good", "Vipat": "Bad", "Kshema": "Good",
+    "Pratyak": "Bad", "Sadhana": "Good", "Naidhana": "Bad", "Mitra": "Good",
+    "Parama Mitra": "Good",
+}
+
+# House of the transit Moon from the natal Moon -> quality
+CHANDRABALA_GOOD = {1, 3, 6, 7, 10, 11}
+CHANDRABALA_BAD = {4, 8, 12}
+
+# The Moon moves < 16 deg a day, so a quarter-day step never skips a boundary
+MOON_STEP = 0.25
+
+DAY_CACHE_SIZE = 2048
+
+
+# ---------------------------
+# HELPER FUNCTIONS
+# ---------------------------
+def tara_of(natal_index: int, transit_index: int) -> int:
+    """Tara number 1-9 of a transit nakshatra counted from the natal one."""
+    return (transit_index - natal_index) % 27 % 9 + 1
+
+
+def chandrabala_quality(house: int) -> str:
+    if house in CHANDRABALA_GOOD:
+        return "Good"
+    if house in CHANDRABALA_BAD:
+        return "Bad"
+    return "Neutral"
+
+
+def _prevailing(segments: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """The segment covering most of the day."""
+    return max(segments, key=lambda s: s["end_jd"] - s["start_jd"])
+
+
+def _moon(t: float) -> Tuple[float, float]:
+    return sidereal_position(t, "Moon")
+
+
+# ---------------------------
+# SHARED DAY TABLE
+# ---------------------------
+@lru_cache(maxsize=DAY_CACHE_SIZE)
+def daily_table(year: int, month: int, day: int, tz_name: str) -> Dict[str, Any]:
+    """
+    Tarabala for all 27 natal nakshatras and Chandrabala for all 12 natal
+    Moon signs over a local civil day. Cached; the returned dict is shared
+    between callers and must not be mutated.
+    """
+    jd_start = local_midnight_jd(year, month, day, tz_name)
+    nxt = date(year, month, day) + timedelta(days=1)
+    jd_end = local_midnight_jd(nxt.year, nxt.month, nxt.day, tz_name)
+
+    def local(t: float) -> str:
+        return jd_to_local_datetime(t, tz_name).isoformat()
+
+    nak_rows = label_segments(_moon, NAKSHATRA_SIZE, jd_start, jd_end, MOON_STEP)
+    sign_rows = label_segments(_moon, SIGN_SIZE, jd_start, jd_end, MOON_STEP)
+
+    tarabala = []
+    for natal in range(27):
+        segments = []
+        for a, b, idx in nak_rows:
+            tara = tara_of(natal, idx)
+            name = TARA_NAMES[tara - 1]
+            segments.append({
+                "start_jd": a, "end_jd": b, "start": local(a), "end": local(b),
+                "moon_nakshatra": NAKSHATRA_NAMES[idx],
+                "tara": tara, "name": name, "quality": TARA_QUALITY[name],
+            })
+        tarabala.append(segments)
+
+    chandrabala = []
+    for natal in range(12):
+        segments = []
+        for a, b, idx in sign_rows:
+            house = (idx - natal) % 12 + 1
+            segments.append({
+                "start_jd": a, "end_jd": b, "start": local(a), "end": local(b),
+                "moon_sign": SIGNS[idx],
+                "house": house, "quality": chandrabala_quality(house),
+            })
+        chandrabala.append(segments)
+
+    return {
+        "date": date(year, month, day).isoformat(),
+        "tz": tz_name,
+        "start_jd": jd_start,
+        "end_jd": jd_end,
+        "moon_transitions": {
+            "nakshatra": [{"jd": a, "time": local(a), "nakshatra": NAKSHATRA_NAMES[idx]}
+                          for a, _, idx in nak_rows[1:]],
+            "sign": [{"jd": a, "time": local(a), "sign": SIGNS[idx]}
+                     for a, _, idx in sign_rows[1:]],
+        },
+        "tarabala": tarabala,
+        "chandrabala": chandrabala,
+    }
+
+
+def precompute_daily_tables(start: date, days: int, tz_name: str) -> int:
+    """Warm the shared tables for `days` local days from `start`; returns the count built."""
+    for i in range(days):
+        d = start + timedelta(days=i)
+        daily_table(d.year, d.month, d.day, tz_name)
+    return days
+
+
+# ---------------------------
+# LOOKUP
+# ---------------------------
+def day_quality(year: int, month: int, day: int, tz_name: str,
+                nakshatra_index: int, moon_sign: str) -> Dict[str, Any]:
+    """
+    Tarabala and Chandrabala of one natal chart for a local day, read from
+    the shared table. `nakshatra_index` is compute_nakshatra_pada's.
+    """
+    if not 0 <= nakshatra_index < 27:
+        raise ValueError("nakshatra_index must be between 0 and 26")
+    if moon_sign not in SIGNS:
+        raise ValueError(f"Unknown Moon sign: {moon_sign}")
+
+    table = daily_table(year, month, day, tz_name)
+    tara = table["tarabala"][nakshatra_index]
+    chandra = table["chandrabala"][SIGNS.index(moon_sign)]
+    qualities = {_prevailing(tara)["quality"], _prevailing(chandra)["quality"]}
+    if "Bad" in qualities:
+        overall = "Bad"
+    elif qualities == {"Good"}:
+        overall = "Good"
+    else:
+        overall = "Neutral"
+
+    return {
+        "date": table["date"],
+        "tz": tz_name,
+        "natal_nakshatra": NAKSHATRA_NAMES[nakshatra_index],
+        "natal_moon_sign": moon_sign,
+        "tarabala": tara,
+        "chandrabala": chandra,
+        "day_quality": overall,
+    }
@@ -0,0 +1,200 @@
+"""
+Varshaphala Module
+Tajika annual charts from sidereal solar returns:
+- Exact moment the sidereal (Lahiri) Sun returns to its natal longitude,
+  solved for a whole span of years with Newton iteration on the Sun's
+  longitude and speed (each year seeded from the previous return)
+- Varsha lagna, Muntha and the five office bearers (Panchadhikari)
+- Year lord (Varsheshwara)
+
+The table only needs the Sun, Moon and ascendant per year plus the few
+office-bearer planets, so 100 years cost a few hundred ephemeris calls.
+Full return charts go through compute_chart and are cached.
+"""
+
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+
+from backend.calculations import (
+    SIGNS,
+    SIGN_LORDS_MAP,
+    compute_chart,
+    is_debilitated,
+    is_exalted,
+    jd_to_local_datetime,
+    sidereal_position,
+    to_utc_julian_day,
+)
+from backend.lagna import ascendant_position
+
+# ---------------------------
+# CONSTANTS
+# ---------------------------
+SIDEREAL_YEAR = 365.256363  # days
+MAX_AGE = 120
+
+# Newton stops below this residual (deg, ~0.0004") or after MAX_ITERATIONS
+RETURN_TOLERANCE = 1e-7
+MAX_ITERATIONS = 10
+
+# Tri-rashi lords by varsha lagna sign: (day return, night return)
+TRI_RASHI_LORDS = {
+    "Aries": ("Sun", "Jupiter"),
+    "Taurus": ("Venus", "Moon"),
+    "Gemini": ("Saturn", "Mercury"),
+    "Cancer": ("Venus", "Mars"),
+    "Leo": ("Jupiter", "Sun"),
+    "Virgo": ("Moon", "Venus"),
+    "Libra": ("Mercury", "Saturn"),
+    "Scorpio": ("Mars", "Venus"),
+    "Sagittarius": ("Saturn", "Saturn"),
+    "Capricorn": ("Mars", "Mars"),
+    "Aquarius": ("Jupiter", "Jupiter"),
+    "Pisces": ("Moon", "Moon"),
+}
+
+# Houses from the lagna that a Tajika aspect reaches (2, 6, 8, 12 do not)
+TAJIKA_ASPECT_HOUSES = {1, 3, 4, 5, 7, 9, 10, 11}
+
+RETURN_CHART_CACHE_SIZE = 512
+
+
+# ---------------------------
+# HELPER FUNCTIONS
+# ---------------------------
+def solve_solar_return(target_lon: float, jd_guess: float) -> float:
+    """JD (UT) near jd_guess when the sidereal Sun is at target_lon."""
+    t = jd_guess
+    for _ in range(MAX_ITERATIONS):
+        lon, speed = sidereal_position(t, "Sun")
+        diff = (lon - target_lon + 180.0) % 360.0 - 180.0
+        if abs(diff) < RETURN_TOLERANCE:
+            break
+        t -= diff / speed
+    return t
+
+
+def _dignity(planet: str, sign: str) -> int:
+    """Simple rank used to pick the year lord: exalted > own > other > debilitated."""
+    if is_exalted(planet, sign):
+        return 3
+    if SIGN_LORDS_MAP[sign] == planet:
+        return 2
+    if is_debilitated(planet, sign):
+        return 0
+    return 1
+
+
+@lru_cache(maxsize=RETURN_CHART_CACHE_SIZE)
+def return_chart(year: int, month: int, day: int, hour: int, minute: int, second: int,
+                 tz: str, lat: float, lon: float) -> Dict[str, Any]:
+    """
+    Full compute_chart for a return moment. Cached; the returned dict is
+    shared between callers and must not be mutated.
+    """
+    return compute_chart(year, month, day, hour, minute, second, tz, lat, lon)
+
+
+# ---------------------------
+# MAIN FUNCTION
+# ---------------------------
+def compute_varshaphala(year: int, month: int, day: int, hour: int, minute: int,
+                        second: int, tz: str, lat: float, lon: float,
+                        start_age: int = 0, end_age: int = 100,
+                        place: Optional[Dict[str, Any]] = None,
+                        chart_ages: Optional[List[int]] = None) -> Dict[str, Any]:
+    """
+    Solar return table for ages start_age..end_age (inclusive).
+
+    Args:
+        place: Optional {"lat", "lon", "tz"} of residence for the return
+            charts; defaults to the birth place
+        chart_ages: Ages for which the full return chart is included
+
+    Returns:
+        Dictionary with the natal Sun/ascendant and one row per year: return
+        moment, varsha lagna, Muntha, office bearers and year lord.
+    """
+    if not 0 <= start_age <= end_age <= MAX_AGE:
+        raise ValueError(f"Ages must satisfy 0 <= start_age <= end_age <= {MAX_AGE}")
+    chart_ages = set(chart_ages or [])
+    if any(a < start_age or a > end_age for a in chart_ages):
+        raise ValueError("chart_ages must lie within start_age..end_age")
+
+    place = place or {}
+    r_lat = place.get("lat", lat)
+    r_lon = place.get("lon", lon)
+    r_tz = place.get("tz") or tz
+
+    jd_birth, _ = to_utc_julian_day(year, month, day, hour, minute, second, tz)
+    natal_sun, _ = sidereal_position(jd_birth, "Sun")
+    natal_asc, _ = ascendant_position(lat, lon)(jd_birth)
+    natal_asc_sign = int(natal_asc // 30) % 12
+    janma_lagna_lord = SIGN_LORDS_MAP[SIGNS[natal_asc_sign]]
+    asc_at = ascendant_position(r_lat, r_lon)
+
+    rows = []
+    prev = jd_birth + (start_age - 1) * SIDEREAL_YEAR
+    for age in range(start_age, end_age + 1):
+        jd = jd_birth if age == 0 else solve_solar_return(natal_sun, prev + SIDEREAL_YEAR)
+        prev = jd
+
+        asc, _ = asc_at(jd)
+        lagna_idx = int(asc // 30) % 12
+        lagna = SIGNS[lagna_idx]
+        moon, _ = sidereal_position(jd, "Moon")
+        # Sun above the horizon: in the half of the zodiac from the
+        # descendant up through the MC to the ascendant
+        day_return = (natal_sun - asc) % 360.0 > 180.0
+        day_lord_sign = SIGNS[int((natal_sun if day_return else moon) // 30) % 12]
+
+        muntha_idx = (natal_asc_sign + age) % 12
+        officers = {
+            "muntha_lord": SIGN_LORDS_MAP[SIGNS[muntha_idx]],
+            "janma_lagna_lord": janma_lagna_lord,
+            "varsha_lagna_lord": SIGN_LORDS_MAP[lagna],
+            "tri_rashi_lord": TRI_RASHI_LORDS[lagna][0 if day_return else 1],
+            "din_ratri_lord": SIGN_LORDS_MAP[day_lord_sign],
+        }
+
+        # Year lord: the strongest office bearer aspecting the varsha lagna
+        # (Tajika aspects); the Muntha lord when none does
+        signs = {"Sun": natal_sun, "Moon": moon}
+        candidates = []
+        for rank, planet in enumerate(officers.values()):
+            if planet not in signs:
+                signs[planet], _ = sidereal_position(jd, planet)
+            sign_idx = int(signs[planet] // 30) % 12
+            if (sign_idx - lagna_idx) % 12 + 1 in TAJIKA_ASPECT_HOUSES:
+                candidates.append((-_dignity(planet, SIGNS[sign_idx]), rank, planet))
+        year_lord = min(candidates)[2] if candidates else officers["muntha_lord"]
+
+        local = jd_to_local_datetime(jd, r_tz)
+        row = {
+            "age": age,
+            "jd": jd,
+            "time": local.isoformat(),
+            "varsha_lagna": {"sign": lagna, "degree": asc % 30.0},
+            "moon_sign": SIGNS[int(moon // 30) % 12],
+            "day_return": day_return,
+            "muntha": {
+                "sign": SIGNS[muntha_idx],
+                "house": (muntha_idx - lagna_idx) % 12 + 1,
+                "lord": officers["muntha_lord"],
+            },
+            "office_bearers": officers,
+            "year_lord": year_lord,
+        }
+        if age in chart_ages:
+            local = jd_to_local_datetime(jd + 0.5 / 86400.0, r_tz)
+            row["chart"] = return_chart(local.year, local.month, local.day, local.hour,
+                                        local.minute, local.second, r_tz, r_lat, r_lon)
+        rows.append(row)
+
+    return {
+        "jd_birth": jd_birth,
+        "natal_sun": natal_sun,
+        "natal_asc_sign": SIGNS[natal_asc_sign],
+        "place": {"lat": r_lat, "lon": r_lon, "tz": r_tz},
+        "years": rows,
+    }